@@ -1,11 +1,23 @@
 import azure.functions as func
+import importlib.util
 import logging
 import os
 import sys
+import time
 from datetime import datetime, timezone
 
-# Add scraper modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'scraper_modules'))
+# The scraper is the ieso_scraper package (azure_live_scraper/), installed into
+# .python_packages on deploy; a local checkout falls back to the source tree
+if importlib.util.find_spec('ieso_scraper') is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+
+# Import cost is only reported for the first invocation in a worker
+WORKER_STARTED = time.perf_counter()
+_cold_start = True
+
+# Stay well inside the Functions execution limit (5 min by default on Consumption)
+DEADLINE_SECONDS = float(os.environ.get('SCRAPER_DEADLINE_SECONDS', '240'))
+PARALLEL_DATASETS = os.environ.get('SCRAPER_PARALLEL', 'true').lower() == 'true'
 
 def main(mytimer: func.TimerRequest) -> None:
     """
@@ -13,33 +25,47 @@ def main(mytimer: func.TimerRequest) -> None:
     Runs daily to scrape IESO data
     """
     
+    global _cold_start
     utc_timestamp = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
     
-    logging.info(f'🚀 IESO Data Scraper started at {utc_timestamp}')
+    logging.info(f'🚀 IESO Data Scraper started at {utc_timestamp}{" (cold start)" if _cold_start else ""}')
     
     try:
-        # Import our scraper (after path is set)
-        from all_datasets_gap_filler import run_all_gap_fillers
+        # Import our scraper; the gap filler engine loads when the first dataset runs
+        from ieso_scraper.startup_profiler import timed_import, format_import_times
+        run_all_gap_fillers = timed_import('ieso_scraper.runner').run_all_gap_fillers
+        from ieso_scraper.rate_limiter import rate_limiter_stats
+        
+        if _cold_start:
+            logging.info(f'🧊 Scraper modules ready {time.perf_counter() - WORKER_STARTED:.2f}s after worker load')
         
         # Run the scraper
-        logging.info('📊 Starting comprehensive gap filling...')
-        results = run_all_gap_fillers()
+        logging.info(f'📊 Starting comprehensive gap filling (parallel={PARALLEL_DATASETS}, deadline={DEADLINE_SECONDS:.0f}s)...')
+        results = run_all_gap_fillers(parallel=PARALLEL_DATASETS, deadline_seconds=DEADLINE_SECONDS)
         
         # Log results
         total_files = sum(r['files_processed'] for r in results.values())
         success_count = sum(1 for r in results.values() if r['status'] == 'success')
         
-        logging.info(f'✅ Scraper completed: {total_files} files, {success_count}/5 datasets successful')
+        logging.info(f'✅ Scraper completed: {total_files} files, {success_count}/{len(results)} datasets successful')
         
         # Log any errors
         for dataset, result in results.items():
-            if result['status'] == 'error':
-                logging.error(f'❌ {dataset} failed: {result["error"]}')
+            if result['status'] != 'success':
+                logging.error(f'❌ {dataset} {result["status"]}: {result["error"]}')
             else:
-                logging.info(f'✅ {dataset}: {result["files_processed"]} files processed')
+                logging.info(f'✅ {dataset}: {result["files_processed"]} files processed in {result["elapsed_seconds"]}s')
+        
+        for host, stats in rate_limiter_stats().items():
+            logging.info(f'🚦 {host}: {stats}')
+        
+        if _cold_start:
+            logging.info(format_import_times())
         
     except Exception as e:
         logging.error(f'💥 Fatal error in scraper: {str(e)}')
         raise
+    finally:
+        _cold_start = False
     
     logging.info('🎉 IESO Data Scraper completed successfully')
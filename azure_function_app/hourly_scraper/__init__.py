@@ -0,0 +1,69 @@
+import azure.functions as func
+import importlib.util
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+# The scraper is the ieso_scraper package (azure_live_scraper/), installed into
+# .python_packages on deploy; a local checkout falls back to the source tree
+if importlib.util.find_spec('ieso_scraper') is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+
+WORKER_STARTED = time.perf_counter()
+_cold_start = True
+
+# Hourly runs only touch the newest hours, so keep them short
+DEADLINE_SECONDS = float(os.environ.get('SCRAPER_HOURLY_DEADLINE_SECONDS', '120'))
+# Poll every dataset just after its learned publication time instead of every hour;
+# bind the timer to a short interval (e.g. every 5 minutes) when enabled
+SCHEDULED_POLLING = os.environ.get('SCRAPER_SCHEDULED_POLLING', 'false').lower() == 'true'
+
+def main(mytimer: func.TimerRequest) -> None:
+    """
+    Hourly Azure Function entry point
+    Keeps real-time EnergyLMP and IntertieLMP within an hour of IESO publication
+    """
+
+    global _cold_start
+    utc_timestamp = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
+
+    logging.info(f'🚀 IESO hourly scraper started at {utc_timestamp}{" (cold start)" if _cold_start else ""}')
+
+    try:
+        # Import our scraper; the gap filler engine loads when the first dataset runs
+        from ieso_scraper.startup_profiler import timed_import, format_import_times
+        run_all_gap_fillers = timed_import('ieso_scraper.runner').run_all_gap_fillers
+        from ieso_scraper.rate_limiter import rate_limiter_stats
+
+        if _cold_start:
+            logging.info(f'🧊 Scraper modules ready {time.perf_counter() - WORKER_STARTED:.2f}s after worker load')
+
+        if SCHEDULED_POLLING:
+            results = run_all_gap_fillers(parallel=True, deadline_seconds=DEADLINE_SECONDS, scheduled=True)
+        else:
+            results = run_all_gap_fillers(parallel=True, deadline_seconds=DEADLINE_SECONDS, hourly=True)
+
+        total_files = sum(r['files_processed'] for r in results.values())
+        logging.info(f'✅ Hourly scraper completed: {total_files} files')
+
+        for dataset, result in results.items():
+            if result['status'] == 'skipped':
+                logging.info(f'⏭️ {dataset}: not due until {result["next_poll"]} (IESO time)')
+            elif result['status'] != 'success':
+                logging.error(f'❌ {dataset} {result["status"]}: {result["error"]}')
+            else:
+                logging.info(f'✅ {dataset}: {result["files_processed"]} files processed in {result["elapsed_seconds"]}s')
+
+        for host, stats in rate_limiter_stats().items():
+            logging.info(f'🚦 {host}: {stats}')
+
+        if _cold_start:
+            logging.info(format_import_times())
+
+    except Exception as e:
+        logging.error(f'💥 Fatal error in hourly scraper: {str(e)}')
+        raise
+    finally:
+        _cold_start = False
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+IntertieLMP Cleaner Benchmark
+Compares the streaming XMLPullParser cleaner in azure_push_clean/intertielmp_push_clean.py
+with the old ElementTree + per-record dict implementation, over hourly report files
+(real ones passed on the command line, or a synthesized month)
+
+Examples:
+    python bench_intertie_cleaner.py                          # 30 synthesized days
+    python bench_intertie_cleaner.py ~/Azure_backfill/PUB_RealTimeIntertieLMP_*.xml
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BENCH_DIR))
+sys.path.append(os.path.join(REPO_ROOT, 'azure_push_clean'))
+
+from intertielmp_push_clean import process_intertie_xml, parse_intertie_name
+from mock_ieso import intertie_lmp_xml
+
+def legacy_process(xml_data):
+    """Previous process_intertie_xml logic (full tree, findall per intertie, one dict per record)"""
+    root = ET.fromstring(xml_data)
+    namespace = {'ns': 'http://www.ieso.ca/schema'}
+
+    base_date = root.find('.//ns:DeliveryDate', namespace).text
+    base_hour = int(root.find('.//ns:DeliveryHour', namespace).text)
+
+    records = []
+    for intertie in root.findall('.//ns:IntertieLMPrice', namespace):
+        intertie_name_elem = intertie.find('.//ns:IntertiePLName', namespace)
+        if intertie_name_elem is None:
+            continue
+        intertie_name = intertie_name_elem.text
+        name_parts = parse_intertie_name(intertie_name)
+
+        interval_counter = 0
+        for interval in intertie.findall('.//ns:IntervalLMP', namespace):
+            interval_num = interval.find('ns:Interval', namespace)
+            lmp = interval.find('ns:LMP', namespace)
+            flag = interval.find('ns:Flag', namespace)
+
+            if interval_num is not None and lmp is not None:
+                interval_val = int(interval_num.text)
+                interval_set = interval_counter // 12
+                target_hour = base_hour - (4 - interval_set)
+                # Raises for delivery hours 1-3 and 24 (hour outside 0-23)
+                base_datetime = datetime.strptime(f"{base_date} {target_hour:02d}:00:00", "%Y-%m-%d %H:%M:%S")
+                records.append({
+                    'timestamp': base_datetime + timedelta(minutes=(interval_val - 1) * 5),
+                    'intertie_name': intertie_name,
+                    'location': name_parts['location'],
+                    'connection': name_parts['connection'],
+                    'code': name_parts['code'],
+                    'interval_set': interval_set,
+                    'interval': interval_val,
+                    'lmp_value': float(lmp.text),
+                    'flag': flag.text if flag is not None else ""
+                })
+                interval_counter += 1
+
+    df = pd.DataFrame(records)
+    return df.sort_values(['timestamp', 'intertie_name']).reset_index(drop=True)
+
+def to_csv(df) -> bytes:
+    return df.to_csv(index=False).encode()
+
+def load_files(paths, days: int):
+    """[(name, bytes)] of real files, or a month of synthesized hourly reports"""
+    if paths:
+        files = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                files.append((os.path.basename(path), f.read()))
+        return files
+
+    start = datetime(2025, 5, 1)
+    return [(f"PUB_RealTimeIntertieLMP_{start + timedelta(days=d):%Y%m%d}{hour:02d}.xml",
+             intertie_lmp_xml(start + timedelta(days=d), hour))
+            for d in range(days) for hour in range(1, 25)]
+
+def run(process, files):
+    """Clean every file one at a time, returning (seconds, {name: csv or error})"""
+    outputs = {}
+    started = time.perf_counter()
+    for name, data in files:
+        try:
+            outputs[name] = to_csv(process(data))
+        except Exception as e:
+            outputs[name] = e
+    return time.perf_counter() - started, outputs
+
+def peak_memory(process, files) -> int:
+    """Peak traced bytes while parsing the files one at a time (timed separately: tracing is slow)"""
+    tracemalloc.start()
+    for _, data in files:
+        try:
+            process(data)
+        except Exception:
+            pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark IntertieLMP XML cleaning")
+    parser.add_argument('files', nargs='*', help="IntertieLMP XML files (default: synthesized hourly reports)")
+    parser.add_argument('--days', type=int, default=30, help="Days of synthesized hourly reports")
+    parser.add_argument('--chunk-kb', type=int, default=64, help="Chunk size fed to the streaming parser")
+    parser.add_argument('--memory-files', type=int, default=48, help="Files parsed under tracemalloc")
+    args = parser.parse_args()
+
+    files = load_files(args.files, args.days)
+    total_mb = sum(len(data) for _, data in files) / 1024 / 1024
+    print(f"🏁 IntertieLMP cleaner benchmark: {len(files)} files, {total_mb:.1f} MB")
+
+    # Feed the streaming cleaner in chunks, as the blob download does
+    chunk = args.chunk_kb * 1024
+    streaming = lambda data: process_intertie_xml(data[i:i + chunk] for i in range(0, len(data), chunk))
+
+    fast_time, fast_out = run(streaming, files)
+    fast_peak = peak_memory(streaming, files[:args.memory_files])
+    print(f"   ⚡ streaming parser: {fast_time:8.2f} s  {len(files) / fast_time:8.1f} files/s  "
+          f"peak {fast_peak / 1024 / 1024:6.2f} MB")
+
+    legacy_time, legacy_out = run(legacy_process, files)
+    legacy_peak = peak_memory(legacy_process, files[:args.memory_files])
+    print(f"   🐢 ElementTree     : {legacy_time:8.2f} s  {len(files) / legacy_time:8.1f} files/s  "
+          f"peak {legacy_peak / 1024 / 1024:6.2f} MB")
+
+    # The legacy timestamps fail outside hours 4-23, so compare the files both could clean
+    compared = [name for name, out in legacy_out.items() if not isinstance(out, Exception)]
+    mismatched = [name for name in compared if fast_out[name] != legacy_out[name]]
+    failed = [name for name, out in fast_out.items() if isinstance(out, Exception)]
+    if mismatched or failed:
+        print(f"   ❌ Output mismatch in {len(mismatched)} file(s), streaming errors in {len(failed)}: "
+              f"{(mismatched + failed)[:3]}")
+        sys.exit(1)
+
+    print(f"   🚀 Speedup         : {legacy_time / fast_time:8.1f}x (parse + CSV), peak memory "
+          f"{legacy_peak / max(fast_peak, 1):.1f}x lower (identical CSV for {len(compared)} files; "
+          f"{len(files) - len(compared)} only cleaned by the streaming parser)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Directory Listing Parser Benchmark
+Compares the compiled-regex anchor extractor in scraper_utils with the old
+BeautifulSoup + per-anchor re.search implementation on saved listing fixtures
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+from ieso_scraper.scraper_utils import parse_directory_listing
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASE_URL = "https://reports-public.ieso.ca/public/{}/"
+FILE_PATTERN = r'\.(csv|xml)$'
+
+def legacy_parse(html: str, base_url: str, file_pattern: str):
+    """Previous scrape_ieso_directory parsing logic (BeautifulSoup html.parser)"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    files = []
+    for link in soup.find_all("a", href=True):
+        href = link['href']
+        text = link.text.strip()
+
+        if href in ['../', '../'] or not text:
+            continue
+
+        if file_pattern and not re.search(file_pattern, text):
+            continue
+
+        full_url = href if href.startswith('http') else base_url.rstrip('/') + '/' + href.lstrip('/')
+        files.append({'name': text, 'url': full_url, 'size': '', 'modified': ''})
+
+    return files
+
+def fast_parse(html: str, base_url: str, file_pattern: str):
+    """Current scrape_ieso_directory parsing logic (minus the HTTP round trip)"""
+    pattern = re.compile(file_pattern)
+    return [f for f in parse_directory_listing(html, base_url) if pattern.search(f['name'])]
+
+def scale_listing(html: str, scale: int) -> str:
+    """Repeat the file rows of a listing to simulate a larger directory"""
+    if scale <= 1:
+        return html
+
+    lines = html.split('\n')
+    rows = [i for i, line in enumerate(lines) if 'alt="[   ]"' in line]
+    if not rows:
+        return html
+
+    first, last = rows[0], rows[-1] + 1
+    body = lines[first:last]
+    scaled = []
+    for copy in range(scale):
+        # Give each copy unique names so nothing collapses downstream
+        scaled.extend(line.replace('_20', f'_{copy:03d}_20') if copy else line for line in body)
+
+    return '\n'.join(lines[:first] + scaled + lines[last:])
+
+def run_benchmark(fixture_path: str, repeat: int, scale: int):
+    name = os.path.splitext(os.path.basename(fixture_path))[0]
+    with open(fixture_path, 'r') as f:
+        html = scale_listing(f.read(), scale)
+
+    base_url = BASE_URL.format(name)
+    fast_files = fast_parse(html, base_url, FILE_PATTERN)
+
+    print(f"\n📄 {name} (x{scale}): {len(html) / 1024:.0f} KB, {len(fast_files)} matching files")
+
+    fast_time = min(timeit.repeat(lambda: fast_parse(html, base_url, FILE_PATTERN), number=1, repeat=repeat))
+    print(f"   ⚡ regex extractor : {fast_time * 1000:8.2f} ms")
+
+    if BeautifulSoup is None:
+        print("   ⚠️  beautifulsoup4 not installed - skipping legacy comparison")
+        return
+
+    # The legacy parser never filled in size/modified, so compare names and URLs
+    legacy_files = [(f['name'], f['url']) for f in legacy_parse(html, base_url, FILE_PATTERN)]
+    if legacy_files != [(f['name'], f['url']) for f in fast_files]:
+        print(f"   ❌ Output mismatch: legacy={len(legacy_files)} fast={len(fast_files)}")
+        sys.exit(1)
+
+    legacy_time = min(timeit.repeat(lambda: legacy_parse(html, base_url, FILE_PATTERN), number=1, repeat=repeat))
+    print(f"   🐢 BeautifulSoup   : {legacy_time * 1000:8.2f} ms")
+    print(f"   🚀 Speedup         : {legacy_time / fast_time:8.1f}x (identical output)")
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark IESO directory listing parsing")
+    parser.add_argument('fixtures', nargs='*', help="Listing HTML files (default: benchmarks/fixtures/*.html)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing repetitions (best is reported)")
+    parser.add_argument('--scale', type=int, default=1, help="Replicate listing rows N times")
+    args = parser.parse_args()
+
+    fixtures = args.fixtures or sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+    if not fixtures:
+        print(f"❌ No fixtures found in {FIXTURE_DIR}")
+        sys.exit(1)
+
+    print("🏁 Directory listing parser benchmark")
+    for fixture in fixtures:
+        run_benchmark(fixture, args.repeat, args.scale)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Throughput Benchmark
+Runs run_all_gap_fillers and the blob cleaners offline against the mock IESO
+server and a blob stand-in (filesystem by default, or any endpoint given by
+connection string, e.g. Azurite) at several data volumes, and reports files/sec
+and bytes/sec per stage.
+
+Volume 1x is --days-per-scale days of hourly files (24 per hourly dataset per
+day, plus annual files covering the same days); 10x and 100x multiply the days.
+
+Examples:
+    python bench_pipeline.py
+    python bench_pipeline.py --scales 1 10 --latency-ms 50 --error-rate 0.01
+    python bench_pipeline.py --connection-string "UseDevelopmentStorage=true" --skip-cleaners
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_ROOT = os.path.dirname(BENCH_DIR)
+REPO_ROOT = os.path.dirname(PACKAGE_ROOT)
+sys.path.append(PACKAGE_ROOT)
+
+from mock_ieso import Catalog, MockIESOServer, HOURLY_BODIES
+from blob_standin import BlobStandInServer
+
+RAW_CONTAINER = 'raw-data'
+CLEANED_CONTAINER = 'cleaned-data'
+
+# Cleaner scripts and the raw prefix each one processes (they read year=2025 only)
+CLEANERS = {
+    'EnergyLMP': os.path.join(REPO_ROOT, 'azure_push_clean', 'energyLMP_clean_push.py'),
+    'IntertieLMP': os.path.join(REPO_ROOT, 'azure_push_clean', 'intertielmp_push_clean.py'),
+}
+CLEANER_START = datetime(2025, 5, 1)
+
+# --- STORAGE ---
+
+class Storage:
+    """A clean blob endpoint per run: a fresh stand-in directory, or an emptied external endpoint"""
+
+    def __init__(self, workdir: str, connection_string: str = None):
+        self.workdir = workdir
+        self.external = connection_string
+        self.server = None
+
+    def __enter__(self) -> 'Storage':
+        if not self.external:
+            root = os.path.join(self.workdir, 'blobs')
+            shutil.rmtree(root, ignore_errors=True)
+            self.server = BlobStandInServer(root).start()
+        for container in (RAW_CONTAINER, CLEANED_CONTAINER):
+            client = self.container(container)
+            if not client.exists():
+                client.create_container()
+            elif self.external:
+                for blob in client.list_blobs():
+                    client.delete_blob(blob.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.server:
+            self.server.stop()
+
+    @property
+    def connection_string(self) -> str:
+        return self.external or self.server.connection_string
+
+    def container(self, container: str):
+        from azure.storage.blob import ContainerClient
+        return ContainerClient.from_connection_string(self.connection_string, container)
+
+    def usage(self, container: str, prefix: str = '') -> Dict[str, int]:
+        """Files and bytes stored (state and index blobs under _ are ignored)"""
+        files = size = 0
+        for blob in self.container(container).list_blobs(name_starts_with=prefix or None):
+            if not blob.name.startswith('_'):
+                files += 1
+                size += blob.size
+        return {'files': files, 'bytes': size}
+
+# --- WORKERS (run in a fresh interpreter per measurement) ---
+
+def scraper_worker(seed_date: str):
+    """Seed the hourly watermarks, run every gap filler in parallel and print the result as JSON"""
+    from ieso_scraper.datasets import DATASETS
+    from ieso_scraper.runner import run_all_gap_fillers
+    from ieso_scraper.state_store import advance_watermark_date
+
+    seed = datetime.strptime(seed_date, '%Y-%m-%d')
+    for name, spec in DATASETS.items():
+        if spec['granularity'] == 'hourly':
+            advance_watermark_date(name, seed, {'files': 0})
+
+    started = time.perf_counter()
+    results = run_all_gap_fillers(parallel=True)
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        'elapsed': elapsed,
+        'files': sum(r['files_processed'] for r in results.values()),
+        'failed': [name for name, r in results.items() if r['status'] != 'success']
+    }))
+
+def run_worker(args: List[str], env: Dict[str, str], cwd: str, log_path: str) -> subprocess.CompletedProcess:
+    with open(log_path, 'w') as log:
+        return subprocess.run([sys.executable] + args, env=env, cwd=cwd, stdout=subprocess.PIPE, stderr=log, text=True)
+
+def base_env(storage: Storage, workdir: str) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith(('AZURE_STORAGE', 'SCRAPER_'))}
+    env.update({
+        'AZURE_STORAGE_CONNECTION_STRING': storage.connection_string,
+        'SCRAPER_STATE_BACKEND': 'local',
+        'SCRAPER_STATE_DIR': os.path.join(workdir, 'state'),
+        'SCRAPER_LISTING_CACHE': os.path.join(workdir, 'listing_cache.json'),
+        'PYTHONPATH': os.pathsep.join(filter(None, [PACKAGE_ROOT, os.environ.get('PYTHONPATH')])),
+    })
+    return env
+
+# --- STAGES ---
+
+def bench_scraper(scale: int, args, workdir: str) -> Dict:
+    days = args.days_per_scale * scale
+    end = datetime.now() - timedelta(days=1)
+    catalog = Catalog(end, days, args.locations)
+    ieso = MockIESOServer(catalog, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          error_rate=args.error_rate, drop_rate=args.drop_rate).start()
+
+    try:
+        with Storage(workdir, args.connection_string) as storage:
+            env = base_env(storage, workdir)
+            env.update({
+                'SCRAPER_IESO_BASE_URL': ieso.base_url,
+                # The mock server is local, so pace it as fast as the engine can go
+                'SCRAPER_RATE_LIMIT_RPS': str(args.rate_limit_rps),
+                'SCRAPER_RATE_BURST': str(args.rate_limit_rps),
+                'SCRAPER_MAX_WORKERS': str(args.workers),
+                'SCRAPER_PER_HOST_CONCURRENCY': str(args.workers),
+            })
+            seed = (end - timedelta(days=days)).strftime('%Y-%m-%d')
+            process = run_worker([os.path.abspath(__file__), '--worker', 'scraper', seed], env, workdir,
+                                 os.path.join(workdir, 'scraper.log'))
+            if process.returncode != 0:
+                raise RuntimeError(f"scraper worker failed, see {os.path.join(workdir, 'scraper.log')}")
+            result = json.loads(process.stdout.strip().splitlines()[-1])
+            stored = storage.usage(RAW_CONTAINER)
+    finally:
+        ieso.stop()
+
+    return {
+        'stage': 'scraper', 'scale': scale, 'files': stored['files'], 'bytes': stored['bytes'],
+        'seconds': result['elapsed'], 'requests': ieso.stats['requests'],
+        'errors_injected': ieso.stats['errors_injected'] + ieso.stats['dropped'],
+        'note': f"failed: {', '.join(result['failed'])}" if result['failed'] else ''
+    }
+
+def seed_raw_files(storage: Storage, dataset: str, days: int, locations: int) -> Dict[str, int]:
+    """Upload hourly raw files for the cleaner to process, concurrently through the async layer"""
+    from ieso_scraper.async_blob import upload_blobs
+
+    ext = 'csv' if dataset == 'EnergyLMP' else 'xml'
+    report = 'RealtimeEnergyLMP' if dataset == 'EnergyLMP' else 'RealTimeIntertieLMP'
+    blobs = {}
+    for offset in range(days):
+        day = CLEANER_START + timedelta(days=offset)
+        for hour in range(1, 25):
+            path = (f"{dataset}/year={day.year}/month={day.month:02d}/day={day.day:02d}/"
+                    f"PUB_{report}_{day:%Y%m%d}{hour:02d}.{ext}")
+            blobs[path] = HOURLY_BODIES[dataset](day, hour, locations)
+
+    # Upload in batches to bound memory at 100x
+    names = list(blobs)
+    for start in range(0, len(names), 500):
+        batch = {name: blobs[name] for name in names[start:start + 500]}
+        _, failed = upload_blobs(RAW_CONTAINER, batch, connection_string=storage.connection_string)
+        if failed:
+            raise RuntimeError(f"seeding {dataset} failed for {len(failed)} blobs: {next(iter(failed.values()))}")
+
+    return {'files': len(blobs), 'bytes': sum(len(data) for data in blobs.values())}
+
+def bench_cleaner(dataset: str, scale: int, args, workdir: str) -> Dict:
+    days = args.days_per_scale * scale
+    with Storage(workdir, args.connection_string) as storage:
+        seeded = seed_raw_files(storage, dataset, days, args.locations)
+        env = base_env(storage, workdir)
+
+        started = time.perf_counter()
+        process = run_worker([CLEANERS[dataset]], env, workdir, os.path.join(workdir, f"{dataset}_cleaner.log"))
+        elapsed = time.perf_counter() - started
+        if process.returncode != 0:
+            raise RuntimeError(f"{dataset} cleaner failed, see {os.path.join(workdir, f'{dataset}_cleaner.log')}")
+        cleaned = storage.usage(CLEANED_CONTAINER, f"{dataset}/")
+
+    return {
+        'stage': f"clean {dataset}", 'scale': scale, 'files': seeded['files'], 'bytes': seeded['bytes'],
+        'seconds': elapsed, 'requests': 0, 'errors_injected': 0,
+        'note': f"{cleaned['files']} cleaned files written" if cleaned['files'] != seeded['files'] else ''
+    }
+
+def print_results(results: List[Dict]):
+    print("\n📊 PIPELINE THROUGHPUT")
+    print("=" * 96)
+    print(f"{'Stage':18} | {'Scale':>5} | {'Files':>6} | {'MB':>8} | {'Seconds':>8} | {'Files/s':>8} | "
+          f"{'MB/s':>7} | Notes")
+    print("-" * 96)
+    for r in results:
+        seconds = max(r['seconds'], 1e-9)
+        notes = r['note']
+        if r['errors_injected']:
+            notes = f"{r['errors_injected']} injected errors/{r['requests']} requests " + notes
+        print(f"{r['stage']:18} | {r['scale']:>4}x | {r['files']:6} | {r['bytes'] / 1024 / 1024:8.1f} | "
+              f"{r['seconds']:8.2f} | {r['files'] / seconds:8.1f} | {r['bytes'] / 1024 / 1024 / seconds:7.2f} | {notes}")
+    print("-" * 96)
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) > 2 and sys.argv[1] == '--worker':
+        scraper_worker(sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description="Offline end-to-end throughput benchmark")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help="Volume multipliers")
+    parser.add_argument('--days-per-scale', type=int, default=1, help="Days of hourly files at 1x")
+    parser.add_argument('--locations', type=int, default=100, help="Pricing locations per EnergyLMP file")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Mock IESO delay per request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Mock IESO random extra delay")
+    parser.add_argument('--error-rate', type=float, default=0, help="Share of IESO requests answered with 503")
+    parser.add_argument('--drop-rate', type=float, default=0, help="Share of IESO connections dropped")
+    parser.add_argument('--workers', type=int, default=8, help="Scraper transfer workers per dataset")
+    parser.add_argument('--rate-limit-rps', type=float, default=1000, help="Scraper pacing towards the mock")
+    parser.add_argument('--connection-string', default=None,
+                        help="Blob endpoint to use instead of the filesystem stand-in (e.g. Azurite)")
+    parser.add_argument('--skip-scraper', action='store_true')
+    parser.add_argument('--skip-cleaners', action='store_true')
+    parser.add_argument('--workdir', default=None, help="Keep run files here (default: a temp dir)")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='ieso_bench_')
+    print(f"🏁 Pipeline benchmark at {', '.join(f'{s}x' for s in args.scales)} (work dir: {workdir})")
+
+    results = []
+    for scale in args.scales:
+        run_dir = os.path.join(workdir, f"scale_{scale}")
+        shutil.rmtree(run_dir, ignore_errors=True)
+        os.makedirs(run_dir)
+
+        if not args.skip_scraper:
+            print(f"🚀 {scale}x: run_all_gap_fillers")
+            results.append(bench_scraper(scale, args, run_dir))
+        if not args.skip_cleaners:
+            for dataset in CLEANERS:
+                print(f"🧹 {scale}x: {dataset} cleaner")
+                results.append(bench_cleaner(dataset, scale, args, run_dir))
+
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if not args.workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Filesystem Blob Storage Stand-in
+A local HTTP server implementing the subset of the Azure Blob REST API the
+project uses (containers, list, get/head with ranges, put, staged blocks and
+block lists, conditional writes, metadata), storing blobs as plain files.
+The real SDK talks to it through a connection string, sync or async, exactly
+as it would to Azure or Azurite. No authentication is checked.
+
+Examples:
+    python blob_standin.py --root /tmp/blobs --port 10000
+    export AZURE_STORAGE_CONNECTION_STRING="$(python blob_standin.py --print-connection-string --port 10000)"
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+ACCOUNT = "devstoreaccount1"
+# Well-known development storage key (the stand-in ignores it; the SDK needs a valid one to sign)
+ACCOUNT_KEY = "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
+API_VERSION = "2021-12-02"
+META_DIR = '.meta'
+BLOCK_DIR = '.blocks'
+
+def connection_string(port: int) -> str:
+    return (f"DefaultEndpointsProtocol=http;AccountName={ACCOUNT};AccountKey={ACCOUNT_KEY};"
+            f"BlobEndpoint=http://127.0.0.1:{port}/{ACCOUNT};")
+
+class BlobStore:
+    """Blobs as files under root/<container>/<name>, properties in root/.meta as JSON"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _data_path(self, container: str, name: str) -> str:
+        return os.path.join(self.root, container, *name.split('/'))
+
+    def _meta_path(self, container: str, name: str) -> str:
+        return os.path.join(self.root, META_DIR, container, *name.split('/')) + '.json'
+
+    def _block_dir(self, container: str, name: str) -> str:
+        return os.path.join(self.root, BLOCK_DIR, container, hashlib.md5(name.encode()).hexdigest())
+
+    # --- CONTAINERS ---
+
+    def container_exists(self, container: str) -> bool:
+        return os.path.isdir(os.path.join(self.root, container))
+
+    def create_container(self, container: str) -> bool:
+        with self._lock:
+            if self.container_exists(container):
+                return False
+            os.makedirs(os.path.join(self.root, container))
+            return True
+
+    def delete_container(self, container: str) -> bool:
+        with self._lock:
+            if not self.container_exists(container):
+                return False
+            for base in (self.root, os.path.join(self.root, META_DIR), os.path.join(self.root, BLOCK_DIR)):
+                shutil.rmtree(os.path.join(base, container), ignore_errors=True)
+            return True
+
+    def list_containers(self) -> List[str]:
+        return sorted(d for d in os.listdir(self.root) if not d.startswith('.') and
+                      os.path.isdir(os.path.join(self.root, d)))
+
+    # --- BLOBS ---
+
+    def properties(self, container: str, name: str) -> Optional[Dict]:
+        try:
+            with open(self._meta_path(container, name), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def read(self, container: str, name: str, start: int = 0, end: int = None) -> bytes:
+        with open(self._data_path(container, name), 'rb') as f:
+            f.seek(start)
+            return f.read() if end is None else f.read(end + 1 - start)
+
+    def write(self, container: str, name: str, data: bytes, content_type: str, metadata: Dict[str, str]) -> Dict:
+        """Write a blob atomically and return its new properties"""
+        props = {
+            'etag': f'"0x{uuid.uuid4().hex[:16].upper()}"',
+            'last_modified': time.time(),
+            'size': len(data),
+            'content_type': content_type or 'application/octet-stream',
+            'content_md5': base64.b64encode(hashlib.md5(data).digest()).decode(),
+            'metadata': metadata
+        }
+        data_path, meta_path = self._data_path(container, name), self._meta_path(container, name)
+        for path in (data_path, meta_path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp = f"{data_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, data_path)
+        with open(meta_path, 'w') as f:
+            json.dump(props, f)
+        return props
+
+    def delete(self, container: str, name: str) -> bool:
+        if self.properties(container, name) is None:
+            return False
+        os.remove(self._data_path(container, name))
+        os.remove(self._meta_path(container, name))
+        return True
+
+    def stage_block(self, container: str, name: str, block_id: str, data: bytes):
+        block_dir = self._block_dir(container, name)
+        os.makedirs(block_dir, exist_ok=True)
+        with open(os.path.join(block_dir, hashlib.md5(block_id.encode()).hexdigest()), 'wb') as f:
+            f.write(data)
+
+    def commit_blocks(self, container: str, name: str, block_ids: List[str]) -> bytes:
+        """Concatenate staged blocks in order and discard the staging area"""
+        block_dir = self._block_dir(container, name)
+        parts = []
+        for block_id in block_ids:
+            with open(os.path.join(block_dir, hashlib.md5(block_id.encode()).hexdigest()), 'rb') as f:
+                parts.append(f.read())
+        shutil.rmtree(block_dir, ignore_errors=True)
+        return b''.join(parts)
+
+    def list_blobs(self, container: str, prefix: str = '') -> List[Tuple[str, Dict]]:
+        """All (name, properties) under a prefix, in name order"""
+        meta_root = os.path.join(self.root, META_DIR, container)
+        # Only walk the deepest directory the prefix pins down
+        start = os.path.join(meta_root, *prefix.split('/')[:-1]) if '/' in prefix else meta_root
+        found = []
+        for dirpath, _, filenames in os.walk(start):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                name = os.path.relpath(os.path.join(dirpath, filename[:-5]), meta_root).replace(os.sep, '/')
+                if name.startswith(prefix):
+                    found.append(name)
+        found.sort()
+        return [(name, self.properties(container, name)) for name in found]
+
+    def usage(self, container: str, prefix: str = '') -> Tuple[int, int]:
+        """(blob count, total bytes) under a prefix"""
+        blobs = self.list_blobs(container, prefix)
+        return len(blobs), sum(props['size'] for _, props in blobs if props)
+
+class BlobStandInServer(ThreadingHTTPServer):
+    """Threaded Blob REST stand-in over a BlobStore"""
+
+    daemon_threads = True
+
+    def __init__(self, root: str, port: int = 0):
+        super().__init__(('127.0.0.1', port), BlobStandInHandler)
+        self.store = BlobStore(root)
+        self.stats = {'requests': 0, 'bytes_in': 0, 'bytes_out': 0}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def connection_string(self) -> str:
+        return connection_string(self.server_address[1])
+
+    def count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def start(self) -> 'BlobStandInServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='blob-standin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+def _http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+class BlobStandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    # --- REQUEST PARSING ---
+
+    def parse(self) -> Tuple[Optional[str], Optional[str], Dict[str, str]]:
+        """(container, blob name, query) from a path-style URL /<account>/<container>/<blob>"""
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        parts = url.path.lstrip('/').split('/', 2)
+        if parts and parts[0] == ACCOUNT:
+            parts = parts[1:]
+        container = parts[0] if parts and parts[0] else None
+        name = unquote(parts[1]) if len(parts) > 1 and parts[1] else None
+        if len(parts) > 2:
+            name = unquote(parts[1] + '/' + parts[2])
+        return container, name, query
+
+    def read_body(self) -> bytes:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            body = b''.join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.count('bytes_in', len(body))
+        return body
+
+    def request_metadata(self) -> Dict[str, str]:
+        return {k[len('x-ms-meta-'):]: v for k, v in self.headers.items() if k.lower().startswith('x-ms-meta-')}
+
+    # --- RESPONSES ---
+
+    def respond(self, status: int, body: bytes = b'', headers: Dict[str, str] = None, content_type: str = None,
+                content_length: int = None):
+        self.send_response(status)
+        self.send_header('x-ms-request-id', str(uuid.uuid4()))
+        self.send_header('x-ms-version', self.headers.get('x-ms-version', API_VERSION))
+        self.send_header('Date', _http_date(time.time()))
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body) if content_length is None else content_length))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+            self.server.count('bytes_out', len(body))
+
+    def error(self, status: int, code: str, message: str = ''):
+        body = (f'<?xml version="1.0" encoding="utf-8"?><Error><Code>{code}</Code>'
+                f'<Message>{escape(message or code)}</Message></Error>').encode()
+        self.respond(status, body, {'x-ms-error-code': code}, 'application/xml')
+
+    def blob_headers(self, props: Dict) -> Dict[str, str]:
+        headers = {
+            'ETag': props['etag'],
+            'Last-Modified': _http_date(props['last_modified']),
+            'x-ms-creation-time': _http_date(props['last_modified']),
+            'x-ms-blob-type': 'BlockBlob',
+            'x-ms-lease-state': 'available',
+            'x-ms-lease-status': 'unlocked',
+            'x-ms-server-encrypted': 'true',
+            'Accept-Ranges': 'bytes',
+            'Content-MD5': props['content_md5']
+        }
+        for key, value in props.get('metadata', {}).items():
+            headers[f'x-ms-meta-{key}'] = value
+        return headers
+
+    def check_conditions(self, props: Optional[Dict]) -> bool:
+        """Apply If-Match / If-None-Match; responds and returns False when a condition fails"""
+        if_match = self.headers.get('If-Match')
+        if_none_match = self.headers.get('If-None-Match')
+        if if_match and (props is None or (if_match != '*' and if_match != props['etag'])):
+            self.error(412, 'ConditionNotMet', 'The condition specified using HTTP conditional header(s) is not met.')
+            return False
+        if if_none_match == '*' and props is not None:
+            self.error(409, 'BlobAlreadyExists', 'The specified blob already exists.')
+            return False
+        if if_none_match and if_none_match != '*' and props is not None and if_none_match == props['etag']:
+            self.respond(304 if self.command in ('GET', 'HEAD') else 412)
+            return False
+        return True
+
+    # --- VERBS ---
+
+    def do_PUT(self):
+        self.server.count('requests')
+        store: BlobStore = self.server.store
+        container, name, query = self.parse()
+        body = self.read_body()
+
+        if name is None:
+            if query.get('restype') == 'container':
+                if store.create_container(container):
+                    self.respond(201, headers={'ETag': f'"0x{uuid.uuid4().hex[:16].upper()}"',
+                                               'Last-Modified': _http_date(time.time())})
+                else:
+                    self.error(409, 'ContainerAlreadyExists', 'The specified container already exists.')
+                return
+            self.error(400, 'UnsupportedHttpVerb')
+            return
+
+        if not store.container_exists(container):
+            self.error(404, 'ContainerNotFound', 'The specified container does not exist.')
+            return
+
+        comp = query.get('comp')
+        if comp == 'block':
+            store.stage_block(container, name, query['blockid'], body)
+            self.respond(201, headers={'x-ms-request-server-encrypted': 'true'})
+            return
+
+        if not self.check_conditions(store.properties(container, name)):
+            return
+
+        content_type = self.headers.get('x-ms-blob-content-type') or self.headers.get('Content-Type')
+        if comp == 'blocklist':
+            root = ET.fromstring(body)
+            block_ids = [element.text for element in root]
+            data = store.commit_blocks(container, name, block_ids)
+        elif comp is None:
+            data = body
+        else:
+            self.error(400, 'UnsupportedQueryParameter', f"comp={comp}")
+            return
+
+        props = store.write(container, name, data, content_type, self.request_metadata())
+        self.respond(201, headers={'ETag': props['etag'], 'Last-Modified': _http_date(props['last_modified']),
+                                   'Content-MD5': props['content_md5'], 'x-ms-request-server-encrypted': 'true'})
+
+    def do_GET(self):
+        self.server.count('requests')
+        store: BlobStore = self.server.store
+        container, name, query = self.parse()
+
+        if container is None and query.get('comp') == 'list':
+            items = ''.join(f'<Container><Name>{escape(c)}</Name><Properties /></Container>'
+                            for c in store.list_containers())
+            body = (f'<?xml version="1.0" encoding="utf-8"?><EnumerationResults ServiceEndpoint="/{ACCOUNT}">'
+                    f'<Containers>{items}</Containers><NextMarker /></EnumerationResults>').encode()
+            self.respond(200, body, content_type='application/xml')
+            return
+
+        if not store.container_exists(container):
+            self.error(404, 'ContainerNotFound', 'The specified container does not exist.')
+            return
+
+        if name is None:
+            if query.get('comp') == 'list':
+                self.list_blobs(container, query)
+            else:
+                self.respond(200, headers={'ETag': '"0x0"', 'Last-Modified': _http_date(time.time())})
+            return
+
+        self.get_blob(container, name, with_body=True)
+
+    def do_HEAD(self):
+        self.server.count('requests')
+        store: BlobStore = self.server.store
+        container, name, _ = self.parse()
+        if name is None:
+            if store.container_exists(container):
+                self.respond(200, headers={'ETag': '"0x0"', 'Last-Modified': _http_date(time.time())})
+            else:
+                self.error(404, 'ContainerNotFound')
+            return
+        self.get_blob(container, name, with_body=False)
+
+    def do_DELETE(self):
+        self.server.count('requests')
+        store: BlobStore = self.server.store
+        container, name, _ = self.parse()
+        self.read_body()
+        if name is None:
+            if store.delete_container(container):
+                self.respond(202)
+            else:
+                self.error(404, 'ContainerNotFound')
+            return
+        if store.delete(container, name):
+            self.respond(202)
+        else:
+            self.error(404, 'BlobNotFound', 'The specified blob does not exist.')
+
+    def get_blob(self, container: str, name: str, with_body: bool):
+        store: BlobStore = self.server.store
+        props = store.properties(container, name)
+        if props is None:
+            self.error(404, 'BlobNotFound', 'The specified blob does not exist.')
+            return
+        if not self.check_conditions(props):
+            return
+
+        headers = self.blob_headers(props)
+        content_type = props['content_type']
+        size = props['size']
+        requested = self.headers.get('x-ms-range') or self.headers.get('Range')
+        match = re.match(r'bytes=(\d+)-(\d*)$', requested or '')
+
+        if not with_body:
+            self.respond(200, b'', headers, content_type, content_length=size)
+            return
+
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+            if start >= size:
+                self.error(416, 'InvalidRange', 'The range specified is invalid for the current size of the resource.')
+                return
+            headers['Content-Range'] = f"bytes {start}-{end}/{size}"
+            self.respond(206, store.read(container, name, start, end), headers, content_type)
+            return
+
+        self.respond(200, store.read(container, name), headers, content_type)
+
+    def list_blobs(self, container: str, query: Dict[str, str]):
+        store: BlobStore = self.server.store
+        prefix = query.get('prefix', '')
+        marker = query.get('marker', '')
+        max_results = int(query.get('maxresults', 5000))
+        include_metadata = 'metadata' in query.get('include', '')
+
+        blobs = [(n, p) for n, p in store.list_blobs(container, prefix) if n > marker or not marker]
+        page, rest = blobs[:max_results], blobs[max_results:]
+
+        items = []
+        for name, props in page:
+            metadata = ''
+            if include_metadata:
+                metadata = '<Metadata>' + ''.join(f'<{k}>{escape(v)}</{k}>'
+                                                  for k, v in props.get('metadata', {}).items()) + '</Metadata>'
+            items.append(
+                f'<Blob><Name>{escape(name)}</Name><Properties>'
+                f'<Creation-Time>{_http_date(props["last_modified"])}</Creation-Time>'
+                f'<Last-Modified>{_http_date(props["last_modified"])}</Last-Modified>'
+                f'<Etag>{escape(props["etag"])}</Etag><Content-Length>{props["size"]}</Content-Length>'
+                f'<Content-Type>{escape(props["content_type"])}</Content-Type>'
+                f'<Content-MD5>{props["content_md5"]}</Content-MD5><BlobType>BlockBlob</BlobType>'
+                f'<LeaseStatus>unlocked</LeaseStatus><LeaseState>available</LeaseState>'
+                f'<ServerEncrypted>true</ServerEncrypted></Properties>{metadata}</Blob>'
+            )
+
+        next_marker = escape(page[-1][0]) if rest else ''
+        body = (f'<?xml version="1.0" encoding="utf-8"?>'
+                f'<EnumerationResults ServiceEndpoint="http://127.0.0.1/{ACCOUNT}" ContainerName="{escape(container)}">'
+                f'<Prefix>{escape(prefix)}</Prefix><MaxResults>{max_results}</MaxResults>'
+                f'<Blobs>{"".join(items)}</Blobs><NextMarker>{next_marker}</NextMarker></EnumerationResults>').encode()
+        self.respond(200, body, content_type='application/xml')
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Serve a filesystem-backed Azure Blob Storage stand-in")
+    parser.add_argument('--root', default=os.path.join(os.getcwd(), 'blob_standin'), help="Storage directory")
+    parser.add_argument('--port', type=int, default=10000)
+    parser.add_argument('--containers', nargs='*', default=['raw-data', 'cleaned-data'],
+                        help="Containers to create on start")
+    parser.add_argument('--print-connection-string', action='store_true', help="Print it and exit")
+    args = parser.parse_args()
+
+    if args.print_connection_string:
+        print(connection_string(args.port))
+        return
+
+    server = BlobStandInServer(args.root, args.port)
+    for container in args.containers:
+        server.store.create_container(container)
+
+    print(f"🪣 Blob stand-in on port {server.server_address[1]}, storing under {args.root}")
+    print(f'   export AZURE_STORAGE_CONNECTION_STRING="{server.connection_string}"')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Mock IESO Reports Server
+Serves Apache-style directory listings and report files for every dataset in
+ieso_scraper.datasets, so the scraper can run offline. Listings are replayed from
+recorded fixtures (<Report>.html, files under <Report>/) or synthesized for a
+window of days; file bodies that were not recorded are generated in the IESO
+formats the scraper, delta ingest and cleaners parse.
+
+Supports conditional GETs (ETag / If-Modified-Since), byte ranges, per-request
+latency and error injection (503 with Retry-After, or dropped connections).
+
+Examples:
+    python mock_ieso.py --port 8080 --days 7
+    python mock_ieso.py --fixtures fixtures --latency-ms 80 --error-rate 0.02
+    SCRAPER_IESO_BASE_URL=http://127.0.0.1:8080/public/ python -m ieso_scraper EnergyLMP
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+from ieso_scraper.datasets import DATASETS
+
+NAMESPACE = "http://www.ieso.ca/schema"
+
+# Report directory (last URL segment) of every dataset, e.g. 'RealtimeEnergyLMP'
+REPORTS = {dataset: spec['url'].rstrip('/').rsplit('/', 1)[-1] for dataset, spec in DATASETS.items()}
+
+INTERTIES = ['MI.ST-CLAIR_MISC', 'MN.INTFALLS_MNIF', 'MP.WHITESHELL_MPWH', 'NY.NIAGARA_NYNI', 'NY.STLAWRENCE_NYSL',
+             'PQ.BEAUHARNOIS_PQBE', 'PQ.HAWTHORNE_PQHA', 'PQ.OUTAOUAIS_PQAT']
+INTERTIE_COMPONENTS = ['Intertie LMP', 'Energy Loss Price', 'Energy Congestion Price',
+                       'External Congestion Price', 'Net Interchange Scheduling Limit Price']
+FUELS = ['NUCLEAR', 'GAS', 'HYDRO', 'WIND', 'SOLAR', 'BIOFUEL']
+ZONES = ['Northwest', 'Northeast', 'Ottawa', 'East', 'Toronto', 'Essa', 'Bruce', 'Southwest', 'Niagara', 'West']
+
+# --- SYNTHETIC REPORT BODIES ---
+
+def _rng(*key) -> random.Random:
+    """Deterministic generator per file, so a name always serves the same bytes"""
+    return random.Random(hashlib.md5(repr(key).encode()).hexdigest())
+
+def energy_lmp_csv(day: datetime, hour: int, locations: int) -> bytes:
+    """PUB_RealtimeEnergyLMP: a CREATED AT line, then 12 five-minute intervals per location"""
+    rng = _rng('EnergyLMP', day, hour)
+    lines = [f"CREATED AT {day:%Y/%m/%d} {hour % 24:02d}:05:12 FOR {day:%Y/%m/%d}",
+             "Delivery Hour,Interval,Pricing Location,LMP,Energy Loss Price,Energy Congestion Price"]
+    for location in range(locations):
+        base = rng.uniform(5, 80)
+        for interval in range(1, 13):
+            loss = rng.uniform(-1, 1)
+            lines.append(f"{hour},{interval},NODE{location:04d}.LMP,{base + loss:.2f},{loss:.2f},0.00")
+    return ('\r\n'.join(lines) + '\r\n').encode()
+
+def intertie_lmp_xml(day: datetime, hour: int, locations: int = None) -> bytes:
+    """PUB_RealTimeIntertieLMP: five price components of 12 intervals per intertie (locations is unused)"""
+    rng = _rng('IntertieLMP', day, hour)
+    parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="{NAMESPACE}">',
+             f'<DocHeader><DocTitle>Realtime Intertie LMP Report</DocTitle>'
+             f'<CreatedAt>{day:%Y-%m-%d}T{hour % 24:02d}:05:12</CreatedAt></DocHeader>',
+             f'<DocBody><DeliveryDate>{day:%Y-%m-%d}</DeliveryDate><DeliveryHour>{hour}</DeliveryHour>'
+             '<IntertieLMPrices>']
+    for intertie in INTERTIES:
+        parts.append(f'<IntertieLMPrice><IntertiePLName>{intertie}:LMP</IntertiePLName><Components>')
+        for component in INTERTIE_COMPONENTS:
+            parts.append(f'<Component><LMPComponent>{component}</LMPComponent>')
+            for interval in range(1, 13):
+                parts.append(f'<IntervalLMP><Interval>{interval}</Interval><LMP>{rng.uniform(-5, 90):.2f}</LMP>'
+                             f'<Flag>{"DSO-RD" if rng.random() < 0.05 else ""}</Flag></IntervalLMP>')
+            parts.append('</Component>')
+        parts.append('</Components></IntertieLMPrice>')
+    parts.append('</IntertieLMPrices></DocBody></Document>\n')
+    return ''.join(parts).encode()
+
+def _hours(days: List[datetime]):
+    for day in days:
+        for hour in range(1, 25):
+            yield day, hour
+
+def genmix_xml(year: int, days: List[datetime]) -> bytes:
+    """PUB_GenOutputbyFuelHourly: one <DailyData> per day with hourly output per fuel"""
+    rng = _rng('GenMix', year, len(days))
+    parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="{NAMESPACE}">',
+             '<DocHeader><DocTitle>Generator Output by Fuel Type Hourly Report</DocTitle></DocHeader>',
+             f'<DocBody><Year>{year}</Year>']
+    for day in days:
+        parts.append(f'<DailyData><Day>{day:%Y-%m-%d}</Day>')
+        for hour in range(1, 25):
+            parts.append(f'<HourlyData><Hour>{hour}</Hour>')
+            for fuel in FUELS:
+                quality = '-1' if rng.random() < 0.01 else '0'
+                parts.append(f'<FuelTotal><Fuel>{fuel}</Fuel><EnergyValue><OutputQuality>{quality}</OutputQuality>'
+                             f'<Output>{rng.randint(0, 10000)}</Output></EnergyValue></FuelTotal>')
+            parts.append('</HourlyData>')
+        parts.append('</DailyData>')
+    parts.append('</DocBody></Document>\n')
+    return ''.join(parts).encode()
+
+def demand_csv(year: int, days: List[datetime]) -> bytes:
+    """PUB_Demand: comment lines, then Date,Hour,Market Demand,Ontario Demand"""
+    rng = _rng('Demand', year, len(days))
+    lines = ["\\Hourly Demand Report,,,", f"\\Created at {days[-1] + timedelta(days=1):%Y-%m-%d} 02:00:00,,,",
+             "\\For 01 January to 31 December,,,", "Date,Hour,Market Demand,Ontario Demand"]
+    for day, hour in _hours(days):
+        ontario = rng.randint(11000, 22000)
+        lines.append(f"{day:%Y-%m-%d},{hour},{ontario + rng.randint(500, 3000)},{ontario}")
+    return ('\r\n'.join(lines) + '\r\n').encode()
+
+def demand_zonal_csv(year: int, days: List[datetime]) -> bytes:
+    """PUB_DemandZonal: comment lines, then Date,Hour,Ontario Demand,<zones>,Zone Total,Diff"""
+    rng = _rng('DemandZonal', year, len(days))
+    lines = ["\\Zonal Demand Report,", f"\\Created at {days[-1] + timedelta(days=1):%Y-%m-%d} 02:00:00,",
+             "Date,Hour,Ontario Demand," + ','.join(ZONES) + ",Zone Total,Diff"]
+    for day, hour in _hours(days):
+        zones = [rng.randint(200, 6000) for _ in ZONES]
+        total = sum(zones)
+        lines.append(f"{day:%Y-%m-%d},{hour},{total}," + ','.join(map(str, zones)) + f",{total},0")
+    return ('\r\n'.join(lines) + '\r\n').encode()
+
+HOURLY_BODIES = {'EnergyLMP': energy_lmp_csv, 'IntertieLMP': intertie_lmp_xml}
+ANNUAL_BODIES = {'GenMix': genmix_xml, 'Demand': demand_csv, 'DemandZonal': demand_zonal_csv}
+
+_HOUR_NAME_RE = re.compile(r'_(\d{8})(\d{2})(?:_v\d+)?\.\w+$')
+_YEAR_NAME_RE = re.compile(r'_(\d{4})(?:_v(\d+))?\.\w+$')
+
+# --- CATALOG ---
+
+class Catalog:
+    """Files served per report directory, with their listing metadata"""
+
+    def __init__(self, end: datetime, days: int, locations: int = 100, versions: int = 1,
+                 fixtures: Optional[str] = None):
+        self.end = end.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.days = [self.end - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+        self.locations = locations
+        self.versions = versions
+        self.fixtures = fixtures
+        self.published = datetime.now()
+        self.entries: Dict[str, Dict[str, Tuple[str, int]]] = {}
+        self.recorded: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        for dataset, report in REPORTS.items():
+            listing = os.path.join(fixtures, f"{report}.html") if fixtures else None
+            if listing and os.path.exists(listing):
+                with open(listing, 'r') as f:
+                    self.recorded[report] = f.read()
+            else:
+                self.entries[report] = self._synthesize(dataset)
+
+    def _synthesize(self, dataset: str) -> Dict[str, Tuple[str, int]]:
+        """name -> (modified, approximate size) for the configured window"""
+        spec = DATASETS[dataset]
+        prefix = f"PUB_{REPORTS[dataset]}_"
+        ext = spec['pattern'].rsplit('.', 1)[-1].rstrip('$')
+        entries = {}
+
+        if spec['granularity'] == 'hourly':
+            sample = len(HOURLY_BODIES[dataset](self.end, 1, self.locations))
+            for day, hour in _hours(self.days):
+                published = (day + timedelta(hours=hour)).strftime('%Y-%m-%d %H:%M')
+                for version in range(self.versions):
+                    suffix = f"_v{version}" if version else ''
+                    entries[f"{prefix}{day:%Y%m%d}{hour:02d}{suffix}.{ext}"] = (published, sample)
+        else:
+            for year in sorted({day.year for day in self.days}):
+                year_days = [day for day in self.days if day.year == year]
+                size = len(year_days) * 24 * (320 if ext == 'xml' else 40)
+                published = (year_days[-1] + timedelta(days=1, hours=2)).strftime('%Y-%m-%d %H:%M')
+                entries[f"{prefix}{year}.{ext}"] = (published, size)
+                for version in range(1, self.versions + 1):
+                    entries[f"{prefix}{year}_v{version}.{ext}"] = (published, size)
+
+        return entries
+
+    def etag(self, report: str) -> str:
+        with self._lock:
+            names = sorted(self.entries.get(report, {})) or [self.recorded.get(report, '')]
+        return '"' + hashlib.md5('\n'.join(names).encode()).hexdigest() + '"'
+
+    def listing(self, report: str) -> Optional[str]:
+        """Apache autoindex page of one report directory"""
+        if report in self.recorded:
+            return self.recorded[report]
+        if report not in self.entries:
+            return None
+
+        rows = []
+        with self._lock:
+            entries = sorted(self.entries[report].items())
+        for name, (modified, size) in entries:
+            rows.append(f'<img src="/icons/unknown.gif" alt="[   ]"> <a href="{name}">{name}</a>'
+                        f'{" " * max(1, 46 - len(name))}{modified}  {format_size(size)}  ')
+
+        return (f'<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 3.2 Final//EN">\n<html>\n <head>\n'
+                f'  <title>Index of /public/{report}</title>\n </head>\n <body>\n<h1>Index of /public/{report}</h1>\n'
+                '<pre><img src="/icons/blank.gif" alt="Icon "> <a href="?C=N;O=D">Name</a>\n'
+                '<hr><img src="/icons/back.gif" alt="[PARENTDIR]"> <a href="/public/">Parent Directory</a>\n'
+                + '\n'.join(rows) + '\n<hr></pre>\n</body></html>\n')
+
+    def body(self, report: str, name: str) -> Optional[bytes]:
+        """Recorded file if present, else a synthesized body in the report's format"""
+        if self.fixtures:
+            path = os.path.join(self.fixtures, report, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+
+        if report in self.entries and name not in self.entries[report]:
+            return None
+        dataset = next((d for d, r in REPORTS.items() if r == report), None)
+        if dataset is None or not re.search(DATASETS[dataset]['pattern'], name):
+            return None
+        return _synthesized_body(dataset, name, tuple(self.days), self.locations)
+
+@lru_cache(maxsize=64)
+def _synthesized_body(dataset: str, name: str, days: Tuple[datetime, ...], locations: int) -> Optional[bytes]:
+    if dataset in HOURLY_BODIES:
+        match = _HOUR_NAME_RE.search(name)
+        day = datetime.strptime(match.group(1), '%Y%m%d')
+        return HOURLY_BODIES[dataset](day, int(match.group(2)), locations)
+
+    year = int(_YEAR_NAME_RE.search(name).group(1))
+    year_days = [day for day in days if day.year == year] or [datetime(year, 1, 1)]
+    return ANNUAL_BODIES[dataset](year, year_days)
+
+def format_size(size: int) -> str:
+    """Autoindex-style size column (1.1M, 640K)"""
+    if size >= 1024 ** 2:
+        return f"{size / 1024 ** 2:.1f}M"
+    if size >= 1024:
+        return f"{size // 1024}K"
+    return str(size)
+
+# --- SERVER ---
+
+class MockIESOServer(ThreadingHTTPServer):
+    """Threaded HTTP server over a Catalog with latency and error injection"""
+
+    daemon_threads = True
+
+    def __init__(self, catalog: Catalog, port: int = 0, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, drop_rate: float = 0, seed: int = 1):
+        super().__init__(('127.0.0.1', port), MockIESOHandler)
+        self.catalog = catalog
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+        self.stats = {'requests': 0, 'listings': 0, 'not_modified': 0, 'files': 0, 'bytes': 0,
+                      'errors_injected': 0, 'dropped': 0}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/public/"
+
+    def count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def roll(self) -> float:
+        with self._stats_lock:
+            return self.rng.random()
+
+    def start(self) -> 'MockIESOServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='mock-ieso', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+class MockIESOHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server: MockIESOServer = self.server
+        server.count('requests')
+
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.jitter * server.roll())
+
+        if server.drop_rate and server.roll() < server.drop_rate:
+            server.count('dropped')
+            self.close_connection = True
+            self.connection.close()
+            return
+
+        if server.error_rate and server.roll() < server.error_rate:
+            server.count('errors_injected')
+            self.send_error_body(503, b'Service Unavailable', {'Retry-After': '1'})
+            return
+
+        parts = [p for p in self.path.split('?', 1)[0].split('/') if p]
+        if len(parts) == 2 and parts[0] == 'public':
+            self.serve_listing(parts[1])
+        elif len(parts) == 3 and parts[0] == 'public':
+            self.serve_file(parts[1], parts[2])
+        else:
+            self.send_error_body(404, b'Not Found')
+
+    def serve_listing(self, report: str):
+        server: MockIESOServer = self.server
+        catalog = server.catalog
+        page = catalog.listing(report)
+        if page is None:
+            self.send_error_body(404, b'Not Found')
+            return
+
+        etag = catalog.etag(report)
+        last_modified = formatdate(catalog.published.timestamp(), usegmt=True)
+        if self.headers.get('If-None-Match') == etag:
+            server.count('not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        server.count('listings')
+        self.send_body(200, page.encode(), 'text/html;charset=UTF-8', {'ETag': etag, 'Last-Modified': last_modified})
+
+    def serve_file(self, report: str, name: str):
+        server: MockIESOServer = self.server
+        data = server.catalog.body(report, name)
+        if data is None:
+            self.send_error_body(404, b'Not Found')
+            return
+
+        content_type = 'text/xml' if name.endswith('.xml') else 'text/csv'
+        match = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range', ''))
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(data) - 1
+            if start >= len(data):
+                self.send_error_body(416, b'Range Not Satisfiable', {'Content-Range': f"bytes */{len(data)}"})
+                return
+            end = min(end, len(data) - 1)
+            server.count('files')
+            server.count('bytes', end + 1 - start)
+            self.send_body(206, data[start:end + 1], content_type,
+                           {'Content-Range': f"bytes {start}-{end}/{len(data)}", 'Accept-Ranges': 'bytes'})
+            return
+
+        server.count('files')
+        server.count('bytes', len(data))
+        self.send_body(200, data, content_type, {'Accept-Ranges': 'bytes'})
+
+    def send_body(self, status: int, body: bytes, content_type: str, headers: Dict[str, str] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_body(self, status: int, body: bytes, headers: Dict[str, str] = None):
+        self.send_body(status, body, 'text/plain', headers)
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Serve mock IESO report listings and files")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--days', type=int, default=7, help="Days of synthesized hourly files (ending yesterday)")
+    parser.add_argument('--locations', type=int, default=100, help="Pricing locations per LMP file (size knob)")
+    parser.add_argument('--versions', type=int, default=1, help="Versions published per file")
+    parser.add_argument('--fixtures', default=None, help="Directory of recorded <Report>.html listings and files")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Added delay per request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Random extra delay per request")
+    parser.add_argument('--error-rate', type=float, default=0, help="Share of requests answered with 503")
+    parser.add_argument('--drop-rate', type=float, default=0, help="Share of connections dropped without a reply")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    yesterday = datetime.now() - timedelta(days=1)
+    catalog = Catalog(yesterday, args.days, args.locations, args.versions, args.fixtures)
+    server = MockIESOServer(catalog, args.port, args.latency_ms, args.jitter_ms, args.error_rate,
+                            args.drop_rate, args.seed)
+
+    print(f"🛰️  Mock IESO serving {len(REPORTS)} reports at {server.base_url}")
+    print(f"   export SCRAPER_IESO_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats}")
+
+if __name__ == "__main__":
+    main()
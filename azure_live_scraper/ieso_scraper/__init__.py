@@ -0,0 +1,6 @@
+"""
+IESO Live Scraper
+Fills gaps in the raw IESO datasets in Azure blob storage, driven by the specs in datasets.py.
+Run it with `python -m ieso_scraper` (or the `ieso-scraper` command once installed);
+ieso_scraper.runner.run_all_gap_fillers() is the entry point for the Azure Functions.
+"""
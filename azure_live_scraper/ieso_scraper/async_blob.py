@@ -0,0 +1,199 @@
+import asyncio
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from .blob_clients import ACCOUNT_NAME, ACCOUNT_KEY, CONNECTION_STRING, BLOB_MAX_CONCURRENCY, BLOCK_SIZE
+
+# Blob operations in flight at once per store (override with environment variables)
+ASYNC_BLOB_CONCURRENCY = int(os.environ.get('SCRAPER_ASYNC_BLOB_CONCURRENCY', '32'))
+
+if TYPE_CHECKING:
+    from azure.storage.blob.aio import BlobServiceClient, ContainerClient
+
+class AsyncBlobStore:
+    """asyncio access to one storage account with a bound on concurrent blob operations.
+
+    Use as an async context manager so the client and its connection pool are closed:
+
+        async with AsyncBlobStore() as store:
+            data, failed = await store.download_many('cleaned-data', names)
+
+    Credentials default to the scraper's (AZURE_STORAGE_CONNECTION_STRING, else
+    AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY or config.py); pass a connection string such as
+    "UseDevelopmentStorage=true" to run against the Azurite emulator.
+    """
+
+    def __init__(self, account_name: str = None, account_key: str = None, connection_string: str = None,
+                 concurrency: int = ASYNC_BLOB_CONCURRENCY):
+        self.account_name = account_name
+        self.account_key = account_key
+        self.connection_string = connection_string or (None if account_name else CONNECTION_STRING)
+        self.concurrency = concurrency
+        self._client: Optional['BlobServiceClient'] = None
+        self._containers: Dict[str, 'ContainerClient'] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncBlobStore':
+        import aiohttp
+        from azure.core.pipeline.transport import AioHttpTransport
+        from azure.storage.blob.aio import BlobServiceClient
+
+        # The session (and so the pool) belongs to the running event loop
+        self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.concurrency))
+        options = dict(transport=AioHttpTransport(session=self._session, session_owner=False),
+                       max_single_put_size=BLOCK_SIZE, max_block_size=BLOCK_SIZE)
+
+        if self.connection_string:
+            self._client = BlobServiceClient.from_connection_string(self.connection_string, **options)
+        else:
+            account_name = self.account_name or ACCOUNT_NAME
+            account_key = self.account_key or ACCOUNT_KEY
+            if not account_name or not account_key:
+                await self._session.close()
+                raise ValueError("Azure credentials missing: set AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY "
+                                 "(or AZURE_STORAGE_CONNECTION_STRING) or copy config_template.py to config.py")
+            self._client = BlobServiceClient(f"https://{account_name}.blob.core.windows.net",
+                                             credential=account_key, **options)
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.close()
+        await self._session.close()
+        self._containers.clear()
+
+    def container(self, container: str) -> 'ContainerClient':
+        """Client of one container, shared by every operation of this store"""
+        if container not in self._containers:
+            self._containers[container] = self._client.get_container_client(container)
+        return self._containers[container]
+
+    # --- SINGLE BLOBS ---
+
+    async def list_names(self, container: str, prefix: str = None) -> List[str]:
+        """Names of the blobs under a prefix"""
+        async with self._semaphore:
+            return [blob.name async for blob in self.container(container).list_blobs(name_starts_with=prefix)]
+
+    async def download(self, container: str, name: str) -> bytes:
+        """Whole content of one blob"""
+        async with self._semaphore:
+            stream = await self.container(container).download_blob(name, max_concurrency=BLOB_MAX_CONCURRENCY)
+            return await stream.readall()
+
+    async def download_to_file(self, container: str, name: str, local_path: str) -> int:
+        """Stream one blob to a local file chunk by chunk, returning bytes written.
+
+        The blob is written to a temp file next to local_path and moved into place once
+        complete, so a failed download never leaves a truncated file behind.
+        """
+        total = 0
+        async with self._semaphore:
+            stream = await self.container(container).download_blob(name)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local_path) or '.',
+                                            prefix=f".{os.path.basename(local_path)}.", suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    async for chunk in stream.chunks():
+                        f.write(chunk)
+                        total += len(chunk)
+                os.replace(tmp_path, local_path)
+            except BaseException:
+                # Also on cancellation
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        return total
+
+    async def upload(self, container: str, name: str, data: bytes, metadata: Dict[str, str] = None) -> int:
+        """Upload (overwrite) one blob, returning bytes written"""
+        async with self._semaphore:
+            await self.container(container).upload_blob(name, data, overwrite=True, metadata=metadata,
+                                                        max_concurrency=BLOB_MAX_CONCURRENCY)
+        return len(data)
+
+    async def exists(self, container: str, name: str) -> bool:
+        async with self._semaphore:
+            return await self.container(container).get_blob_client(name).exists()
+
+    # --- BATCHES (failures are collected, not raised) ---
+
+    async def _gather(self, names: List[str], coros) -> Tuple[Dict[str, object], Dict[str, Exception]]:
+        results, failed = {}, {}
+        for name, result in zip(names, await asyncio.gather(*coros, return_exceptions=True)):
+            if isinstance(result, Exception):
+                failed[name] = result
+            else:
+                results[name] = result
+        return results, failed
+
+    async def list_many(self, containers: Iterable[str], prefix: str = None
+                        ) -> Tuple[Dict[str, List[str]], Dict[str, Exception]]:
+        """List several containers at once"""
+        containers = list(containers)
+        return await self._gather(containers, [self.list_names(c, prefix) for c in containers])
+
+    async def download_many(self, container: str, names: Iterable[str]
+                            ) -> Tuple[Dict[str, bytes], Dict[str, Exception]]:
+        """Download many blobs concurrently: ({name: data}, {name: error})"""
+        names = list(names)
+        return await self._gather(names, [self.download(container, n) for n in names])
+
+    async def download_many_to_files(self, container: str, paths: Dict[str, str]
+                                     ) -> Tuple[Dict[str, int], Dict[str, Exception]]:
+        """Download many blobs concurrently to local files ({blob name: local path})"""
+        names = list(paths)
+        return await self._gather(names, [self.download_to_file(container, n, paths[n]) for n in names])
+
+    async def upload_many(self, container: str, blobs: Dict[str, bytes]
+                          ) -> Tuple[Dict[str, int], Dict[str, Exception]]:
+        """Upload many blobs concurrently ({name: data})"""
+        names = list(blobs)
+        return await self._gather(names, [self.upload(container, n, blobs[n]) for n in names])
+
+    async def exists_many(self, container: str, names: Iterable[str]) -> Dict[str, bool]:
+        """Existence of many blobs (a failed check counts as missing)"""
+        names = list(names)
+        found, _ = await self._gather(names, [self.exists(container, n) for n in names])
+        return {name: found.get(name, False) for name in names}
+
+# --- SYNCHRONOUS ENTRY POINTS (for scripts without an event loop) ---
+
+def list_containers(containers: Iterable[str], prefix: str = None, **store_options) -> Dict[str, List[str]]:
+    """List several containers concurrently; a container that fails to list maps to []"""
+    containers = list(containers)
+
+    async def run():
+        async with AsyncBlobStore(**store_options) as store:
+            listed, failed = await store.list_many(containers, prefix)
+            for container, error in failed.items():
+                print(f"❌ Error listing {container}: {error}")
+            return {c: listed.get(c, []) for c in containers}
+    return asyncio.run(run())
+
+def download_blobs(container: str, names: Iterable[str], **store_options
+                   ) -> Tuple[Dict[str, bytes], Dict[str, Exception]]:
+    """Download many blobs concurrently: ({name: data}, {name: error})"""
+    async def run():
+        async with AsyncBlobStore(**store_options) as store:
+            return await store.download_many(container, names)
+    return asyncio.run(run())
+
+def download_blobs_to_files(container: str, paths: Dict[str, str], **store_options
+                            ) -> Tuple[Dict[str, int], Dict[str, Exception]]:
+    """Download many blobs concurrently to local files ({blob name: local path})"""
+    async def run():
+        async with AsyncBlobStore(**store_options) as store:
+            return await store.download_many_to_files(container, paths)
+    return asyncio.run(run())
+
+def upload_blobs(container: str, blobs: Dict[str, bytes], **store_options
+                 ) -> Tuple[Dict[str, int], Dict[str, Exception]]:
+    """Upload many blobs concurrently ({name: data})"""
+    async def run():
+        async with AsyncBlobStore(**store_options) as store:
+            return await store.upload_many(container, blobs)
+    return asyncio.run(run())
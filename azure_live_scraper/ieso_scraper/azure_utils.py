@@ -0,0 +1,155 @@
+import base64
+from datetime import datetime
+from typing import List, Dict, Iterable, Callable, Optional, TYPE_CHECKING
+
+# Credentials and the shared client registry live in blob_clients (also used by the cleaners
+# and the ML orchestrator)
+from .blob_clients import get_container_client, RAW_CONTAINER, BLOB_MAX_CONCURRENCY, BLOCK_SIZE
+from .datasets import DATASETS
+
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobClient
+
+def upload_to_blob(data: bytes, blob_path: str, container: str = RAW_CONTAINER) -> bool:
+    """Upload data to Azure blob storage"""
+    try:
+        container_client = get_container_client(container)
+        container_client.upload_blob(name=blob_path, data=data, overwrite=True, max_concurrency=BLOB_MAX_CONCURRENCY)
+        print(f"✅ Uploaded: {blob_path} to {container}")
+        return True
+    except Exception as e:
+        print(f"❌ Upload failed for {blob_path}: {e}")
+        return False
+
+def stream_to_blob_client(blob_client: 'BlobClient', chunks: Iterable[bytes], block_size: int = BLOCK_SIZE,
+                          before_commit: Callable[[], Optional[Dict]] = None) -> int:
+    """Stage an iterable of chunks as blocks and commit them, returning bytes written.
+    
+    before_commit runs once the stream is exhausted and returns the blob metadata to
+    commit with, or None to abandon the upload (uncommitted blocks are discarded by Azure).
+    """
+    from azure.storage.blob import BlobBlock
+    
+    block_list = []
+    buffer = bytearray()
+    total = 0
+    
+    def stage(data: bytes):
+        # Block IDs must all be the same length within a blob
+        block_id = base64.b64encode(f"block-{len(block_list):08d}".encode()).decode()
+        blob_client.stage_block(block_id=block_id, data=data)
+        block_list.append(BlobBlock(block_id=block_id))
+    
+    for chunk in chunks:
+        buffer.extend(chunk)
+        total += len(chunk)
+        while len(buffer) >= block_size:
+            stage(bytes(buffer[:block_size]))
+            del buffer[:block_size]
+    
+    if buffer:
+        stage(bytes(buffer))
+    
+    metadata = {}
+    if before_commit:
+        metadata = before_commit()
+        if metadata is None:
+            return total
+    
+    if block_list:
+        blob_client.commit_block_list(block_list, metadata=metadata or None)
+    else:
+        blob_client.upload_blob(b"", overwrite=True, metadata=metadata or None)
+    
+    return total
+
+def get_blob_client(container: str, blob_path: str) -> 'BlobClient':
+    """Get a client for a single blob"""
+    return get_container_client(container).get_blob_client(blob_path)
+
+def upload_stream_to_blob(chunks: Iterable[bytes], blob_path: str, container: str = RAW_CONTAINER,
+                          before_commit: Callable[[], Optional[Dict]] = None) -> int:
+    """Upload a chunked stream to Azure blob storage using staged blocks"""
+    blob_client = get_blob_client(container, blob_path)
+    abandoned = []
+    
+    def commit_check() -> Optional[Dict]:
+        metadata = before_commit()
+        if metadata is None:
+            abandoned.append(blob_path)
+        return metadata
+    
+    total = stream_to_blob_client(blob_client, chunks, before_commit=commit_check if before_commit else None)
+    if not abandoned:
+        print(f"✅ Uploaded: {blob_path} to {container} ({total / 1024:.0f} KB)")
+    return total
+
+def list_blobs_in_path(container: str, path_prefix: str) -> List[str]:
+    """List all blobs in a specific path"""
+    try:
+        container_client = get_container_client(container)
+        
+        blob_names = []
+        for blob in container_client.list_blobs(name_starts_with=path_prefix):
+            blob_names.append(blob.name)
+        
+        return blob_names
+    except Exception as e:
+        print(f"❌ Error listing blobs in {container}/{path_prefix}: {e}")
+        return []
+
+def iter_blob_names(container: str, path_prefix: str) -> Iterable[str]:
+    """Yield blob names under a prefix, raising on errors (unlike list_blobs_in_path)"""
+    container_client = get_container_client(container)
+    for blob in container_client.list_blobs(name_starts_with=path_prefix):
+        yield blob.name
+
+def get_latest_processed_date(container: str, dataset: str) -> datetime:
+    """Get the latest date for which we have processed data"""
+    try:
+        import re
+        # Walk years newest first so only one year folder is normally listed
+        for year in range(datetime.now().year, 2019, -1):
+            blob_names = list_blobs_in_path(container, f"{dataset}/year={year}/")
+            
+            latest_date = None
+            
+            for blob_name in blob_names:
+                match = re.search(r'month=(\d{2})/day=(\d{2})', blob_name)
+                if match:
+                    month, day = int(match.group(1)), int(match.group(2))
+                    file_date = datetime(year, month, day)
+                    
+                    if latest_date is None or file_date > latest_date:
+                        latest_date = file_date
+            
+            if latest_date:
+                return latest_date
+        
+        return None
+    except Exception as e:
+        print(f"❌ Error getting latest date for {dataset}: {e}")
+        return None
+
+def build_blob_path(dataset: str, filename: str, file_date: datetime = None) -> str:
+    """Build standardized blob path for a file"""
+    if file_date is None:
+        from .scraper_utils import extract_date_from_filename
+        file_date = extract_date_from_filename(filename)
+    
+    if file_date is None:
+        file_date = datetime.now()
+    
+    # Build hierarchical path: daily folders for hourly reports, yearly for annual ones
+    if DATASETS.get(dataset, {}).get('granularity') == 'hourly':
+        return f"{dataset}/year={file_date.year}/month={file_date.month:02d}/day={file_date.day:02d}/{filename}"
+    else:
+        return f"{dataset}/year={file_date.year}/{filename}"
+
+def check_blob_exists(blob_path: str, container: str) -> bool:
+    """Check if a blob already exists"""
+    try:
+        get_blob_client(container, blob_path).get_blob_properties()
+        return True
+    except Exception:
+        return False 
\ No newline at end of file
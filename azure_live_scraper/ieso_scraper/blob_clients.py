@@ -0,0 +1,99 @@
+import os
+import threading
+from typing import Dict, Tuple, TYPE_CHECKING
+
+# Credentials: environment variables (Azure Functions app settings) take precedence
+# over a local config.py (copied from config_template.py for command-line runs)
+try:
+    import config
+except ImportError:
+    config = None
+
+ACCOUNT_NAME = os.environ.get('AZURE_STORAGE_ACCOUNT') or getattr(config, 'ACCOUNT_NAME', None)
+ACCOUNT_KEY = os.environ.get('AZURE_STORAGE_KEY') or getattr(config, 'ACCOUNT_KEY', None)
+RAW_CONTAINER = getattr(config, 'RAW_CONTAINER', 'raw-data')
+CLEANED_CONTAINER = getattr(config, 'CLEANED_CONTAINER', 'cleaned-data')
+# A connection string replaces the account name/key, e.g. "UseDevelopmentStorage=true" for Azurite
+CONNECTION_STRING = os.environ.get('AZURE_STORAGE_CONNECTION_STRING')
+
+# Transport tuning (override with environment variables)
+BLOB_POOL_SIZE = int(os.environ.get('SCRAPER_BLOB_POOL_SIZE', '32'))
+BLOB_MAX_CONCURRENCY = int(os.environ.get('SCRAPER_BLOB_MAX_CONCURRENCY', '4'))
+# Staged block size; uploads larger than one block are split and sent max_concurrency at a time
+BLOCK_SIZE = int(os.environ.get('SCRAPER_BLOCK_SIZE_MB', '4')) * 1024 * 1024
+
+# The Azure SDK is the most expensive import on the cold-start path, so it is
+# only loaded when the first client is needed
+if TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient, ContainerClient
+
+# One service client per account and one container client per (account, container),
+# shared by every thread in the process so connections and auth setup are reused
+_service_clients: Dict[str, 'BlobServiceClient'] = {}
+_container_clients: Dict[Tuple[str, str], 'ContainerClient'] = {}
+_client_lock = threading.Lock()
+
+def _build_transport():
+    """Requests transport whose keep-alive pool is sized for the transfer threads"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from azure.core.pipeline.transport import RequestsTransport
+
+    # Retries are left to the SDK's own retry policy, as in the default transport
+    adapter = HTTPAdapter(
+        pool_connections=BLOB_POOL_SIZE,
+        pool_maxsize=BLOB_POOL_SIZE,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+def _registry_key(account_name: str = None) -> str:
+    """Registry key of an account; the configured connection string counts as one account"""
+    if account_name:
+        return account_name
+    return 'connection-string' if CONNECTION_STRING else ACCOUNT_NAME
+
+def get_blob_service_client(account_name: str = None, account_key: str = None) -> 'BlobServiceClient':
+    """Get the shared Blob Service Client of an account (default: the configured one), created on first use"""
+    key = _registry_key(account_name)
+    client = _service_clients.get(key)
+
+    if client is None:
+        with _client_lock:
+            client = _service_clients.get(key)
+            if client is None:
+                from azure.storage.blob import BlobServiceClient
+                options = dict(transport=_build_transport(), max_single_put_size=BLOCK_SIZE, max_block_size=BLOCK_SIZE)
+
+                if key == 'connection-string':
+                    client = BlobServiceClient.from_connection_string(CONNECTION_STRING, **options)
+                else:
+                    account_key = account_key or ACCOUNT_KEY
+                    if not key or not account_key:
+                        raise ValueError("Azure credentials missing: set AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY "
+                                         "(or AZURE_STORAGE_CONNECTION_STRING) or copy config_template.py to config.py")
+                    client = BlobServiceClient(f"https://{key}.blob.core.windows.net", credential=account_key,
+                                               **options)
+                _service_clients[key] = client
+
+    return client
+
+def get_container_client(container: str, account_name: str = None, account_key: str = None) -> 'ContainerClient':
+    """Get the shared client of one container (reuses the account's connection pool)"""
+    key = (_registry_key(account_name), container)
+    client = _container_clients.get(key)
+
+    if client is None:
+        service_client = get_blob_service_client(account_name, account_key)
+        with _client_lock:
+            client = _container_clients.setdefault(key, service_client.get_container_client(container))
+
+    return client
+
+def blob_client_stats() -> Dict[str, int]:
+    """Number of cached clients (for logging: should stay at one per account/container)"""
+    return {'service_clients': len(_service_clients), 'container_clients': len(_container_clients)}
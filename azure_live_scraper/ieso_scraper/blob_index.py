@@ -0,0 +1,78 @@
+import os
+import threading
+from typing import List, Iterable
+
+from .azure_utils import iter_blob_names, check_blob_exists
+
+def covering_prefixes(blob_paths: Iterable[str]) -> List[str]:
+    """Smallest set of listing prefixes (at most one per month or year folder) covering the paths"""
+    groups = {}
+
+    for path in blob_paths:
+        directory = path.rsplit('/', 1)[0] + '/'
+        # Daily partitions are grouped by their month folder, annual files by their year folder
+        parent = directory.rsplit('/', 2)[0] + '/' if '/day=' in directory else directory
+        groups.setdefault(parent, set()).add(directory)
+
+    return sorted(os.path.commonprefix(sorted(dirs)) for dirs in groups.values())
+
+class BlobIndex:
+    """In-memory set of existing blob names under a few prefixes, built from list_blobs"""
+
+    def __init__(self, container: str, prefixes: Iterable[str]):
+        self.container = container
+        self.prefixes = sorted(set(prefixes))
+        self.listing_calls = 0
+        self.fallback_checks = 0
+        self.loaded = False
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> 'BlobIndex':
+        """List every prefix once; on failure the index falls back to per-blob checks"""
+        names = set()
+        try:
+            for prefix in self.prefixes:
+                with self._lock:
+                    self.listing_calls += 1
+                names.update(iter_blob_names(self.container, prefix))
+        except Exception as e:
+            print(f"⚠️  Blob index listing failed for {self.container}, using per-file checks: {e}")
+            return self
+
+        with self._lock:
+            self._names |= names
+            self.loaded = True
+
+        print(f"🗂️  Indexed {len(names)} existing blobs in {self.container} "
+              f"with {self.listing_calls} listing call(s)")
+        return self
+
+    def covers(self, blob_path: str) -> bool:
+        return self.loaded and any(blob_path.startswith(prefix) for prefix in self.prefixes)
+
+    def exists(self, blob_path: str) -> bool:
+        if self.covers(blob_path):
+            with self._lock:
+                return blob_path in self._names
+
+        # Transfer workers share the index: count under the lock
+        with self._lock:
+            self.fallback_checks += 1
+        return check_blob_exists(blob_path, self.container)
+
+    def add(self, blob_path: str):
+        """Record a blob written during this run so the index stays fresh"""
+        with self._lock:
+            self._names.add(blob_path)
+
+    def __contains__(self, blob_path: str) -> bool:
+        return self.exists(blob_path)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+def build_blob_index(container: str, blob_paths: Iterable[str]) -> BlobIndex:
+    """Build an existence index covering the given candidate blob paths"""
+    blob_paths = list(blob_paths)
+    return BlobIndex(container, covering_prefixes(blob_paths)).load()
@@ -0,0 +1,311 @@
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .blob_clients import get_container_client, RAW_CONTAINER, CLEANED_CONTAINER, BLOB_MAX_CONCURRENCY
+from .cleaned_format import output_extensions
+
+# Staged download -> parse -> upload pipeline for the cleaning scripts (azure_push_clean/).
+# Downloads and uploads run on I/O threads, parsing on a process pool; bounded queues
+# between the stages keep memory flat and let network and CPU work overlap. Raw blobs
+# are spooled to local files between download and parse, never held whole in memory.
+
+# Tunables (override with environment variables)
+CLEAN_IO_WORKERS = int(os.environ.get('SCRAPER_CLEAN_IO_WORKERS', '8'))
+CLEAN_PARSE_WORKERS = int(os.environ.get('SCRAPER_CLEAN_PARSE_WORKERS', str(os.cpu_count() or 1)))
+# Blobs waiting between two stages
+CLEAN_QUEUE_SIZE = int(os.environ.get('SCRAPER_CLEAN_QUEUE_SIZE', '16'))
+# Directory the raw blobs are spooled to (default: the system temp directory)
+CLEAN_SPOOL_DIR = os.environ.get('SCRAPER_CLEAN_SPOOL_DIR') or None
+SPOOL_READ_SIZE = 1024 * 1024
+# Only clean raw blobs whose lineage differs from their cleaned output's
+CLEAN_INCREMENTAL = os.environ.get('SCRAPER_CLEAN_INCREMENTAL', 'true').lower() == 'true'
+
+# A clean function takes (raw blob name, raw blob as a binary file) and returns
+# ({extension: cleaned bytes}, log lines), or None to leave the blob out;
+# cleaned_format.encode() builds the outputs. Read the file incrementally (iter_chunks)
+# or hand it to a reader such as pandas. It runs in a worker process, so it must be a
+# module-level function of an importable module/script.
+CleanResult = Tuple[Dict[str, bytes], List[str]]
+CleanFunction = Callable[[str, BinaryIO], Optional[CleanResult]]
+
+# Lineage metadata written on every cleaned blob: the raw version it was made from
+SOURCE_ETAG_KEY = 'source_etag'
+SOURCE_MODIFIED_KEY = 'source_last_modified'
+CLEANER_VERSION_KEY = 'cleaner_version'
+
+_DONE = object()
+
+class CleanReport:
+    """Aggregate result of one cleaning run"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.skipped = 0
+        self.unchanged = 0
+        self.failures: Dict[str, str] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.started_at = time.time()
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def add(self, status: str, blob_name: str = None, error: Exception = None, bytes_in: int = 0,
+            bytes_out: int = 0):
+        with self._lock:
+            if status == 'processed':
+                self.processed += 1
+            elif status == 'skipped':
+                self.skipped += 1
+            elif status == 'unchanged':
+                self.unchanged += 1
+            else:
+                self.failures[blob_name] = str(error) or type(error).__name__
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+
+    def finish(self):
+        self.finished_at = time.time()
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    def print_summary(self):
+        files = self.processed + self.skipped + self.failed
+        print(f"\n🎉 {self.name} cleaning complete!")
+        print(f"✅ Successfully processed: {self.processed} files ({self.skipped} left out)")
+        if self.unchanged:
+            print(f"♻️  Unchanged since last cleaned: {self.unchanged} files")
+        if self.failures:
+            print(f"❌ Errors: {self.failed} files")
+            for blob_name, error in self.failures.items():
+                print(f"   • {blob_name}: {error}")
+        print(f"⏱️  {self.elapsed:.1f}s, {files / max(self.elapsed, 1e-9):.1f} files/s, "
+              f"{self.bytes_in / 1024 / 1024:.1f} MB in, {self.bytes_out / 1024 / 1024:.1f} MB out")
+
+def lineage_metadata(etag: str, last_modified, cleaner_version: str) -> Dict[str, str]:
+    """Metadata recording which raw blob version (and cleaner version) produced a cleaned blob"""
+    return {
+        SOURCE_ETAG_KEY: (etag or '').strip('"'),
+        SOURCE_MODIFIED_KEY: last_modified.isoformat() if last_modified else '',
+        CLEANER_VERSION_KEY: cleaner_version
+    }
+
+def load_lineage(prefix: str, container: str = CLEANED_CONTAINER) -> Dict[str, Dict[str, str]]:
+    """Lineage of every cleaned blob under a prefix, from one metadata listing"""
+    client = get_container_client(container)
+    return {blob.name: blob.metadata or {}
+            for blob in client.list_blobs(name_starts_with=prefix, include=['metadata'])}
+
+def is_current(lineage: Optional[Dict[str, str]], source: Dict[str, str]) -> bool:
+    """Whether a cleaned blob was made from this raw version by this cleaner version"""
+    if not lineage or lineage.get(CLEANER_VERSION_KEY) != source[CLEANER_VERSION_KEY]:
+        return False
+    if lineage.get(SOURCE_ETAG_KEY) and source[SOURCE_ETAG_KEY]:
+        return lineage[SOURCE_ETAG_KEY] == source[SOURCE_ETAG_KEY]
+    return bool(source[SOURCE_MODIFIED_KEY]) and lineage.get(SOURCE_MODIFIED_KEY) == source[SOURCE_MODIFIED_KEY]
+
+class _InlineExecutor:
+    """Runs submitted work in the calling thread (parse_workers <= 1)"""
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+def iter_chunks(raw: BinaryIO, size: int = SPOOL_READ_SIZE) -> Iterator[bytes]:
+    """Bounded chunks of a raw blob file, for incremental parsers"""
+    return iter(lambda: raw.read(size), b'')
+
+def _clean_spooled(clean: CleanFunction, blob_name: str, path: str) -> Optional[CleanResult]:
+    """Run a clean function on a spooled raw blob; runs in a worker process"""
+    with open(path, 'rb') as raw:
+        return clean(blob_name, raw)
+
+def _discard(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def cleaned_stem(blob_name: str) -> str:
+    """Cleaned blob name of a raw blob, without the output extension"""
+    return os.path.splitext(blob_name)[0]
+
+def run_clean_pipeline(prefix: str, clean: CleanFunction, name: str = "Cleaning", suffix: str = '',
+                       cleaner_version: str = '1', incremental: bool = CLEAN_INCREMENTAL,
+                       extensions: List[str] = None,
+                       source_container: str = RAW_CONTAINER, target_container: str = CLEANED_CONTAINER,
+                       io_workers: int = CLEAN_IO_WORKERS, parse_workers: int = CLEAN_PARSE_WORKERS,
+                       queue_size: int = CLEAN_QUEUE_SIZE) -> CleanReport:
+    """Download, clean and upload every raw blob under prefix (ending in suffix), with each stage
+    running concurrently.
+
+    The listing is paged lazily, so blobs start downloading before it finishes. Each cleaned
+    output is named after the raw blob with its extension swapped for the output's (one per
+    entry of extensions, default: cleaned_format.output_extensions()) and records the raw
+    blob's ETag and last-modified time plus cleaner_version as metadata. In incremental
+    mode, blobs whose cleaned outputs all carry the same lineage are skipped; bump
+    cleaner_version when the cleaning logic changes. A blob that fails at any stage is
+    recorded in the report and the rest carry on.
+    """
+    extensions = extensions or output_extensions()
+    report = CleanReport(name)
+    spool_dir = tempfile.mkdtemp(prefix='ieso-clean-', dir=CLEAN_SPOOL_DIR)
+    source = get_container_client(source_container)
+    target = get_container_client(target_container)
+
+    download_q = queue.Queue(queue_size)
+    parse_q = queue.Queue(queue_size)
+    # Bounds the blobs submitted to the pool but not yet collected
+    parsing_q = queue.Queue(max(1, parse_workers) * 2)
+    upload_q = queue.Queue(queue_size)
+
+    # Spawned workers do not inherit the I/O threads' locks, whatever the platform default
+    pool = (ProcessPoolExecutor(parse_workers, mp_context=multiprocessing.get_context('spawn'))
+            if parse_workers > 1 else _InlineExecutor())
+
+    downloaders_left = [io_workers]
+    downloaders_lock = threading.Lock()
+
+    def changed_blobs() -> Iterator[str]:
+        """Raw blobs to clean; needs only the two listings, no per-blob requests"""
+        lineage = load_lineage(prefix, target_container) if incremental else {}
+        if incremental:
+            print(f"🧬 Loaded lineage of {len(lineage)} cleaned blobs under {prefix}")
+        for blob in source.list_blobs(name_starts_with=prefix):
+            if not blob.name.endswith(suffix):
+                continue
+            listed = lineage_metadata(blob.etag, blob.last_modified, cleaner_version)
+            if incremental and all(is_current(lineage.get(cleaned_stem(blob.name) + extension), listed)
+                                   for extension in extensions):
+                report.add('unchanged', blob.name)
+                continue
+            yield blob.name
+
+    def feed():
+        try:
+            for blob_name in changed_blobs():
+                download_q.put(blob_name)
+        except Exception as e:
+            print(f"❌ Listing failed: {e}")
+            report.add('failed', '<listing>', e)
+        finally:
+            for _ in range(io_workers):
+                download_q.put(_DONE)
+
+    def download():
+        while True:
+            blob_name = download_q.get()
+            if blob_name is _DONE:
+                break
+            print(f"📥 {blob_name}")
+            fd, path = tempfile.mkstemp(dir=spool_dir, suffix=os.path.splitext(blob_name)[1])
+            try:
+                # Written to the spool file block by block, so the blob is never held in memory
+                with os.fdopen(fd, 'wb') as spool:
+                    stream = source.download_blob(blob_name, max_concurrency=BLOB_MAX_CONCURRENCY)
+                    size = stream.readinto(spool)
+                # Lineage of the version actually downloaded, not the listed one
+                metadata = lineage_metadata(stream.properties.etag, stream.properties.last_modified,
+                                            cleaner_version)
+                parse_q.put((blob_name, path, size, metadata))
+            except Exception as e:
+                _discard(path)
+                print(f"❌ Download failed: {blob_name} — {e}")
+                report.add('failed', blob_name, e)
+
+        # The last downloader to finish closes the parse stage
+        with downloaders_lock:
+            downloaders_left[0] -= 1
+            if downloaders_left[0] == 0:
+                parse_q.put(_DONE)
+
+    def dispatch():
+        while True:
+            item = parse_q.get()
+            if item is _DONE:
+                break
+            blob_name, path, size, metadata = item
+            try:
+                future = pool.submit(_clean_spooled, clean, blob_name, path)
+                parsing_q.put((blob_name, path, size, metadata, future))
+            except Exception as e:
+                _discard(path)
+                report.add('failed', blob_name, e)
+        parsing_q.put(_DONE)
+
+    def collect():
+        while True:
+            item = parsing_q.get()
+            if item is _DONE:
+                break
+            blob_name, path, size, metadata, future = item
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Failed: {blob_name} — {e}")
+                report.add('failed', blob_name, e, bytes_in=size)
+                continue
+            finally:
+                _discard(path)
+            if result is None:
+                report.add('skipped', blob_name, bytes_in=size)
+            else:
+                upload_q.put((blob_name, size, metadata, result))
+        for _ in range(io_workers):
+            upload_q.put(_DONE)
+
+    def upload():
+        while True:
+            item = upload_q.get()
+            if item is _DONE:
+                break
+            blob_name, size, metadata, (outputs, log_lines) = item
+            for line in log_lines:
+                print(line)
+            try:
+                for extension, payload in outputs.items():
+                    cleaned_name = cleaned_stem(blob_name) + extension
+                    print(f"⏫ Uploading cleaned → {cleaned_name}")
+                    target.upload_blob(name=cleaned_name, data=payload, overwrite=True, metadata=metadata,
+                                       max_concurrency=BLOB_MAX_CONCURRENCY)
+                report.add('processed', blob_name, bytes_in=size,
+                           bytes_out=sum(len(payload) for payload in outputs.values()))
+            except Exception as e:
+                print(f"❌ Upload failed: {cleaned_name} — {e}")
+                report.add('failed', blob_name, e, bytes_in=size)
+
+    stages = [(feed, 1), (download, io_workers), (dispatch, 1), (collect, 1), (upload, io_workers)]
+    threads = [threading.Thread(target=target_fn, name=f"clean-{target_fn.__name__}-{i}", daemon=True)
+               for target_fn, count in stages for i in range(count)]
+
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.shutdown(wait=True)
+        shutil.rmtree(spool_dir, ignore_errors=True)
+        report.finish()
+
+    return report
@@ -0,0 +1,135 @@
+"""
+Cleaned Format
+Per-dataset schemas and file formats of the cleaned-data container: typed, compressed
+Parquet by default, with CSV kept as an optional compatibility export
+"""
+
+import os
+from io import BytesIO
+from typing import Dict, Iterable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Tunables (override with environment variables)
+# Primary format of cleaned outputs: 'parquet' or 'csv'
+CLEANED_FORMAT = os.environ.get('SCRAPER_CLEANED_FORMAT', 'parquet').lower()
+# Also write a CSV next to each Parquet output, for consumers not migrated yet
+CLEANED_CSV_EXPORT = os.environ.get('SCRAPER_CLEANED_CSV_EXPORT', 'false').lower() == 'true'
+PARQUET_COMPRESSION = os.environ.get('SCRAPER_PARQUET_COMPRESSION', 'zstd')
+# Rows per row group; each row group carries min/max statistics per column
+PARQUET_ROW_GROUP_ROWS = int(os.environ.get('SCRAPER_PARQUET_ROW_GROUP_ROWS', '131072'))
+
+EXTENSIONS = {'parquet': '.parquet', 'csv': '.csv'}
+
+# Column types of each cleaned dataset, in output order:
+#   timestamp - timestamp[ms], category - dictionary-encoded string, string,
+#   int8 / int16 / int32, float32 / float64
+SCHEMAS = {
+    'EnergyLMP': [
+        ('delivery_hour', 'int8'),
+        ('interval', 'int8'),
+        ('pricing_location', 'category'),
+        ('lmp', 'float32'),
+        ('energy_loss_price', 'float32'),
+        ('energy_congestion_price', 'float32'),
+        ('timestamp', 'timestamp'),
+    ],
+    'IntertieLMP': [
+        ('timestamp', 'timestamp'),
+        ('intertie_name', 'category'),
+        ('location', 'category'),
+        ('connection', 'category'),
+        ('code', 'category'),
+        ('interval_set', 'int8'),
+        ('interval', 'int8'),
+        ('lmp_value', 'float32'),
+        ('flag', 'category'),
+    ],
+    'GenMix': [
+        ('timestamp', 'timestamp'),
+        ('fuel', 'category'),
+        ('output', 'float32'),
+        ('output_quality', 'int8'),
+    ],
+}
+
+def _arrow_type(name: str) -> 'pa.DataType':
+    import pyarrow as pa
+
+    if name == 'timestamp':
+        return pa.timestamp('ms')
+    if name == 'category':
+        return pa.dictionary(pa.int32(), pa.string())
+    return getattr(pa, name)()
+
+def arrow_schema(dataset: str) -> 'pa.Schema':
+    """Arrow schema of a cleaned dataset"""
+    import pyarrow as pa
+
+    if dataset not in SCHEMAS:
+        raise ValueError(f"No cleaned schema for {dataset}; add it to SCHEMAS")
+    return pa.schema([(column, _arrow_type(kind)) for column, kind in SCHEMAS[dataset]],
+                     metadata={'dataset': dataset})
+
+def output_extensions(fmt: str = CLEANED_FORMAT, csv_export: bool = CLEANED_CSV_EXPORT) -> List[str]:
+    """File extensions written for every cleaned blob, primary format first"""
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"Unknown cleaned format '{fmt}' (expected one of {', '.join(EXTENSIONS)})")
+    extensions = [EXTENSIONS[fmt]]
+    if csv_export and fmt != 'csv':
+        extensions.append(EXTENSIONS['csv'])
+    return extensions
+
+def to_parquet(df: 'pd.DataFrame', dataset: str) -> bytes:
+    """Parquet bytes of a cleaned DataFrame, cast to the dataset's schema"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Categoricals get sorted dictionaries, so readers sort these columns as strings
+    categories = [column for column, kind in SCHEMAS.get(dataset, []) if kind == 'category']
+    df = df.astype({column: 'category' for column in categories})
+    table = pa.Table.from_pandas(df, schema=arrow_schema(dataset), preserve_index=False)
+    buffer = BytesIO()
+    pq.write_table(table, buffer, compression=PARQUET_COMPRESSION, row_group_size=PARQUET_ROW_GROUP_ROWS,
+                   write_statistics=True)
+    return buffer.getvalue()
+
+def to_csv(df: 'pd.DataFrame') -> bytes:
+    buffer = BytesIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+def encode(df: 'pd.DataFrame', dataset: str, extensions: List[str] = None) -> Dict[str, bytes]:
+    """Cleaned outputs of a DataFrame ({extension: bytes}) in every configured format"""
+    encoders = {'.parquet': lambda: to_parquet(df, dataset), '.csv': lambda: to_csv(df)}
+    return {extension: encoders[extension]() for extension in extensions or output_extensions()}
+
+def is_cleaned_file(name: str) -> bool:
+    return name.endswith(tuple(EXTENSIONS.values()))
+
+def preferred_files(names: Iterable[str]) -> List[str]:
+    """Cleaned files, one per output (Parquet over its CSV export), sorted by name"""
+    chosen = {}
+    for name in names:
+        if not is_cleaned_file(name):
+            continue
+        stem, extension = os.path.splitext(name)
+        if stem not in chosen or extension == EXTENSIONS['parquet']:
+            chosen[stem] = name
+    return [chosen[stem] for stem in sorted(chosen)]
+
+def read_cleaned(data: bytes, name: str) -> 'pd.DataFrame':
+    """DataFrame of a cleaned file, read by its extension"""
+    import pandas as pd
+
+    if name.endswith(EXTENSIONS['parquet']):
+        return pd.read_parquet(BytesIO(data))
+    return pd.read_csv(BytesIO(data))
+
+def duckdb_scan(path: str) -> str:
+    """DuckDB table function reading a cleaned file (Parquet keeps its types, CSV is sniffed)"""
+    if path.endswith(EXTENSIONS['parquet']):
+        return f"read_parquet('{path}')"
+    return f"read_csv_auto('{path}')"
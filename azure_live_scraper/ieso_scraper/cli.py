@@ -0,0 +1,52 @@
+"""
+IESO Gap Filler
+Scrapes missing IESO files from the public reports site and uploads them to Azure
+"""
+
+import argparse
+import sys
+
+from .datasets import DATASETS
+from .runner import run_all_gap_fillers
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(prog='ieso-scraper', description=__doc__.strip().split('\n')[0])
+    parser.add_argument('datasets', nargs='*', help=f"Datasets to fill (default: all of {', '.join(DATASETS)})")
+    parser.add_argument('--parallel', action='store_true', help="Run independent datasets concurrently")
+    parser.add_argument('--deadline', type=float, default=None, help="Overall deadline in seconds")
+    parser.add_argument('--only-if-changed', action='store_true',
+                        help="Skip files whose content matches an already stored blob")
+    parser.add_argument('--hourly', action='store_true',
+                        help="Only run EnergyLMP/IntertieLMP, fetching hours newer than the hour watermark")
+    parser.add_argument('--delta', action='store_true',
+                        help="Fetch only the days appended to the annual GenMix/Demand/DemandZonal files")
+    parser.add_argument('--scheduled', action='store_true',
+                        help="Only poll datasets whose next publication is expected (learned from past runs)")
+    args = parser.parse_args()
+    
+    unknown = [name for name in args.datasets if name not in DATASETS]
+    if unknown:
+        parser.error(f"unknown dataset(s): {', '.join(unknown)}")
+    
+    try:
+        results = run_all_gap_fillers(parallel=args.parallel, deadline_seconds=args.deadline,
+                                      only_if_changed=args.only_if_changed or None, hourly=args.hourly,
+                                      delta=args.delta or None, datasets=args.datasets or None,
+                                      scheduled=args.scheduled)
+        
+        # Exit with error code if any dataset failed
+        failed_datasets = [name for name, result in results.items() if result['status'] not in ('success', 'skipped')]
+        if failed_datasets:
+            print(f"\n⚠️  Some datasets failed: {', '.join(failed_datasets)}")
+            sys.exit(1)
+        else:
+            print("\n🎉 All datasets processed successfully!")
+            sys.exit(0)
+        
+    except Exception as e:
+        print(f"❌ Fatal error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
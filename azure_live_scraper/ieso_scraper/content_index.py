@@ -0,0 +1,98 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Iterable, Iterator, Optional
+
+from .state_store import load_state, update_state
+
+# Skip writing files whose content is already stored under another name
+ONLY_IF_CHANGED = os.environ.get('SCRAPER_ONLY_IF_CHANGED', 'false').lower() == 'true'
+# Hashes kept per dataset; the oldest are dropped first
+MAX_ENTRIES = int(os.environ.get('SCRAPER_CONTENT_INDEX_MAX', '20000'))
+
+HASH_METADATA_KEY = 'content_sha256'
+
+def _index_key(dataset: str) -> str:
+    return f"{dataset}.content"
+
+class HashingStream:
+    """Pass chunks through while computing their SHA-256"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = chunks
+        self._sha = hashlib.sha256()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self._sha.update(chunk)
+            yield chunk
+
+    def hexdigest(self) -> str:
+        return self._sha.hexdigest()
+
+class ContentIndex:
+    """Content hash -> blob path index for one dataset, persisted in the state store"""
+
+    def __init__(self, dataset: str):
+        self.dataset = dataset
+        self.hashes = {}
+        self.duplicates = {}
+        self._new_hashes = {}
+        self._new_duplicates = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'ContentIndex':
+        state = load_state(_index_key(self.dataset))
+        self.hashes = state.get('hashes', {})
+        self.duplicates = state.get('duplicates', {})
+        return self
+
+    def is_duplicate(self, blob_path: str) -> bool:
+        """True if this path was previously skipped as a copy of another blob"""
+        with self._lock:
+            return blob_path in self.duplicates
+
+    def find_duplicate(self, digest: str, blob_path: str, only_if_changed: bool = False) -> Optional[str]:
+        """Existing blob path holding this content if the upload should be skipped, else None"""
+        with self._lock:
+            original = self.hashes.get(digest)
+            if only_if_changed and original and original != blob_path:
+                self.duplicates[blob_path] = original
+                self._new_duplicates[blob_path] = original
+                return original
+            return None
+
+    def record(self, digest: str, blob_path: str):
+        """Register content for a path; call it only once the blob is committed"""
+        with self._lock:
+            self.hashes[digest] = blob_path
+            self._new_hashes[digest] = blob_path
+
+    def save(self):
+        """Merge hashes recorded during this run into the stored index"""
+        with self._lock:
+            new_hashes, new_duplicates = dict(self._new_hashes), dict(self._new_duplicates)
+            self._new_hashes, self._new_duplicates = {}, {}
+
+        if not new_hashes and not new_duplicates:
+            return
+
+        def apply(state: Dict):
+            hashes = state.setdefault('hashes', {})
+            duplicates = state.setdefault('duplicates', {})
+            for digest, blob_path in new_hashes.items():
+                # Re-insert so recently seen content is dropped last
+                hashes.pop(digest, None)
+                hashes[digest] = blob_path
+            duplicates.update(new_duplicates)
+            for table in (hashes, duplicates):
+                for key in list(table)[:max(0, len(table) - MAX_ENTRIES)]:
+                    del table[key]
+
+        try:
+            update_state(_index_key(self.dataset), apply)
+        except Exception as e:
+            print(f"⚠️  Could not save content index for {self.dataset}: {e}")
+
+def load_content_index(dataset: str) -> ContentIndex:
+    return ContentIndex(dataset).load()
@@ -0,0 +1,58 @@
+import os
+
+# Root of the public IESO reports (point it at a local mock server for offline runs)
+IESO_BASE_URL = os.environ.get('SCRAPER_IESO_BASE_URL', "https://reports-public.ieso.ca/public/").rstrip('/') + '/'
+
+# One entry per IESO report. The gap filler, the runner and the backfill engine are
+# all driven by these specs, so adding a dataset means adding an entry here.
+#
+# granularity:
+#   'hourly' - one file per delivery hour (PUB_<Report>_YYYYMMDDHH[_vN]), stored per day
+#   'annual' - one growing file per year (PUB_<Report>_YYYY[_vN]), stored per year
+# options: keyword options the dataset's gap filler accepts (see gap_filler.scrape_gap)
+DATASETS = {
+    'EnergyLMP': {
+        'url': f"{IESO_BASE_URL}RealtimeEnergyLMP/",
+        'pattern': r'^PUB_RealtimeEnergyLMP_\d{10}(_v\d+)?\.csv$',
+        'granularity': 'hourly',
+        'description': 'Hourly energy pricing data (CSV)',
+        'priority': 1,
+        'options': ('only_if_changed', 'hourly')
+    },
+    'IntertieLMP': {
+        'url': f"{IESO_BASE_URL}RealTimeIntertieLMP/",
+        'pattern': r'^PUB_RealTimeIntertieLMP_\d{10}(_v\d+)?\.xml$',
+        'granularity': 'hourly',
+        'description': 'Cross-border pricing data (XML)',
+        'priority': 2,
+        'options': ('only_if_changed', 'hourly')
+    },
+    'GenMix': {
+        'url': f"{IESO_BASE_URL}GenOutputbyFuelHourly/",
+        'pattern': r'^PUB_GenOutputbyFuelHourly_\d{4}(_v\d+)?\.xml$',
+        'granularity': 'annual',
+        'description': 'Generation by fuel type (XML)',
+        'priority': 3,
+        'options': ('only_if_changed', 'delta')
+    },
+    'Demand': {
+        'url': f"{IESO_BASE_URL}Demand/",
+        'pattern': r'^PUB_Demand_\d{4}(_v\d+)?\.csv$',
+        'granularity': 'annual',
+        'description': 'Provincial demand data (CSV)',
+        'priority': 4,
+        'options': ('only_if_changed', 'delta')
+    },
+    'DemandZonal': {
+        'url': f"{IESO_BASE_URL}DemandZonal/",
+        'pattern': r'^PUB_DemandZonal_\d{4}(_v\d+)?\.csv$',
+        'granularity': 'annual',
+        'description': 'Zonal demand data (CSV)',
+        'priority': 5,
+        'options': ('only_if_changed', 'delta')
+    }
+}
+
+def file_type(dataset: str) -> str:
+    """CSV or XML, for log messages"""
+    return DATASETS[dataset]['pattern'].rsplit('.', 1)[-1].rstrip('$').upper()
@@ -0,0 +1,253 @@
+import itertools
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .scraper_utils import http_get, extract_year_version, DOWNLOAD_CHUNK_SIZE
+from .azure_utils import upload_to_blob, upload_stream_to_blob, build_blob_path
+from .state_store import get_delta_cursor, set_delta_cursor
+from .transfer_engine import TransferReport, DEFAULT_MAX_WORKERS
+
+# Annual files (GenMix, Demand, DemandZonal) grow by a few days per version.
+# In delta mode only the appended days are fetched and stored as daily partitions.
+DELTA_INGEST = os.environ.get('SCRAPER_DELTA_INGEST', 'false').lower() == 'true'
+# Also store every full version (as the regular gap fill does)
+KEEP_FULL_FILE = os.environ.get('SCRAPER_DELTA_KEEP_FULL', 'false').lower() == 'true'
+# Bytes before the resume offset re-fetched to check the new version still lines up
+ANCHOR_BYTES = 256
+
+_CSV_DAY_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2}),', re.MULTILINE)
+_CSV_HEADER_RE = re.compile(rb'^Date,Hour,[^\r\n]*\r?\n', re.MULTILINE)
+_XML_DAY_RE = re.compile(rb'<DailyData>\s*<Day>(\d{4}-\d{2}-\d{2})</Day>')
+_XML_ROOT_RE = re.compile(rb'<Document\b[^>]*>')
+
+def _split_csv(data: bytes) -> List[Tuple[str, int, int]]:
+    """(day, start, end) byte spans of consecutive rows per day in an IESO CSV"""
+    spans = []
+    for match in _CSV_DAY_RE.finditer(data):
+        day = match.group(1).decode()
+        if spans and spans[-1][0] == day:
+            continue
+        if spans:
+            spans[-1] = (spans[-1][0], spans[-1][1], match.start())
+        spans.append((day, match.start(), len(data)))
+    return spans
+
+def _split_xml(data: bytes) -> List[Tuple[str, int, int]]:
+    """(day, start, end) byte spans of each <DailyData> element in an IESO XML report"""
+    spans = []
+    for match in _XML_DAY_RE.finditer(data):
+        end = data.find(b'</DailyData>', match.end())
+        if end < 0:
+            break
+        spans.append((match.group(1).decode(), match.start(), end + len(b'</DailyData>')))
+    return spans
+
+def _csv_partition(header: bytes, body: bytes) -> bytes:
+    return header + body
+
+def _xml_partition(header: bytes, body: bytes) -> bytes:
+    # Keep the root element (and its namespace) so the day parses like the annual file
+    return header + b'<DocBody>' + body + b'</DocBody></Document>\n'
+
+FORMATS = {
+    'csv': (_split_csv, _CSV_HEADER_RE, _csv_partition),
+    'xml': (_split_xml, _XML_ROOT_RE, _xml_partition),
+}
+
+def partition_blob_path(dataset: str, filename: str, day: str) -> str:
+    """Daily partition path for one day cut out of an annual file"""
+    stem, ext = os.path.splitext(filename)
+    stem = re.sub(r'_\d{4}(_v\d+)?$', '', stem)
+    year, month, dom = day.split('-')
+    return f"{dataset}/year={year}/month={month}/day={dom}/{stem}_{year}{month}{dom}{ext}"
+
+def _iter_body(response) -> Iterator[bytes]:
+    """Chunks of a streamed response, closing it once read"""
+    try:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if chunk:
+                yield chunk
+    finally:
+        response.close()
+
+def _read_prefix(chunks: Iterator[bytes], size: int) -> Tuple[bytes, bytes]:
+    """(first size bytes, rest of the chunk they ended in) of a chunk stream"""
+    head = bytearray()
+    for chunk in chunks:
+        head.extend(chunk)
+        if len(head) >= size:
+            break
+    return bytes(head[:size]), bytes(head[size:])
+
+def fetch_tail(url: str, cursor: Optional[Dict]) -> Tuple[Iterator[bytes], int, bool]:
+    """Stream a file from the stored resume offset if it still lines up, else in full.
+
+    Returns (chunks, offset of the first chunk within the file, whether only the tail is fetched).
+    """
+    if cursor:
+        anchor = cursor['anchor'].encode('latin-1')
+        start = cursor['offset'] - len(anchor)
+        # Ranges apply to the encoded body, so ask for it unencoded
+        response = http_get(url, headers={'Range': f"bytes={start}-", 'Accept-Encoding': 'identity'}, stream=True)
+        if response.status_code == 200:
+            # Range ignored: this response already is the whole file
+            return _iter_body(response), 0, False
+        if response.status_code == 206:
+            chunks = _iter_body(response)
+            head, rest = _read_prefix(chunks, len(anchor))
+            if head == anchor:
+                return itertools.chain([rest], chunks), cursor['offset'], True
+            chunks.close()
+        else:
+            response.close()
+        print(f"↩️  Resume point no longer matches, fetching {url.rsplit('/', 1)[-1]} in full")
+
+    response = http_get(url, stream=True)
+    if not response.ok:
+        response.close()
+        response.raise_for_status()
+    return _iter_body(response), 0, False
+
+class DayPartitioner:
+    """Cuts complete days out of a streamed annual file as its chunks arrive.
+
+    Only the day still being received (plus ANCHOR_BYTES before it) is buffered,
+    so memory does not grow with the size of the file.
+    """
+
+    def __init__(self, ext: str, header: bytes = None):
+        self.split_days, self.header_re, _ = FORMATS[ext]
+        self.header = header
+        self.buffer = bytearray()
+        # Offset of the buffer within the stream, and the bytes just before it
+        self.buffer_offset = 0
+        self.before = b''
+        self.bytes = 0
+        self.last_day = None
+        self.last_start = None
+        self.anchor = b''
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Tuple[str, bytes]]:
+        """Add a chunk; returns the (day, rows) completed by it (every remaining day once final)"""
+        self.buffer.extend(chunk)
+        self.bytes += len(chunk)
+        if self.header is None:
+            match = self.header_re.search(self.buffer)
+            if not match:
+                return []
+            self.header = match.group(0)
+
+        spans = self.split_days(self.buffer)
+        if not spans:
+            return []
+        # The last day may still be growing until the stream ends
+        complete = spans if final else spans[:-1]
+        days = [(day, bytes(self.buffer[start:end])) for day, start, end in complete]
+
+        last_day, last_start, _ = spans[-1]
+        self.last_day, self.last_start = last_day, self.buffer_offset + last_start
+        self.anchor = (self.before + bytes(self.buffer[:last_start]))[-ANCHOR_BYTES:]
+        if not final:
+            self.before = self.anchor
+            self.buffer_offset += last_start
+            del self.buffer[:last_start]
+        return days
+
+def ingest_file_delta(file: Dict, dataset: str, container: str, keep_full: bool = False,
+                      cancel: threading.Event = None) -> Dict:
+    """Store the days appended to an annual file since the last ingested version"""
+    year, version = extract_year_version(file['name'])
+    ext = os.path.splitext(file['name'])[1].lstrip('.').lower()
+    build_partition = FORMATS[ext][2]
+
+    cursor = get_delta_cursor(dataset, year)
+    if cursor and not cursor.get('header'):
+        cursor = None
+    chunks, base_offset, partial = fetch_tail(file['url'], None if keep_full else cursor)
+    partitioner = DayPartitioner(ext, cursor['header'].encode('latin-1') if partial else None)
+
+    # The last stored day is rewritten in case it was incomplete
+    stored_day = cursor['last_day'] if cursor else None
+    new_days = []
+
+    def upload_day(day: str, rows: bytes):
+        blob_path = partition_blob_path(dataset, file['name'], day)
+        if not upload_to_blob(build_partition(partitioner.header, rows), blob_path, container):
+            raise IOError(f"Upload failed for {blob_path}")
+
+    # A first run splits the whole year, so upload the partitions concurrently,
+    # with a bounded number of them waiting in memory
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix=f"{dataset}-delta") as executor:
+        pending = []
+
+        def submit(days: List[Tuple[str, bytes]]):
+            for day, rows in days:
+                if stored_day is None or day >= stored_day:
+                    new_days.append(day)
+                    pending.append(executor.submit(upload_day, day, rows))
+                while len(pending) > 2 * DEFAULT_MAX_WORKERS:
+                    pending.pop(0).result()
+
+        def split(stream: Iterator[bytes]) -> Iterator[bytes]:
+            for chunk in stream:
+                submit(partitioner.feed(chunk))
+                yield chunk
+            submit(partitioner.feed(b'', final=True))
+
+        if keep_full:
+            upload_stream_to_blob(split(chunks), build_blob_path(dataset, file['name']), container)
+        else:
+            for _ in split(chunks):
+                pass
+        for future in pending:
+            future.result()
+
+    if partitioner.header is None:
+        raise ValueError(f"No header found in {file['name']}")
+    if partitioner.last_day is None:
+        raise ValueError(f"No daily rows found in {file['name']}")
+
+    # Without the cursor the next run fetches these days again
+    if cancel is not None and cancel.is_set():
+        return {'name': file['name'], 'status': 'cancelled', 'bytes': partitioner.bytes, 'error': None}
+
+    set_delta_cursor(dataset, year, {
+        'version': version,
+        'last_day': partitioner.last_day,
+        'offset': base_offset + partitioner.last_start,
+        'anchor': partitioner.anchor.decode('latin-1'),
+        'header': partitioner.header.decode('latin-1')
+    })
+
+    print(f"🧩 {file['name']}: {len(new_days)} day partition(s) from "
+          f"{partitioner.bytes / 1024:.0f} KB ({'tail' if partial else 'full'} fetch)")
+    return {
+        'name': file['name'],
+        'status': 'uploaded',
+        'bytes': partitioner.bytes,
+        'days': len(new_days),
+        'partial': partial,
+        'error': None
+    }
+
+def ingest_deltas(files: List[Dict], dataset: str, container: str, keep_full: bool = None,
+                  cancel: threading.Event = None) -> TransferReport:
+    """Delta-ingest annual files in version order (each resumes from the previous one, until cancel is set)"""
+    keep_full = KEEP_FULL_FILE if keep_full is None else keep_full
+    report = TransferReport(dataset, len(files))
+
+    for file in sorted(files, key=lambda f: extract_year_version(f['name'])):
+        if cancel is not None and cancel.is_set():
+            report.add({'name': file['name'], 'status': 'cancelled', 'bytes': 0, 'error': None})
+            continue
+        try:
+            report.add(ingest_file_delta(file, dataset, container, keep_full, cancel))
+        except Exception as e:
+            print(f"❌ Delta ingest failed for {file['name']}: {e}")
+            report.add({'name': file['name'], 'status': 'failed', 'bytes': 0, 'error': str(e)})
+
+    report.finish()
+    return report
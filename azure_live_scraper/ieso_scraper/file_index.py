@@ -0,0 +1,159 @@
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# IESO file names end in _YYYYMMDDHH (hourly reports) or _YYYY (annual reports),
+# optionally followed by _vN for republished versions
+_FILENAME_RE = re.compile(r'^(?P<stem>.*_)(?P<stamp>\d{10}|\d{4})(?:_v(?P<version>\d+))?(?P<ext>\.\w+)$')
+
+class FileMeta(NamedTuple):
+    """Metadata encoded in an IESO file name"""
+    date: datetime
+    hour: Optional[int]
+    version: int
+    series: str
+
+@lru_cache(maxsize=65536)
+def parse_filename(name: str) -> Optional[FileMeta]:
+    """Parse an IESO file name once (cached), or None if it carries no date"""
+    match = _FILENAME_RE.match(name)
+    if not match:
+        return None
+
+    stamp = match.group('stamp')
+    try:
+        if len(stamp) == 10:
+            date, hour = datetime.strptime(stamp[:8], '%Y%m%d'), int(stamp[8:])
+        else:
+            date, hour = datetime(int(stamp), 1, 1), None
+    except ValueError:
+        return None
+
+    # All versions of one report share the name without its _vN suffix
+    series = match.group('stem') + stamp + match.group('ext')
+    return FileMeta(date, hour, int(match.group('version') or 0), series)
+
+class FileEntry(NamedTuple):
+    """One listed file with its parsed metadata"""
+    dataset: Optional[str]
+    date: datetime
+    hour: Optional[int]
+    version: int
+    series: str
+    name: str
+    url: str
+    size: str = ''
+    modified: str = ''
+
+    @property
+    def hour_key(self) -> Optional[str]:
+        """YYYYMMDDHH delivery hour (hour ending 01-24), None for annual files"""
+        return None if self.hour is None else f"{self.date.strftime('%Y%m%d')}{self.hour:02d}"
+
+    def as_file(self) -> Dict:
+        """The listing dict the transfer engine and listing cache work with"""
+        return {'name': self.name, 'url': self.url, 'size': self.size, 'modified': self.modified}
+
+def _sort_key(entry: FileEntry) -> Tuple[datetime, int, int, str]:
+    return entry.date, entry.hour or 0, entry.version, entry.name
+
+class FileIndex:
+    """A directory listing parsed once into entries sorted by (date, hour, version).
+
+    Date and hour ranges are answered with binary search instead of a regex pass
+    over the whole listing per lookup.
+    """
+
+    def __init__(self, files: Iterable[Dict] = (), dataset: str = None):
+        self.dataset = dataset
+        entries, unparsed = [], []
+
+        for file in files:
+            meta = parse_filename(file['name'])
+            if meta is None:
+                unparsed.append(file)
+                continue
+            entries.append(FileEntry(dataset, meta.date, meta.hour, meta.version, meta.series,
+                                     file['name'], file['url'], file.get('size', ''), file.get('modified', '')))
+
+        self._set_entries(sorted(entries, key=_sort_key))
+        # Files without a date in their name, kept so callers can still account for them
+        self.unparsed = unparsed
+
+    def _set_entries(self, entries: List[FileEntry]):
+        self.entries = entries
+        self._dates = [e.date for e in entries]
+        self._slots = [(e.date, e.hour or 0) for e in entries]
+
+    @classmethod
+    def _from_sorted(cls, entries: List[FileEntry], unparsed: List[Dict], dataset: str = None) -> 'FileIndex':
+        index = cls.__new__(cls)
+        index.dataset = dataset
+        index._set_entries(entries)
+        index.unparsed = unparsed
+        return index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        return iter(self.entries)
+
+    def between(self, start: datetime, end: datetime = None) -> List[FileEntry]:
+        """Entries dated within [start, end] (end defaults to now)"""
+        end = end or datetime.now()
+        return self.entries[bisect_left(self._dates, start):bisect_right(self._dates, end)]
+
+    def on(self, day: datetime) -> List[FileEntry]:
+        """Entries for a single day"""
+        return self.between(day, day)
+
+    def for_dates(self, days: Iterable[datetime]) -> List[FileEntry]:
+        """Entries for each of the given days, in date order"""
+        entries = []
+        for day in sorted(set(days)):
+            entries.extend(self.on(day))
+        return entries
+
+    def after_hour(self, hour_key: str) -> List[FileEntry]:
+        """Hourly entries for delivery hours after a YYYYMMDDHH key"""
+        slot = (datetime.strptime(hour_key[:8], '%Y%m%d'), int(hour_key[8:]))
+        return [e for e in self.entries[bisect_right(self._slots, slot):] if e.hour is not None]
+
+    def for_years(self, years: Iterable[int]) -> List[FileEntry]:
+        """Entries dated within any of the given years"""
+        entries = []
+        for year in sorted(set(years)):
+            entries.extend(self.between(datetime(year, 1, 1), datetime(year, 12, 31, 23, 59, 59)))
+        return entries
+
+    def latest_versions(self, entries: Iterable[FileEntry] = None) -> List[FileEntry]:
+        """Highest version of each report (of the given entries, default all), in index order"""
+        latest = {}
+        for entry in self.entries if entries is None else entries:
+            current = latest.get(entry.series)
+            if current is None or entry.version > current.version:
+                latest[entry.series] = entry
+        return sorted(latest.values(), key=_sort_key)
+
+    def subset(self, names: Iterable[str]) -> 'FileIndex':
+        """Index over the named entries only, reusing the parsed metadata"""
+        names = set(names)
+        return self._from_sorted(
+            [e for e in self.entries if e.name in names],
+            [f for f in self.unparsed if f['name'] in names],
+            self.dataset
+        )
+
+    def dates(self) -> Set[datetime]:
+        return set(self._dates)
+
+    def hour_keys(self) -> List[str]:
+        """Sorted distinct delivery hours of the hourly entries"""
+        return sorted({e.hour_key for e in self.entries if e.hour is not None})
+
+    @staticmethod
+    def files(entries: Iterable[FileEntry]) -> List[Dict]:
+        return [e.as_file() for e in entries]
@@ -0,0 +1,328 @@
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from .azure_utils import get_latest_processed_date, list_blobs_in_path
+from .blob_clients import RAW_CONTAINER, CLEANED_CONTAINER
+from .datasets import DATASETS, file_type
+from .delta_ingest import ingest_deltas, DELTA_INGEST
+from .file_index import FileIndex
+from .listing_cache import get_new_entries, mark_entries_seen
+from .publish_schedule import record_poll
+from .scraper_utils import (
+    index_ieso_directory,
+    extract_year_version,
+    get_target_years,
+    last_settled_date,
+    last_settled_hour
+)
+from .state_store import (
+    get_watermark_date, advance_watermark_date,
+    get_watermark_hour, advance_watermark_hour,
+    get_watermark_version, advance_watermark_versions
+)
+from .transfer_engine import transfer_files
+
+def _abandoned(dataset: str, cancel: Optional[threading.Event]) -> bool:
+    """True once the runner gave up on this dataset; its state is then left to the next run"""
+    if cancel is not None and cancel.is_set():
+        print(f"⏹️  {dataset}: cancelled at the deadline, state not updated")
+        return True
+    return False
+
+# --- HOURLY REPORTS (EnergyLMP, IntertieLMP) ---
+
+def get_missing_dates(dataset: str) -> List[datetime]:
+    """Determine which dates are missing after the ingestion watermark"""
+    latest_date = get_watermark_date(dataset)
+
+    if latest_date is None:
+        # No watermark yet: seed it from a one-off scan of the cleaned data
+        print("📅 No watermark stored yet, scanning cleaned-data")
+        latest_date = get_latest_processed_date(CLEANED_CONTAINER, dataset)
+
+    if latest_date is None:
+        print("❌ No existing data found in cleaned-data")
+        return []
+
+    print(f"📅 Latest processed date: {latest_date.strftime('%Y-%m-%d')}")
+
+    # Calculate missing dates (up to yesterday)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday = today - timedelta(days=1)
+
+    missing_dates = []
+    current_date = latest_date + timedelta(days=1)
+
+    while current_date <= yesterday:
+        missing_dates.append(current_date)
+        current_date += timedelta(days=1)
+
+    return missing_dates
+
+def update_watermark(dataset: str, missing_dates: List[datetime], index: FileIndex, failed_names: List[str],
+                     run_stats: dict):
+    """Advance the stored watermark to the last date that is fully in storage"""
+    settled_date = last_settled_date(missing_dates, index, failed_names)
+
+    if settled_date is not None:
+        advance_watermark_date(dataset, settled_date, run_stats)
+        print(f"📌 Watermark advanced to {settled_date.strftime('%Y-%m-%d')}")
+
+    # A day published only in part keeps its date open; the hour watermark stops
+    # at the last of its hours in storage, so the rest are still fetched later
+    open_dates = [d for d in missing_dates if settled_date is None or d > settled_date]
+    if not open_dates:
+        return
+    day_before = (open_dates[0] - timedelta(days=1)).strftime('%Y%m%d') + '24'
+    settled_hour = last_settled_hour(day_before, index.on(open_dates[0]), failed_names)
+    if settled_hour:
+        advance_watermark_hour(dataset, settled_hour, run_stats)
+        print(f"📌 Hour watermark advanced to {settled_hour}")
+
+def get_hour_watermark(dataset: str) -> Optional[str]:
+    """Latest hour ingested (YYYYMMDDHH), seeded from the cleaned data if no state exists"""
+    latest_hour = get_watermark_hour(dataset)
+
+    if latest_hour is None:
+        print("📅 No watermark stored yet, scanning cleaned-data")
+        latest_date = get_latest_processed_date(CLEANED_CONTAINER, dataset)
+        latest_hour = latest_date.strftime('%Y%m%d') + '24' if latest_date else None
+
+    return latest_hour
+
+def fill_hourly_gap(dataset: str, only_if_changed: bool = None, cancel: threading.Event = None) -> int:
+    """Fetch hourly files published since the hour watermark"""
+    spec = DATASETS[dataset]
+    print(f"🚀 Starting {dataset} hourly incremental run...")
+
+    latest_hour = get_hour_watermark(dataset)
+
+    if latest_hour is None:
+        print("❌ No existing data found in cleaned-data")
+        return 0
+
+    print(f"🕐 Latest ingested hour: {latest_hour}")
+
+    # Unchanged listings are answered with 304 from the listing cache
+    index = index_ieso_directory(spec['url'], spec['pattern'], dataset)
+
+    if not index:
+        print("❌ No files found on IESO site")
+        return 0
+
+    if _abandoned(dataset, cancel):
+        return 0
+
+    # Listed hours past the watermark also teach the schedule when this report appears
+    listed_after = index.after_hour(latest_hour)
+    record_poll(dataset, listed_after)
+
+    new_index = index.subset(f['name'] for f in get_new_entries(spec['url'], spec['pattern']))
+    candidates = new_index.after_hour(latest_hour)
+
+    if not candidates:
+        print("✅ No hourly files newer than the watermark")
+        return 0
+
+    target_files = FileIndex.files(new_index.latest_versions(candidates))
+    print(f"🎯 {len(target_files)} new hourly files: {', '.join(f['name'] for f in target_files[:5])}"
+          f"{' ...' if len(target_files) > 5 else ''}")
+
+    report = transfer_files(target_files, dataset, RAW_CONTAINER, only_if_changed=only_if_changed,
+                            cancel=cancel)
+    report.print_summary()
+
+    if _abandoned(dataset, cancel):
+        return report.success_count
+
+    failed = set(report.failed_names)
+    mark_entries_seen(spec['url'], [e.name for e in candidates if e.name not in failed])
+
+    # Listed hours past the watermark were either transferred now, by an earlier run, or failed;
+    # the watermark stops before the first hour that failed or is not published yet
+    settled_hour = last_settled_hour(latest_hour, listed_after, report.failed_names)
+    if settled_hour:
+        advance_watermark_hour(dataset, settled_hour, report.to_dict())
+        print(f"📌 Hour watermark advanced to {settled_hour}")
+
+    return report.success_count
+
+def fill_daily_gap(dataset: str, only_if_changed: bool = None, cancel: threading.Event = None) -> int:
+    """Fetch the hourly files of every day missing since the date watermark"""
+    spec = DATASETS[dataset]
+    print(f"🚀 Starting {dataset} gap filling...")
+
+    missing_dates = get_missing_dates(dataset)
+
+    if not missing_dates:
+        print("✅ No missing dates found - data is up to date!")
+        return 0
+
+    print(f"📋 Missing dates: {[d.strftime('%Y-%m-%d') for d in missing_dates]}")
+
+    # Scrape IESO directory
+    print(f"🌐 Scraping: {spec['url']}")
+    index = index_ieso_directory(spec['url'], spec['pattern'], dataset)
+
+    if not index:
+        print("❌ No files found on IESO site")
+        return 0
+
+    if _abandoned(dataset, cancel):
+        return 0
+
+    print(f"📁 Found {len(index)} total {file_type(dataset)} files")
+    record_poll(dataset, index.between(missing_dates[0]))
+
+    # Only look at listing entries not handled by a previous run
+    new_index = index.subset(f['name'] for f in get_new_entries(spec['url'], spec['pattern']))
+    print(f"🆕 {len(new_index)} files new since last listing")
+
+    # Files for the missing dates, latest versions only
+    target_files = FileIndex.files(new_index.latest_versions(new_index.for_dates(missing_dates)))
+
+    if not target_files:
+        print("❌ No new files found for missing dates")
+        update_watermark(dataset, missing_dates, index, [], {'files': 0})
+        return 0
+
+    print(f"🎯 Target files ({len(target_files)}):")
+    for file in target_files[:5]:  # Show first 5
+        print(f"   • {file['name']}")
+    if len(target_files) > 5:
+        print(f"   ... and {len(target_files) - 5} more")
+
+    # Download and upload files
+    report = transfer_files(target_files, dataset, RAW_CONTAINER, only_if_changed=only_if_changed,
+                            cancel=cancel)
+    report.print_summary()
+
+    if _abandoned(dataset, cancel):
+        return report.success_count
+
+    # Entries up to the last missing date are settled unless their transfer failed
+    failed = set(report.failed_names)
+    settled = [e.name for e in new_index.between(datetime.min, missing_dates[-1]) if e.name not in failed]
+    settled += [f['name'] for f in new_index.unparsed]
+    mark_entries_seen(spec['url'], settled)
+    update_watermark(dataset, missing_dates, index, report.failed_names, report.to_dict())
+
+    return report.success_count
+
+# --- ANNUAL REPORTS (GenMix, Demand, DemandZonal) ---
+
+def get_latest_version(dataset: str, year: int) -> Optional[int]:
+    """Get the latest version we have for a year (watermark, else a one-off blob scan)"""
+    version = get_watermark_version(dataset, year)
+    if version is not None:
+        return version
+
+    try:
+        blob_names = list_blobs_in_path(RAW_CONTAINER, f"{dataset}/year={year}/")
+
+        if not blob_names:
+            return None
+
+        latest_version = None
+
+        for blob_name in blob_names:
+            blob_year, version = extract_year_version(blob_name)
+            if blob_year == year and (latest_version is None or version > latest_version):
+                latest_version = version
+
+        return latest_version
+
+    except Exception as e:
+        print(f"❌ Error getting latest {dataset} version: {e}")
+        return None
+
+def fill_annual_gap(dataset: str, only_if_changed: bool = None, delta: bool = None,
+                    cancel: threading.Event = None) -> int:
+    """Fetch annual files newer than the stored versions (only the appended days in delta mode)"""
+    spec = DATASETS[dataset]
+    delta = DELTA_INGEST if delta is None else delta
+    print(f"🚀 Starting {dataset} gap filling...")
+
+    # Get latest version we have for each year that can still change
+    target_years = get_target_years()
+    current_versions = {year: get_latest_version(dataset, year) for year in target_years}
+
+    for year, version in current_versions.items():
+        if version is not None:
+            print(f"📅 Latest {year} version in Azure: v{version}")
+        else:
+            print(f"📅 No existing {year} {dataset} data found in Azure")
+
+    # Scrape IESO directory
+    print(f"🌐 Scraping: {spec['url']}")
+    index = index_ieso_directory(spec['url'], spec['pattern'], dataset)
+    year_entries = index.for_years(target_years)
+
+    if not year_entries:
+        print("❌ No files found on IESO site")
+        return 0
+
+    if _abandoned(dataset, cancel):
+        return 0
+
+    record_poll(dataset, year_entries)
+
+    years_text = '|'.join(str(year) for year in target_years)
+    print(f"📁 Found {len(year_entries)} total {years_text} {file_type(dataset)} files")
+
+    # Get latest versions only, newer than what we have
+    target_entries = [
+        entry for entry in index.latest_versions(year_entries)
+        if current_versions.get(entry.date.year) is None or entry.version > current_versions[entry.date.year]
+    ]
+    target_files = FileIndex.files(target_entries)
+
+    if not target_files:
+        print(f"✅ No newer {dataset} files found - data is up to date!")
+        return 0
+
+    print(f"🎯 Target files ({len(target_files)}):")
+    for file in target_files:
+        print(f"   • {file['name']}")
+
+    # Download and upload files
+    if delta:
+        report = ingest_deltas(target_files, dataset, RAW_CONTAINER, cancel=cancel)
+    else:
+        report = transfer_files(target_files, dataset, RAW_CONTAINER, only_if_changed=only_if_changed,
+                                cancel=cancel)
+    report.print_summary()
+
+    if _abandoned(dataset, cancel):
+        return report.success_count
+
+    # Record the versions now in storage
+    failed = set(report.failed_names)
+    stored_versions = {}
+    for entry in target_entries:
+        if entry.name not in failed:
+            stored_versions[entry.date.year] = max(entry.version, stored_versions.get(entry.date.year, 0))
+
+    if stored_versions:
+        advance_watermark_versions(dataset, stored_versions, report.to_dict())
+
+    return report.success_count
+
+def scrape_gap(dataset: str, only_if_changed: bool = None, hourly: bool = False, delta: bool = None,
+               cancel: threading.Event = None) -> int:
+    """Scrape missing files of one dataset and upload them to Azure, returning the files processed.
+
+    hourly=True switches hourly reports to hour-granular incremental mode;
+    delta=True ingests only the days appended to annual reports;
+    setting cancel stops the run after the files in flight, without writing state.
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    if DATASETS[dataset]['granularity'] == 'hourly':
+        if hourly:
+            return fill_hourly_gap(dataset, only_if_changed, cancel)
+        return fill_daily_gap(dataset, only_if_changed, cancel)
+
+    return fill_annual_gap(dataset, only_if_changed, delta, cancel)
@@ -0,0 +1,111 @@
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from typing import List, Dict, Iterable, Optional
+
+# Persistent cache of IESO directory listings, keyed by URL.
+# Defaults to the temp dir because the Function App package is read-only.
+CACHE_PATH = os.environ.get(
+    'SCRAPER_LISTING_CACHE',
+    os.path.join(tempfile.gettempdir(), 'ieso_listing_cache.json')
+)
+
+_cache_lock = threading.Lock()
+
+def _load() -> Dict:
+    try:
+        with open(CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save(cache: Dict):
+    """Write the cache atomically so a crash never leaves a half-written file"""
+    directory = os.path.dirname(CACHE_PATH) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.listing_cache_')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def get_cached_listing(url: str) -> Optional[Dict]:
+    """Return the cached listing record for a URL, or None"""
+    with _cache_lock:
+        return _load().get(url)
+
+def conditional_headers(url: str) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from the cached validators"""
+    record = get_cached_listing(url)
+    headers = {}
+
+    if record and record.get('entries'):
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+
+    return headers
+
+def store_listing(url: str, entries: List[Dict], etag: str = None, last_modified: str = None):
+    """Store a freshly parsed listing together with its HTTP validators"""
+    with _cache_lock:
+        cache = _load()
+        record = cache.get(url, {})
+        record.update({
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now().isoformat(),
+            'entries': entries
+        })
+        record.setdefault('seen', [])
+        cache[url] = record
+        _save(cache)
+
+def get_new_entries(url: str, file_pattern: str = None) -> List[Dict]:
+    """Entries in the cached listing that have not been marked as seen"""
+    record = get_cached_listing(url)
+    if not record:
+        return []
+
+    seen = set(record.get('seen', []))
+    pattern = re.compile(file_pattern) if file_pattern else None
+
+    return [
+        entry for entry in record.get('entries', [])
+        if entry['name'] not in seen and (pattern is None or pattern.search(entry['name']))
+    ]
+
+def mark_entries_seen(url: str, names: Iterable[str]):
+    """Record entries as handled so later diffs skip them"""
+    names = set(names)
+    if not names:
+        return
+
+    with _cache_lock:
+        cache = _load()
+        record = cache.get(url)
+        if record is None:
+            # Nothing listed to diff against
+            return
+        # Only listed names are ever diffed against: dropping the rest keeps the file bounded
+        listed = {entry['name'] for entry in record.get('entries', [])}
+        record['seen'] = sorted((set(record.get('seen', [])) | names) & listed)
+        _save(cache)
+
+def clear_listing_cache(url: str = None):
+    """Forget one cached listing (or all of them)"""
+    with _cache_lock:
+        cache = _load()
+        if url is None:
+            cache = {}
+        else:
+            cache.pop(url, None)
+        _save(cache)
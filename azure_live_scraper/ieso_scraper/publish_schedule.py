@@ -0,0 +1,165 @@
+"""
+Publish Schedule
+Learns when IESO publishes each report and decides when the next poll is worth making
+"""
+
+import argparse
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .datasets import DATASETS
+from .file_index import FileEntry
+from .state_store import load_state, update_state
+
+# Publish lags are measured on the listing's "Last modified" clock, which is IESO
+# market time (EST, no daylight saving)
+IESO_UTC_OFFSET = timedelta(hours=float(os.environ.get('SCRAPER_IESO_UTC_OFFSET_HOURS', '-5')))
+# Poll once this share of past publications would have appeared, plus a margin
+LAG_QUANTILE = float(os.environ.get('SCRAPER_PUBLISH_LAG_QUANTILE', '0.8'))
+POLL_MARGIN = timedelta(seconds=float(os.environ.get('SCRAPER_POLL_MARGIN_SECONDS', '60')))
+# Late publications are re-polled after BACKOFF, doubling up to MAX_BACKOFF
+POLL_BACKOFF = timedelta(seconds=float(os.environ.get('SCRAPER_POLL_BACKOFF_SECONDS', '120')))
+POLL_MAX_BACKOFF = timedelta(seconds=float(os.environ.get('SCRAPER_POLL_MAX_BACKOFF_SECONDS', '3600')))
+# Publish lags kept per dataset
+MAX_SAMPLES = int(os.environ.get('SCRAPER_PUBLISH_LAG_SAMPLES', '96'))
+
+MODIFIED_FORMAT = '%Y-%m-%d %H:%M'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Hourly reports are due after each delivery hour ends; annual reports get a new
+# version once a day, so their period ends at midnight of the publication day
+PERIODS = {'hourly': timedelta(hours=1), 'annual': timedelta(days=1)}
+
+def _schedule_key(dataset: str) -> str:
+    return f"{dataset}.schedule"
+
+def ieso_now() -> datetime:
+    """Current time on the IESO listing clock"""
+    return datetime.utcnow() + IESO_UTC_OFFSET
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.strptime(value, TIME_FORMAT) if value else None
+
+def _format_duration(delta: timedelta) -> str:
+    minutes = int(delta.total_seconds() // 60)
+    return f"{minutes // 60}h{minutes % 60:02d}m" if minutes >= 60 else f"{minutes}m"
+
+def period_end(entry: FileEntry, granularity: str, modified: datetime) -> datetime:
+    """End of the period whose data an entry publishes"""
+    if granularity == 'hourly':
+        return entry.date + timedelta(hours=entry.hour)
+    return modified.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def publications(entries: Iterable[FileEntry], granularity: str) -> Dict[datetime, datetime]:
+    """First publication time of each period among listing entries ({period end: modified})"""
+    first = {}
+    for entry in entries:
+        try:
+            modified = datetime.strptime(entry.modified, MODIFIED_FORMAT)
+        except ValueError:
+            continue
+        end = period_end(entry, granularity, modified)
+        if end not in first or modified < first[end]:
+            first[end] = modified
+    return first
+
+def _quantile(values: List[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def expected_lag(schedule: Dict) -> Optional[timedelta]:
+    """Learned delay between the end of a period and its publication (None until observed)"""
+    lags = schedule.get('lags')
+    return timedelta(seconds=_quantile(lags, LAG_QUANTILE)) if lags else None
+
+def expected_publication(dataset: str, schedule: Dict) -> Optional[datetime]:
+    """When the period after the newest one seen should be published"""
+    lag = expected_lag(schedule)
+    last_period = _parse_time(schedule.get('last_period_end'))
+    if lag is None or last_period is None:
+        return None
+    return last_period + PERIODS[DATASETS[dataset]['granularity']] + lag
+
+def load_schedule(dataset: str) -> Dict:
+    return load_state(_schedule_key(dataset))
+
+def next_poll_time(dataset: str, schedule: Dict = None) -> Optional[datetime]:
+    """Earliest time the next poll is worth making (None: poll now, nothing learned yet)"""
+    schedule = load_schedule(dataset) if schedule is None else schedule
+    return _parse_time(schedule.get('next_poll'))
+
+def is_due(dataset: str, now: datetime = None) -> bool:
+    next_poll = next_poll_time(dataset)
+    return next_poll is None or (now or ieso_now()) >= next_poll
+
+def record_poll(dataset: str, entries: Iterable[FileEntry], now: datetime = None) -> Dict:
+    """Learn publish lags from a poll's listing entries and schedule the next poll.
+
+    Periods newer than any seen before count as new publications. A poll that finds
+    none after the expected publication time is a miss: the next poll is backed off
+    exponentially until the report shows up.
+    """
+    granularity = DATASETS[dataset]['granularity']
+    now = now or ieso_now()
+    found = publications(entries, granularity)
+
+    def apply(state: Dict):
+        last_period = _parse_time(state.get('last_period_end'))
+        fresh = {end: modified for end, modified in found.items() if last_period is None or end > last_period}
+
+        if fresh:
+            lags = state.get('lags', [])
+            lags += [max(0, int((fresh[end] - end).total_seconds())) for end in sorted(fresh)]
+            state['lags'] = lags[-MAX_SAMPLES:]
+            state['last_period_end'] = max(fresh).strftime(TIME_FORMAT)
+            state['last_published'] = fresh[max(fresh)].strftime(TIME_FORMAT)
+            state['misses'] = 0
+        else:
+            state['empty_polls'] = state.get('empty_polls', 0) + 1
+
+        state['polls'] = state.get('polls', 0) + 1
+        state['last_poll'] = now.strftime(TIME_FORMAT)
+
+        expected = expected_publication(dataset, state)
+        if expected is None:
+            next_poll = None
+        elif fresh or now < expected:
+            next_poll = max(expected + POLL_MARGIN, now)
+        else:
+            # The report is late: back off instead of re-listing every tick
+            state['misses'] = state.get('misses', 0) + 1
+            next_poll = now + min(POLL_BACKOFF * 2 ** (state['misses'] - 1), POLL_MAX_BACKOFF)
+        state['next_poll'] = next_poll.strftime(TIME_FORMAT) if next_poll else None
+
+    try:
+        return update_state(_schedule_key(dataset), apply)
+    except Exception as e:
+        print(f"⚠️  Could not save publish schedule for {dataset}: {e}")
+        return {}
+
+def describe(dataset: str, schedule: Dict = None) -> str:
+    """One-line summary of a dataset's learned schedule"""
+    schedule = load_schedule(dataset) if schedule is None else schedule
+    lag = expected_lag(schedule)
+    if lag is None:
+        return f"{dataset}: no publications observed yet (polled every run)"
+
+    next_poll = schedule.get('next_poll') or 'now'
+    misses = f", {schedule['misses']} late poll(s)" if schedule.get('misses') else ''
+    return (f"{dataset}: p{LAG_QUANTILE * 100:.0f} lag {_format_duration(lag)} "
+            f"over {len(schedule['lags'])} publications, next poll {next_poll}{misses}, "
+            f"{schedule.get('empty_polls', 0)}/{schedule.get('polls', 0)} polls empty")
+
+def main():
+    """Print the learned schedule of every dataset"""
+    parser = argparse.ArgumentParser(description="Show learned IESO publish lags and next polls")
+    parser.add_argument('datasets', nargs='*', help=f"Datasets (default: all of {', '.join(DATASETS)})")
+    args = parser.parse_args()
+
+    print(f"🕐 IESO time now: {ieso_now().strftime(TIME_FORMAT)}")
+    for dataset in args.datasets or DATASETS:
+        print(f"   {describe(dataset)}")
+
+if __name__ == "__main__":
+    main()
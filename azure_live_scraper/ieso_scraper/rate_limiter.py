@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# Pacing for IESO requests (override with environment variables)
+RATE_LIMIT_RPS = float(os.environ.get('SCRAPER_RATE_LIMIT_RPS', '5'))
+RATE_BURST = int(os.environ.get('SCRAPER_RATE_BURST', '10'))
+MAX_CONCURRENCY = int(os.environ.get('SCRAPER_PER_HOST_CONCURRENCY', '8'))
+MIN_CONCURRENCY = int(os.environ.get('SCRAPER_MIN_CONCURRENCY', '1'))
+TARGET_LATENCY = float(os.environ.get('SCRAPER_TARGET_LATENCY', '2.0'))
+THROTTLE_STATUS_CODES = (429, 503)
+# Minimum gap between two decreases, so one burst of errors only backs off once
+DECREASE_COOLDOWN = 1.0
+
+class RequestTicket:
+    """One admitted request; records what the server answered"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.latency = None
+        self.status = None
+        self.throttled = 0
+        self.retry_after = None
+        self.error = False
+
+    def observe(self, response):
+        """Record status, latency and any throttled retries urllib3 made along the way"""
+        self.latency = time.monotonic() - self.started
+        self.status = response.status_code
+
+        retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        history = getattr(retries, 'history', None) or ()
+        self.throttled = sum(1 for attempt in history if attempt.status in THROTTLE_STATUS_CODES)
+        if self.status in THROTTLE_STATUS_CODES:
+            self.throttled += 1
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            self.retry_after = int(retry_after)
+
+class AdaptiveRateLimiter:
+    """Token bucket plus AIMD concurrency limit for one host.
+
+    Requests take a token (rate/burst) and an in-flight slot. Throttled or
+    failed responses halve the concurrency and rate, slow ones give up one
+    slot, and fast successes grow both back towards the configured ceiling.
+    """
+
+    def __init__(self, name: str, rate: float = RATE_LIMIT_RPS, burst: int = RATE_BURST,
+                 max_concurrency: int = MAX_CONCURRENCY, min_concurrency: int = MIN_CONCURRENCY,
+                 target_latency: float = TARGET_LATENCY):
+        self.name = name
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = max_concurrency
+        self.target_latency = target_latency
+
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._latency_ewma = None
+
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.slow = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.min_limit_seen = max_concurrency
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def acquire(self) -> RequestTicket:
+        """Block until both a token and a concurrency slot are available"""
+        started = time.monotonic()
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    timeout = self._paused_until - now
+                elif self._in_flight >= self.limit:
+                    timeout = None
+                elif self._tokens < 1:
+                    timeout = (1 - self._tokens) / self.rate
+                else:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    break
+
+                self._cond.wait(timeout)
+
+            waited = time.monotonic() - started
+            if waited > 0.001:
+                self.delayed += 1
+                self.wait_seconds += waited
+
+        return RequestTicket()
+
+    def release(self, ticket: RequestTicket):
+        """Free the slot and adapt the limits to how the request went"""
+        now = time.monotonic()
+        latency = ticket.latency if ticket.latency is not None else now - ticket.started
+
+        with self._cond:
+            self._in_flight -= 1
+            self.requests += 1
+            self.throttled += ticket.throttled
+            self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+
+            failed = ticket.error or (ticket.status is not None and ticket.status >= 500)
+            if failed:
+                self.errors += 1
+
+            if ticket.throttled or failed:
+                self._decrease(now, halve_rate=True)
+                if ticket.retry_after:
+                    self._paused_until = max(self._paused_until, now + ticket.retry_after)
+            elif latency > self.target_latency:
+                self.slow += 1
+                self._decrease(now, halve_rate=False)
+            else:
+                self._successes += 1
+                # Additive increase: one more slot per window of successes at the current limit
+                if self._successes >= self.limit:
+                    self._successes = 0
+                    self.limit = min(self.max_concurrency, self.limit + 1)
+                    self.rate = min(self.max_rate, self.rate * 1.5)
+
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, halve_rate: bool):
+        self._successes = 0
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_concurrency, self.limit // 2 if halve_rate else self.limit - 1)
+        if halve_rate:
+            self.rate = max(self.max_rate / 4, self.rate / 2)
+        self.min_limit_seen = min(self.min_limit_seen, self.limit)
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'throttled': self.throttled,
+                'slow': self.slow,
+                'delayed': self.delayed,
+                'wait_seconds': round(self.wait_seconds, 2),
+                'concurrency': self.limit,
+                'min_concurrency_seen': self.min_limit_seen,
+                'rate_per_second': round(self.rate, 2),
+                'avg_latency_seconds': round(self._latency_ewma, 3) if self._latency_ewma is not None else None
+            }
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(url: str) -> AdaptiveRateLimiter:
+    """Shared limiter for the host of a URL (created on first use)"""
+    host = urlparse(url).netloc
+
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(host)
+            _limiters[host] = limiter
+
+    return limiter
+
+def rate_limiter_stats(host: Optional[str] = None) -> Dict[str, Dict]:
+    """Counters per host, for run reports"""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.stats() for name, limiter in limiters.items() if host is None or name == host}
+
+def format_rate_limiter_stats() -> str:
+    lines = []
+    for host, s in rate_limiter_stats().items():
+        lines.append(f"🚦 {host}: {s['requests']} requests, {s['throttled']} throttled, {s['errors']} errors, "
+                     f"{s['delayed']} delayed ({s['wait_seconds']:.1f}s waiting), "
+                     f"concurrency {s['concurrency']} (min {s['min_concurrency_seen']}), "
+                     f"{s['rate_per_second']:g} req/s")
+    return '\n'.join(lines)
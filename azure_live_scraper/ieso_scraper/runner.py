@@ -0,0 +1,205 @@
+import time
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from .datasets import DATASETS
+from .rate_limiter import format_rate_limiter_stats
+from .startup_profiler import timed_import
+
+# Runs gap filling for all IESO datasets, in sequence or in parallel.
+# The gap filler engine (and the Azure SDK behind it) is imported when the first
+# dataset runs, so importing the runner stays cheap on a cold start.
+
+def load_gap_filler() -> Callable[..., int]:
+    """Import the gap filler engine on first use and return its entry point"""
+    return timed_import(f"{__package__}.gap_filler").scrape_gap
+
+def run_dataset(dataset: Dict, options: Dict = None, cancel: threading.Event = None) -> Dict:
+    """Run one dataset gap filler, isolating any failure to that dataset"""
+    started = time.time()
+    
+    try:
+        scrape_gap = load_gap_filler()
+        # Only pass the options this dataset supports
+        kwargs = {k: v for k, v in (options or {}).items() if k in dataset.get('options', ())}
+        files_processed = scrape_gap(dataset['name'], cancel=cancel, **kwargs)
+        result = {
+            'status': 'success',
+            'files_processed': files_processed,
+            'error': None
+        }
+        
+        if files_processed > 0:
+            print(f"✅ {dataset['name']}: {files_processed} files processed")
+        else:
+            print(f"✅ {dataset['name']}: Up to date")
+            
+    except Exception as e:
+        print(f"❌ {dataset['name']}: Error - {e}")
+        result = {
+            'status': 'error',
+            'files_processed': 0,
+            'error': str(e) or type(e).__name__
+        }
+    
+    result['elapsed_seconds'] = round(time.time() - started, 1)
+    return result
+
+def _not_due_result(next_poll: datetime) -> Dict:
+    return {
+        'status': 'skipped',
+        'files_processed': 0,
+        'error': None,
+        'elapsed_seconds': 0.0,
+        'next_poll': next_poll.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def _timeout_result(deadline_seconds: float) -> Dict:
+    return {
+        'status': 'timeout',
+        'files_processed': 0,
+        'error': f"Deadline of {deadline_seconds:.0f}s exceeded",
+        'elapsed_seconds': deadline_seconds
+    }
+
+def _run_sequential(datasets: List[Dict], deadline: float, deadline_seconds: float, options: Dict) -> Dict:
+    results = {}
+    
+    for dataset in datasets:
+        if deadline is not None and time.time() >= deadline:
+            print(f"⏰ {dataset['name']}: skipped, deadline reached")
+            results[dataset['name']] = _timeout_result(deadline_seconds)
+            continue
+        
+        print(f"\n📊 DATASET: {dataset['name']}")
+        print(f"📝 Description: {dataset['description']}")
+        print("-" * 40)
+        
+        results[dataset['name']] = run_dataset(dataset, options)
+    
+    return results
+
+def _run_parallel(datasets: List[Dict], deadline: float, deadline_seconds: float, options: Dict) -> Dict:
+    finished = {}
+    threads = []
+    # Set at the deadline: abandoned workers stop after their files in flight and write no state
+    cancel = threading.Event()
+    
+    def worker(dataset):
+        finished[dataset['name']] = run_dataset(dataset, options, cancel)
+    
+    for dataset in datasets:
+        print(f"📊 Launching {dataset['name']}: {dataset['description']}")
+        # Daemon threads so a stuck dataset cannot hold the process past the deadline
+        thread = threading.Thread(target=worker, args=(dataset,), name=f"gapfill-{dataset['name']}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    
+    for thread in threads:
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        thread.join(timeout)
+    
+    if any(thread.is_alive() for thread in threads):
+        cancel.set()
+    
+    results = {}
+    for dataset in datasets:
+        if dataset['name'] in finished:
+            results[dataset['name']] = finished[dataset['name']]
+        else:
+            print(f"⏰ {dataset['name']}: still running at deadline, cancelling")
+            results[dataset['name']] = _timeout_result(deadline_seconds)
+    
+    return results
+
+def run_all_gap_fillers(parallel: bool = False, deadline_seconds: float = None, only_if_changed: bool = None,
+                        hourly: bool = False, delta: bool = None, datasets: List[str] = None,
+                        scheduled: bool = False):
+    """Run the dataset gap fillers (default: all), sequentially by priority or concurrently.
+    
+    hourly=True runs only the real-time datasets in hour-granular incremental mode;
+    delta=True ingests only the days appended to the annual files;
+    scheduled=True runs each dataset only once its next publication is expected
+    (hourly datasets in hour-granular mode), see publish_schedule.
+    """
+    mode = "parallel" if parallel else "sequential"
+    scope = "hourly real-time datasets" if hourly else ("all IESO datasets" if not datasets else ', '.join(datasets))
+    if scheduled:
+        scope += " when due"
+    print(f"🚀 Starting comprehensive gap filling for {scope} ({mode})...")
+    print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if deadline_seconds:
+        print(f"⏳ Deadline: {deadline_seconds:.0f}s")
+    print("=" * 60)
+    
+    # Sort by priority
+    selected = datasets or list(DATASETS)
+    datasets = sorted(({'name': name, **DATASETS[name]} for name in selected), key=lambda x: x['priority'])
+    deadline = time.time() + deadline_seconds if deadline_seconds else None
+    options = {'only_if_changed': only_if_changed, 'delta': delta}
+    
+    if hourly:
+        datasets = [d for d in datasets if 'hourly' in d['options']]
+    if hourly or scheduled:
+        options['hourly'] = True
+    
+    skipped = {}
+    if scheduled:
+        # Datasets whose next publication is not expected yet cost no listing request
+        schedule = timed_import(f"{__package__}.publish_schedule")
+        now = schedule.ieso_now()
+        for dataset in datasets:
+            next_poll = schedule.next_poll_time(dataset['name'])
+            if next_poll is not None and now < next_poll:
+                print(f"⏭️  {dataset['name']}: not due until {next_poll.strftime('%H:%M')} (IESO time)")
+                skipped[dataset['name']] = _not_due_result(next_poll)
+    due = [d for d in datasets if d['name'] not in skipped]
+    
+    if parallel:
+        results = _run_parallel(due, deadline, deadline_seconds, options)
+    else:
+        results = _run_sequential(due, deadline, deadline_seconds, options)
+    results = {d['name']: results.get(d['name']) or skipped[d['name']] for d in datasets}
+    
+    total_files = sum(r['files_processed'] for r in results.values())
+    
+    # Summary
+    print("\n" + "=" * 60)
+    print("📋 COMPREHENSIVE GAP FILLING SUMMARY")
+    print("=" * 60)
+    
+    success_count = 0
+    error_count = 0
+    
+    for dataset_name, result in results.items():
+        status_icon = {'success': "✅", 'timeout': "⏰", 'skipped': "⏭️ "}.get(result['status'], "❌")
+        files_text = f"{result['files_processed']} files" if result['files_processed'] > 0 else "up to date"
+        if result['status'] == 'skipped':
+            files_text = "not due"
+        
+        print(f"{status_icon} {dataset_name:12} | {files_text:12} | {result['elapsed_seconds']}s")
+        
+        if result['status'] in ('success', 'skipped'):
+            success_count += 1
+        else:
+            error_count += 1
+            print(f"   Error: {result['error']}")
+    
+    print("-" * 60)
+    print(f"📊 Total files processed: {total_files}")
+    print(f"✅ Successful datasets: {success_count}/{len(datasets)}")
+    print(f"❌ Failed datasets: {error_count}/{len(datasets)}")
+    http_summary = format_rate_limiter_stats()
+    if http_summary:
+        print(http_summary)
+    print(f"⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    if total_files > 0:
+        print("\n📋 NEXT STEPS:")
+        print("1. Run cleaning scripts for updated datasets")
+        print("2. Verify Synapse external tables see new data")
+        print("3. Update ML models with fresh data")
+        print("4. Set up daily automation for ongoing updates")
+    
+    return results
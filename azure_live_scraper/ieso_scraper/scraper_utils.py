@@ -0,0 +1,322 @@
+import requests
+from requests.adapters import HTTPAdapter
+import os
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from html import unescape
+from typing import List, Dict, Iterator, Tuple, Optional
+import urllib3
+from urllib3.util.retry import Retry
+
+from .file_index import FileIndex, FileEntry, parse_filename
+from .listing_cache import conditional_headers, get_cached_listing, store_listing
+from .rate_limiter import get_rate_limiter, RequestTicket
+
+# Disable SSL warnings for IESO sites
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# HTTP tuning (override with environment variables)
+HTTP_POOL_SIZE = int(os.environ.get('SCRAPER_HTTP_POOL_SIZE', '16'))
+HTTP_MAX_RETRIES = int(os.environ.get('SCRAPER_HTTP_RETRIES', '4'))
+HTTP_BACKOFF_FACTOR = float(os.environ.get('SCRAPER_HTTP_BACKOFF', '0.5'))
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+DOWNLOAD_CHUNK_SIZE = int(os.environ.get('SCRAPER_DOWNLOAD_CHUNK_KB', '1024')) * 1024
+# An hour still unlisted this long after a later hour appeared is taken as never published
+HOUR_GAP_GRACE_HOURS = int(os.environ.get('SCRAPER_HOUR_GAP_GRACE_HOURS', '48'))
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """Get the shared keep-alive session (created on first use)"""
+    global _session
+    
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=HTTP_MAX_RETRIES,
+                    connect=HTTP_MAX_RETRIES,
+                    read=HTTP_MAX_RETRIES,
+                    status=HTTP_MAX_RETRIES,
+                    backoff_factor=HTTP_BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=retry
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.verify = False
+                _session = session
+    
+    return _session
+
+@contextmanager
+def host_slot(url: str) -> Iterator[RequestTicket]:
+    """Pace requests to a single host through its shared adaptive rate limiter"""
+    limiter = get_rate_limiter(url)
+    ticket = limiter.acquire()
+    
+    try:
+        yield ticket
+    except Exception:
+        ticket.error = True
+        raise
+    finally:
+        limiter.release(ticket)
+
+def http_get(url: str, timeout: int = 60, **kwargs) -> requests.Response:
+    """GET through the pooled session, honouring the per-host concurrency limit"""
+    with host_slot(url) as ticket:
+        response = get_http_session().get(url, timeout=timeout, **kwargs)
+        ticket.observe(response)
+        return response
+
+# Anchor extractor for Apache-style autoindex pages (much cheaper than building a DOM)
+_ANCHOR_RE = re.compile(
+    r"""<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))[^>]*>(.*?)</a\s*>""",
+    re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Last-modified and size columns that follow each anchor in an autoindex row
+_ROW_TAIL_RE = re.compile(r'\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s+(\S+)')
+_SIZE_UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+def iter_directory_rows(html) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (href, text, modified, size) for every anchor in a directory page, in document order"""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    
+    for match in _ANCHOR_RE.finditer(html):
+        href = match.group(1)
+        if href is None:
+            href = match.group(2) if match.group(2) is not None else match.group(3)
+        text = match.group(4)
+        if '<' in text:
+            text = _TAG_RE.sub('', text)
+        tail = _ROW_TAIL_RE.match(html, match.end())
+        modified, size = (tail.group(1), tail.group(2)) if tail else ('', '')
+        yield unescape(href), unescape(text).strip(), modified, size
+
+def iter_directory_links(html) -> Iterator[Tuple[str, str]]:
+    """Yield (href, text) for every anchor in a directory page, in document order"""
+    for href, text, _, _ in iter_directory_rows(html):
+        yield href, text
+
+def parse_size(size: str) -> int:
+    """Approximate bytes for an autoindex size column like 1.1M (0 if unknown)"""
+    if not size or size == '-':
+        return 0
+    try:
+        unit = _SIZE_UNITS.get(size[-1].upper())
+        return int(float(size[:-1]) * unit) if unit else int(size)
+    except ValueError:
+        return 0
+
+def parse_directory_listing(html, base_url: str) -> List[Dict]:
+    """Parse every file link out of an IESO directory page"""
+    prefix = base_url.rstrip('/') + '/'
+    
+    files = []
+    for href, text, modified, size in iter_directory_rows(html):
+        if href == '../' or not text:
+            continue
+        
+        full_url = href if href.startswith('http') else prefix + href.lstrip('/')
+        
+        files.append({
+            'name': text,
+            'url': full_url,
+            'size': size,
+            'modified': modified
+        })
+    
+    return files
+
+def fetch_directory_listing(base_url: str, use_cache: bool = True) -> List[Dict]:
+    """Fetch a directory listing, revalidating the cached copy with a conditional GET"""
+    headers = conditional_headers(base_url) if use_cache else {}
+    response = http_get(base_url, timeout=30, headers=headers)
+    
+    if response.status_code == 304:
+        cached = get_cached_listing(base_url)
+        if cached is not None:
+            print(f"♻️  Listing unchanged since {cached['fetched_at']}: {base_url}")
+            return cached['entries']
+        # Cache vanished between the request and now - fetch unconditionally
+        response = http_get(base_url, timeout=30)
+    
+    response.raise_for_status()
+    files = parse_directory_listing(response.content, base_url)
+    
+    if use_cache:
+        store_listing(
+            base_url,
+            files,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+    
+    return files
+
+def scrape_ieso_directory(base_url: str, file_pattern: str = None, use_cache: bool = True) -> List[Dict]:
+    """Scrape IESO directory page for file links"""
+    try:
+        files = fetch_directory_listing(base_url, use_cache)
+        
+        if file_pattern:
+            pattern = re.compile(file_pattern)
+            files = [f for f in files if pattern.search(f['name'])]
+        
+        return files
+        
+    except Exception as e:
+        print(f"❌ Error scraping {base_url}: {e}")
+        return []
+
+def extract_date_from_filename(filename: str) -> datetime:
+    """Extract date from IESO filename patterns"""
+    # Pattern 1: YYYYMMDDHH format (EnergyLMP, IntertieLMP)
+    match = re.search(r'(\d{8})\d{2}', filename)
+    if match:
+        date_str = match.group(1)
+        try:
+            return datetime.strptime(date_str, '%Y%m%d')
+        except ValueError:
+            pass
+    
+    # Pattern 2: YYYY format (GenMix, Demand), versioned or not
+    match = re.search(r'_(\d{4})[_.]', filename)
+    if match:
+        year = int(match.group(1))
+        if year >= 2020:
+            return datetime(year, 1, 1)
+    
+    return None
+
+_HOUR_KEY_RE = re.compile(r'_(\d{10})(?:_v\d+)?\.\w+$')
+
+def extract_hour_key(filename: str) -> Optional[str]:
+    """Extract the YYYYMMDDHH delivery hour (hour ending 01-24) from hourly IESO filenames"""
+    match = _HOUR_KEY_RE.search(filename)
+    return match.group(1) if match else None
+
+_ANNUAL_FILE_RE = re.compile(r'_(\d{4})(?:_v(\d+))?\.\w+$')
+
+def extract_year_version(filename: str) -> Tuple[Optional[int], int]:
+    """Extract (year, version) from annual IESO filenames like PUB_Demand_2025_v123.csv"""
+    match = _ANNUAL_FILE_RE.search(filename)
+    if not match:
+        return None, 0
+    return int(match.group(1)), int(match.group(2) or 0)
+
+def get_target_years(today: datetime = None) -> List[int]:
+    """Years whose annual files may still change (last year's final versions land in January)"""
+    today = today or datetime.now()
+    if today.month == 1:
+        return [today.year - 1, today.year]
+    return [today.year]
+
+def get_latest_version_files(files: List[Dict]) -> List[Dict]:
+    """Keep only the highest version per base name"""
+    index = FileIndex(files)
+    return FileIndex.files(index.latest_versions()) + index.unparsed
+
+def download_file(url: str, timeout: int = 60) -> bytes:
+    """Download file from URL and return content as bytes"""
+    try:
+        response = http_get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        print(f"❌ Error downloading {url}: {e}")
+        raise
+
+def iter_download(url: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE, timeout: int = 60) -> Iterator[bytes]:
+    """Stream a file from URL in chunks without holding the whole body in memory"""
+    # The host slot is held until the body has been fully read
+    with host_slot(url) as ticket:
+        response = get_http_session().get(url, timeout=timeout, stream=True)
+        ticket.observe(response)
+        try:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            response.close()
+
+def filter_files_by_date(files: List[Dict], start_date: datetime, end_date: datetime = None) -> List[Dict]:
+    """Filter files by date range based on filename patterns"""
+    return FileIndex.files(FileIndex(files).between(start_date, end_date))
+
+def index_ieso_directory(base_url: str, file_pattern: str = None, dataset: str = None,
+                         use_cache: bool = True) -> FileIndex:
+    """Scrape an IESO directory and parse its file names once into a FileIndex"""
+    return FileIndex(scrape_ieso_directory(base_url, file_pattern, use_cache), dataset)
+
+def last_settled_date(dates: List[datetime], index: FileIndex, failed_names: List[str]) -> Optional[datetime]:
+    """End of the unbroken run of consecutive dates whose every hour is listed and transferred.
+
+    A date settles once its hour 24 is listed, or once HOUR_GAP_GRACE_HOURS of later
+    hours are listed (as in last_settled_hour); a failed transfer ends the run.
+    """
+    listed = set(index.hour_keys())
+    failed_dates = [meta.date for meta in map(parse_filename, failed_names) if meta]
+    first_failure = min(failed_dates) if failed_dates else None
+    if not listed:
+        return None
+    newest = max(listed)
+    grace = timedelta(hours=HOUR_GAP_GRACE_HOURS)
+
+    settled = None
+    for d in sorted(dates):
+        last_hour = d.strftime('%Y%m%d') + '24'
+        if first_failure is not None and d >= first_failure:
+            break
+        if last_hour not in listed and _hour_start(newest) - _hour_start(last_hour) < grace:
+            break
+        settled = d
+    return settled
+
+def _hour_start(hour_key: str) -> datetime:
+    """Start of a YYYYMMDDHH delivery hour (hour ending 01-24)"""
+    return datetime.strptime(hour_key[:8], '%Y%m%d') + timedelta(hours=int(hour_key[8:]) - 1)
+
+def next_hour_key(hour_key: str) -> str:
+    """Delivery hour following a YYYYMMDDHH key (...24 is followed by 01 of the next day)"""
+    start = _hour_start(hour_key) + timedelta(hours=1)
+    return f"{start.strftime('%Y%m%d')}{start.hour + 1:02d}"
+
+def last_settled_hour(latest_hour: str, entries: List[FileEntry], failed_names: List[str]) -> Optional[str]:
+    """End of the unbroken run of hours after latest_hour that are listed and transferred.
+
+    A failed hour ends the run, and so does an hour not listed yet, so a file IESO
+    publishes late is still fetched; once HOUR_GAP_GRACE_HOURS of later hours are
+    listed, a missing hour is assumed never to come and is stepped over.
+    """
+    listed = {e.hour_key for e in entries if e.hour is not None}
+    failed = {h for h in (extract_hour_key(n) for n in failed_names) if h}
+    if not listed:
+        return None
+    newest = max(listed)
+    grace = timedelta(hours=HOUR_GAP_GRACE_HOURS)
+
+    settled = None
+    hour = next_hour_key(latest_hour)
+    while hour <= newest and hour not in failed:
+        if hour not in listed and _hour_start(newest) - _hour_start(hour) < grace:
+            break
+        settled = hour
+        hour = next_hour_key(hour)
+    return settled
@@ -0,0 +1,124 @@
+"""
+Startup Profiler
+Measures how long the scraper modules take to import, for tracking Function cold starts
+"""
+
+import argparse
+import importlib
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+
+DEFAULT_MODULES = [
+    'ieso_scraper.runner',
+    'ieso_scraper.gap_filler'
+]
+
+# Modules imported through timed_import() in this process, with their import time in seconds
+_import_times = {}
+_import_lock = threading.Lock()
+
+def timed_import(module_name: str):
+    """Import a module, recording the time taken the first time it is loaded"""
+    # Always go through importlib: it waits while another thread is still initialising
+    # the module, where a sys.modules lookup would return it half-imported
+    already_loaded = module_name in sys.modules
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if not already_loaded:
+        with _import_lock:
+            _import_times.setdefault(module_name, time.perf_counter() - started)
+    return module
+
+def import_times() -> Dict[str, float]:
+    with _import_lock:
+        return dict(_import_times)
+
+def format_import_times() -> str:
+    """One-line summary of the imports recorded in this process"""
+    times = import_times()
+    if not times:
+        return ""
+    parts = ', '.join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in times.items())
+    return f"🧊 Imports: {parts}"
+
+# Lines written by python -X importtime: "import time: self [us] | cumulative | name"
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+def profile_cold_start(modules: List[str], cwd: str = None) -> List[Dict]:
+    """Import modules in a fresh interpreter with -X importtime and return per-module timings"""
+    # Run next to the package so it imports without being installed (and finds config.py)
+    cwd = cwd or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = '; '.join(f"import {name}" for name in modules)
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, capture_output=True, text=True
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            rows.append({
+                'module': match.group(4),
+                'self_ms': int(match.group(1)) / 1000,
+                'cumulative_ms': int(match.group(2)) / 1000,
+                'depth': len(match.group(3)) // 2
+            })
+
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError('\n'.join(errors[-5:]) or result.stdout.strip() or f"exit code {result.returncode}")
+
+    return rows
+
+def group_by_package(rows: List[Dict]) -> Dict[str, float]:
+    """Self import time (ms) per top-level package, largest first"""
+    totals = {}
+    for row in rows:
+        package = row['module'].split('.')[0]
+        totals[package] = totals.get(package, 0.0) + row['self_ms']
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+def print_profile(rows: List[Dict], modules: List[str], top: int = 15):
+    total_ms = sum(row['self_ms'] for row in rows)
+
+    print("\n🧊 COLD START IMPORT PROFILE")
+    print("=" * 60)
+    print(f"📦 {len(rows)} modules imported in {total_ms:.0f}ms")
+
+    print(f"\n{'Module':40} | {'Cumulative':>10}")
+    print("-" * 60)
+    for row in rows:
+        if row['module'] in modules:
+            print(f"{row['module']:40} | {row['cumulative_ms']:8.0f}ms")
+
+    print(f"\n{'Package (self time)':40} | {'Time':>10}")
+    print("-" * 60)
+    for package, ms in list(group_by_package(rows).items())[:top]:
+        print(f"{package:40} | {ms:8.0f}ms")
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('modules', nargs='*', help=f"Modules to import (default: {', '.join(DEFAULT_MODULES)})")
+    parser.add_argument('--top', type=int, default=15, help="Number of packages to list")
+    args = parser.parse_args()
+
+    modules = args.modules or DEFAULT_MODULES
+
+    try:
+        rows = profile_cold_start(modules)
+    except RuntimeError as e:
+        print(f"❌ Import failed: {e}")
+        sys.exit(1)
+
+    print_profile(rows, modules, args.top)
+
+if __name__ == "__main__":
+    main()
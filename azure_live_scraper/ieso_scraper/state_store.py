@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
+
+from .azure_utils import get_blob_client, RAW_CONTAINER
+
+# Per-dataset ingestion watermarks ("blob" for production, "local" for development runs)
+STATE_BACKEND = os.environ.get('SCRAPER_STATE_BACKEND', 'blob')
+STATE_CONTAINER = os.environ.get('SCRAPER_STATE_CONTAINER', RAW_CONTAINER)
+STATE_PREFIX = "_state"
+STATE_DIR = os.environ.get('SCRAPER_STATE_DIR', os.path.join(tempfile.gettempdir(), 'ieso_scraper_state'))
+MAX_UPDATE_ATTEMPTS = 5
+
+# One lock per state document, so concurrent updates of a document in this process take
+# turns instead of racing on its ETag, while other documents are not held up
+_state_locks: Dict[str, threading.Lock] = {}
+_state_locks_lock = threading.Lock()
+
+class StateConflictError(Exception):
+    """Raised when another writer updated the state since it was read"""
+
+def _state_blob_path(dataset: str) -> str:
+    return f"{STATE_PREFIX}/{dataset}.json"
+
+def _local_path(dataset: str) -> str:
+    return os.path.join(STATE_DIR, f"{dataset}.json")
+
+def _state_lock(dataset: str) -> threading.Lock:
+    with _state_locks_lock:
+        lock = _state_locks.get(dataset)
+        if lock is None:
+            lock = _state_locks[dataset] = threading.Lock()
+    return lock
+
+def _read(dataset: str) -> Tuple[Dict, Optional[str]]:
+    """Return (state, version tag); the tag is the blob ETag or file mtime"""
+    if STATE_BACKEND == 'local':
+        path = _local_path(dataset)
+        try:
+            with open(path, 'r') as f:
+                return json.load(f), str(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            return {}, None
+
+    blob_client = get_blob_client(STATE_CONTAINER, _state_blob_path(dataset))
+    try:
+        downloader = blob_client.download_blob()
+        return json.loads(downloader.readall()), downloader.properties.etag
+    except ResourceNotFoundError:
+        return {}, None
+
+def _write(dataset: str, state: Dict, tag: Optional[str]):
+    """Replace the stored state atomically, failing if it changed since it was read"""
+    data = json.dumps(state, indent=2, sort_keys=True)
+
+    if STATE_BACKEND == 'local':
+        path = _local_path(dataset)
+        os.makedirs(STATE_DIR, exist_ok=True)
+        current = str(os.stat(path).st_mtime_ns) if os.path.exists(path) else None
+        if current != tag:
+            raise StateConflictError(dataset)
+        fd, tmp_path = tempfile.mkstemp(dir=STATE_DIR, prefix=f".{dataset}_")
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return
+
+    blob_client = get_blob_client(STATE_CONTAINER, _state_blob_path(dataset))
+    try:
+        if tag is None:
+            blob_client.upload_blob(data, overwrite=False)
+        else:
+            blob_client.upload_blob(data, overwrite=True, etag=tag, match_condition=MatchConditions.IfNotModified)
+    except (ResourceExistsError, ResourceModifiedError) as e:
+        raise StateConflictError(dataset) from e
+
+def load_state(dataset: str) -> Dict:
+    """Load the stored state for a dataset ({} if none yet)"""
+    try:
+        state, _ = _read(dataset)
+        return state
+    except Exception as e:
+        print(f"⚠️  Could not read state for {dataset}: {e}")
+        return {}
+
+def update_state(dataset: str, changes: Union[Dict, Callable[[Dict], None]]) -> Dict:
+    """Apply changes (a dict to merge or a function mutating the state) with optimistic concurrency"""
+    for attempt in range(1, MAX_UPDATE_ATTEMPTS + 1):
+        with _state_lock(dataset):
+            state, tag = _read(dataset)
+            if callable(changes):
+                changes(state)
+            else:
+                state.update(changes)
+            state['dataset'] = dataset
+            state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+            try:
+                _write(dataset, state, tag)
+                return state
+            except StateConflictError:
+                if attempt == MAX_UPDATE_ATTEMPTS:
+                    raise
+    return state
+
+def get_watermark_date(dataset: str) -> Optional[datetime]:
+    """Latest date fully ingested for a daily-partitioned dataset"""
+    latest_date = load_state(dataset).get('latest_date')
+    return datetime.strptime(latest_date, '%Y-%m-%d') if latest_date else None
+
+def get_watermark_version(dataset: str, year: int) -> Optional[int]:
+    """Latest version ingested for an annual dataset file"""
+    return load_state(dataset).get('latest_versions', {}).get(str(year))
+
+def get_watermark_hour(dataset: str) -> Optional[str]:
+    """Latest IESO delivery hour (YYYYMMDDHH, hour ending 01-24) fully ingested"""
+    state = load_state(dataset)
+    if state.get('latest_hour'):
+        return state['latest_hour']
+    # A fully ingested day implies its last hour
+    if state.get('latest_date'):
+        return state['latest_date'].replace('-', '') + '24'
+    return None
+
+def _advance(state: Dict, key: str, value: str):
+    if state.get(key) is None or value > state[key]:
+        state[key] = value
+
+def advance_watermark_date(dataset: str, latest_date: datetime, run_stats: Dict = None) -> Dict:
+    """Move the date watermark forward (never backwards) and record run stats"""
+    new_date = latest_date.strftime('%Y-%m-%d')
+    
+    def apply(state: Dict):
+        _advance(state, 'latest_date', new_date)
+        _advance(state, 'latest_hour', latest_date.strftime('%Y%m%d') + '24')
+        state['last_run'] = run_stats or {}
+    
+    return update_state(dataset, apply)
+
+def advance_watermark_hour(dataset: str, latest_hour: str, run_stats: Dict = None) -> Dict:
+    """Move the hour watermark forward; completing hour 24 also completes the day"""
+    def apply(state: Dict):
+        _advance(state, 'latest_hour', latest_hour)
+        if latest_hour.endswith('24'):
+            _advance(state, 'latest_date', datetime.strptime(latest_hour[:8], '%Y%m%d').strftime('%Y-%m-%d'))
+        state['last_run'] = run_stats or {}
+    
+    return update_state(dataset, apply)
+
+def advance_watermark_versions(dataset: str, versions: Dict[int, int], run_stats: Dict = None) -> Dict:
+    """Move per-year version watermarks forward and record run stats"""
+    def apply(state: Dict):
+        latest_versions = state.setdefault('latest_versions', {})
+        for year, version in versions.items():
+            if version > latest_versions.get(str(year), -1):
+                latest_versions[str(year)] = version
+        state['last_run'] = run_stats or {}
+    
+    return update_state(dataset, apply)
+
+def get_delta_cursor(dataset: str, year: int) -> Optional[Dict]:
+    """Resume point for delta ingestion of an annual file"""
+    return load_state(dataset).get('delta', {}).get(str(year))
+
+def set_delta_cursor(dataset: str, year: int, cursor: Dict) -> Dict:
+    """Store the resume point reached by the latest delta-ingested version"""
+    def apply(state: Dict):
+        state.setdefault('delta', {})[str(year)] = cursor
+    
+    return update_state(dataset, apply)
@@ -0,0 +1,211 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict
+
+from .scraper_utils import iter_download
+from .azure_utils import upload_stream_to_blob, build_blob_path
+from .blob_index import BlobIndex, build_blob_index
+from .rate_limiter import rate_limiter_stats, format_rate_limiter_stats
+from .content_index import ContentIndex, HashingStream, load_content_index, ONLY_IF_CHANGED, HASH_METADATA_KEY
+
+# Tunables (override with environment variables in the Function App settings)
+DEFAULT_MAX_WORKERS = int(os.environ.get('SCRAPER_MAX_WORKERS', '8'))
+DEFAULT_MAX_RETRIES = int(os.environ.get('SCRAPER_MAX_RETRIES', '3'))
+RETRY_BACKOFF_SECONDS = float(os.environ.get('SCRAPER_RETRY_BACKOFF', '2'))
+
+class TransferReport:
+    """Aggregate result of a batch of file transfers for one dataset"""
+
+    def __init__(self, dataset: str, total: int):
+        self.dataset = dataset
+        self.total = total
+        self.results = []
+        self.started_at = time.time()
+        self.finished_at = None
+        self.listing_calls = 0
+        self.fallback_checks = 0
+
+    def add(self, result: Dict):
+        self.results.append(result)
+
+    def finish(self):
+        self.finished_at = time.time()
+
+    def _count(self, status: str) -> int:
+        return sum(1 for r in self.results if r['status'] == status)
+
+    @property
+    def uploaded(self) -> int:
+        return self._count('uploaded')
+
+    @property
+    def skipped(self) -> int:
+        return self._count('skipped')
+
+    @property
+    def unchanged(self) -> int:
+        return self._count('unchanged')
+
+    @property
+    def failed(self) -> int:
+        return self._count('failed')
+
+    @property
+    def cancelled(self) -> int:
+        return self._count('cancelled')
+
+    @property
+    def failed_names(self) -> List[str]:
+        return [r['name'] for r in self.results if r['status'] == 'failed']
+
+    @property
+    def success_count(self) -> int:
+        """Files whose content is now in blob storage (uploaded, already there or identical to a stored blob)"""
+        return self.uploaded + self.skipped + self.unchanged
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(r['bytes'] for r in self.results)
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.time()
+        return end - self.started_at
+
+    def to_dict(self) -> Dict:
+        return {
+            'dataset': self.dataset,
+            'total': self.total,
+            'uploaded': self.uploaded,
+            'skipped': self.skipped,
+            'unchanged': self.unchanged,
+            'failed': self.failed,
+            'cancelled': self.cancelled,
+            'bytes': self.bytes_transferred,
+            'elapsed_seconds': round(self.elapsed, 2),
+            'listing_calls': self.listing_calls,
+            'fallback_checks': self.fallback_checks,
+            'http': rate_limiter_stats(),
+            'failures': [
+                {'name': r['name'], 'error': r['error']}
+                for r in self.results if r['status'] == 'failed'
+            ]
+        }
+
+    def print_summary(self):
+        print("\n🎉 Gap filling complete!")
+        print(f"✅ Successfully processed: {self.success_count}/{self.total} files "
+              f"({self.uploaded} uploaded, {self.skipped} already present, {self.unchanged} unchanged)")
+        if self.failed:
+            print(f"❌ Failed: {self.failed} files")
+            for r in self.results:
+                if r['status'] == 'failed':
+                    print(f"   • {r['name']}: {r['error']}")
+        if self.cancelled:
+            print(f"⏹️  Cancelled: {self.cancelled} files not started before the run was cancelled")
+        print(f"⏱️  {self.elapsed:.1f}s, {self.bytes_transferred / 1024 / 1024:.1f} MB transferred")
+        http_summary = format_rate_limiter_stats()
+        if http_summary:
+            print(http_summary)
+
+def transfer_file(file: Dict, dataset: str, container: str, blob_index: BlobIndex,
+                  max_retries: int = DEFAULT_MAX_RETRIES, content_index: ContentIndex = None,
+                  only_if_changed: bool = False, cancel: threading.Event = None) -> Dict:
+    """Copy one IESO file into blob storage, retrying transient failures (none once cancel is set)"""
+    blob_path = build_blob_path(dataset, file['name'])
+    result = {
+        'name': file['name'],
+        'blob_path': blob_path,
+        'status': 'failed',
+        'attempts': 0,
+        'bytes': 0,
+        'error': None,
+        'duplicate_of': None
+    }
+    content_index = content_index or ContentIndex(dataset)
+
+    for attempt in range(1, max_retries + 1):
+        if cancel is not None and cancel.is_set():
+            result['status'] = 'cancelled'
+            return result
+        result['attempts'] = attempt
+        try:
+            if blob_index.exists(blob_path) or content_index.is_duplicate(blob_path):
+                print(f"⏭️  Already exists: {file['name']}")
+                result['status'] = 'skipped'
+                return result
+
+            print(f"📥 Streaming: {file['name']}")
+            stream = HashingStream(iter_download(file['url']))
+
+            def before_commit():
+                # Hash is complete once every block is staged; identical content is not committed again
+                digest = stream.hexdigest()
+                result['duplicate_of'] = content_index.find_duplicate(digest, blob_path, only_if_changed)
+                return None if result['duplicate_of'] else {HASH_METADATA_KEY: digest}
+
+            result['bytes'] = upload_stream_to_blob(stream, blob_path, container, before_commit=before_commit)
+            if result['duplicate_of']:
+                print(f"♻️  Unchanged: {file['name']} matches {result['duplicate_of']}")
+                result['status'] = 'unchanged'
+            else:
+                # Only committed blobs go into the index, so a failed commit is never a dedup target
+                content_index.record(stream.hexdigest(), blob_path)
+                blob_index.add(blob_path)
+                result['status'] = 'uploaded'
+            result['error'] = None
+            return result
+        except Exception as e:
+            result['error'] = str(e)
+
+        if attempt < max_retries:
+            delay = RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+            print(f"🔁 Retrying {file['name']} in {delay:.0f}s (attempt {attempt}/{max_retries}): {result['error']}")
+            time.sleep(delay)
+
+    print(f"❌ Giving up on {file['name']} after {max_retries} attempts: {result['error']}")
+    return result
+
+def transfer_files(files: List[Dict], dataset: str, container: str,
+                   max_workers: int = None, max_retries: int = None,
+                   blob_index: BlobIndex = None, only_if_changed: bool = None,
+                   cancel: threading.Event = None) -> TransferReport:
+    """Download and upload files concurrently with a bounded worker pool.
+
+    Once cancel is set, files not started yet are reported as cancelled and the
+    content index is not saved, so an abandoned run leaves no state behind.
+    """
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    max_retries = max_retries or DEFAULT_MAX_RETRIES
+    only_if_changed = ONLY_IF_CHANGED if only_if_changed is None else only_if_changed
+
+    report = TransferReport(dataset, len(files))
+    if not files:
+        report.finish()
+        return report
+
+    # One listing per month/year folder instead of one HEAD request per file
+    if blob_index is None:
+        blob_index = build_blob_index(container, (build_blob_path(dataset, f['name']) for f in files))
+    content_index = load_content_index(dataset)
+
+    workers = min(max_workers, len(files))
+    print(f"🚚 Transferring {len(files)} {dataset} files with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{dataset}-transfer") as executor:
+        futures = {
+            executor.submit(transfer_file, file, dataset, container, blob_index, max_retries,
+                            content_index, only_if_changed, cancel): file
+            for file in files
+        }
+        for future in as_completed(futures):
+            report.add(future.result())
+
+    if cancel is None or not cancel.is_set():
+        content_index.save()
+    report.listing_calls = blob_index.listing_calls
+    report.fallback_checks = blob_index.fallback_checks
+    report.finish()
+    return report
@@ -24,12 +24,12 @@ def setup_config():
     shutil.copy(config_template, config_file)
     print(f"✅ Created {config_file} from template")
     
-    print(f"\n📝 Next steps:")
+    print("\n📝 Next steps:")
     print(f"1. Edit {config_file} and add your Azure credentials:")
-    print(f"   - ACCOUNT_NAME: Your Azure storage account name")
-    print(f"   - ACCOUNT_KEY: Your Azure storage account key")
-    print(f"2. Install dependencies: pip install -r requirements.txt")
-    print(f"3. Run scraper: python energylmp_gap_filler.py")
+    print("   - ACCOUNT_NAME: Your Azure storage account name")
+    print("   - ACCOUNT_KEY: Your Azure storage account key")
+    print("2. Install dependencies: pip install -r requirements.txt")
+    print("3. Run scraper: python -m ieso_scraper EnergyLMP")
 
 def main():
     """Main setup function"""
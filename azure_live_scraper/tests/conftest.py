@@ -0,0 +1,45 @@
+"""
+Shared fixtures: blob storage is the filesystem stand-in from benchmarks/, and
+scraper state goes to a per-test local directory, so the suite runs offline.
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_ROOT = os.path.dirname(TESTS_DIR)
+sys.path.append(PACKAGE_ROOT)
+sys.path.append(os.path.join(PACKAGE_ROOT, 'benchmarks'))
+# The cleaners and the backfill are scripts next to the package
+sys.path.append(os.path.join(os.path.dirname(PACKAGE_ROOT), 'azure_push_clean'))
+sys.path.append(os.path.join(os.path.dirname(PACKAGE_ROOT), 'backfill_script_uncleaned'))
+
+from blob_standin import BlobStandInServer
+from ieso_scraper import blob_clients, state_store
+
+@pytest.fixture(scope='session')
+def blob_server(tmp_path_factory):
+    server = BlobStandInServer(str(tmp_path_factory.mktemp('blobs'))).start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def blob_storage(blob_server, monkeypatch):
+    """Stand-in with empty raw and cleaned containers, reached through the shared client registry"""
+    for container in (blob_clients.RAW_CONTAINER, blob_clients.CLEANED_CONTAINER):
+        blob_server.store.delete_container(container)
+        blob_server.store.create_container(container)
+    monkeypatch.setattr(blob_clients, 'CONNECTION_STRING', blob_server.connection_string)
+    monkeypatch.setattr(blob_clients, '_service_clients', {})
+    monkeypatch.setattr(blob_clients, '_container_clients', {})
+    return blob_server
+
+@pytest.fixture
+def local_state(tmp_path, monkeypatch):
+    """State documents in a fresh local directory"""
+    state_dir = tmp_path / 'state'
+    monkeypatch.setattr(state_store, 'STATE_BACKEND', 'local')
+    monkeypatch.setattr(state_store, 'STATE_DIR', str(state_dir))
+    return state_dir
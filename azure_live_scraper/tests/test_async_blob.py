@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from ieso_scraper.async_blob import (
+    AsyncBlobStore, download_blobs, download_blobs_to_files, list_containers, upload_blobs
+)
+from ieso_scraper.blob_clients import CLEANED_CONTAINER, RAW_CONTAINER
+
+BLOBS = {f"GenMix/year=2025/part-{i}.csv": f"day,{i}\n".encode() * (i + 1) for i in range(6)}
+
+@pytest.fixture
+def store_options(blob_storage):
+    return {'connection_string': blob_storage.connection_string, 'concurrency': 3}
+
+def test_upload_list_and_download(store_options):
+    sizes, failed = upload_blobs(RAW_CONTAINER, BLOBS, **store_options)
+    assert failed == {}
+    assert sizes == {name: len(data) for name, data in BLOBS.items()}
+
+    listed = list_containers([RAW_CONTAINER, CLEANED_CONTAINER], prefix='GenMix/', **store_options)
+    assert sorted(listed[RAW_CONTAINER]) == sorted(BLOBS) and listed[CLEANED_CONTAINER] == []
+
+    data, failed = download_blobs(RAW_CONTAINER, BLOBS, **store_options)
+    assert data == BLOBS and failed == {}
+
+def test_missing_container_and_blob(store_options):
+    upload_blobs(RAW_CONTAINER, BLOBS, **store_options)
+
+    # A container that cannot be listed maps to []
+    assert list_containers(['no-such-container'], **store_options) == {'no-such-container': []}
+
+    missing = 'GenMix/year=2025/missing.csv'
+    data, failed = download_blobs(RAW_CONTAINER, [missing, *BLOBS], **store_options)
+    assert data == BLOBS and list(failed) == [missing]
+
+    _, failed = upload_blobs('no-such-container', {'a.csv': b'a'}, **store_options)
+    assert list(failed) == ['a.csv']
+
+def test_exists_many(store_options):
+    upload_blobs(RAW_CONTAINER, BLOBS, **store_options)
+    names = [*BLOBS, 'GenMix/year=2025/missing.csv']
+
+    async def run():
+        async with AsyncBlobStore(**store_options) as store:
+            return (await store.exists_many(RAW_CONTAINER, names),
+                    await store.exists_many('no-such-container', names[:2]))
+
+    found, in_missing_container = asyncio.run(run())
+    assert found == {**{name: True for name in BLOBS}, names[-1]: False}
+    assert in_missing_container == {name: False for name in names[:2]}
+
+def test_download_to_files(store_options, tmp_path):
+    upload_blobs(RAW_CONTAINER, BLOBS, **store_options)
+    paths = {name: str(tmp_path / name.rsplit('/', 1)[-1]) for name in BLOBS}
+    sizes, failed = download_blobs_to_files(RAW_CONTAINER, paths, **store_options)
+
+    assert failed == {}
+    for name, path in paths.items():
+        with open(path, 'rb') as f:
+            assert f.read() == BLOBS[name]
+        assert sizes[name] == len(BLOBS[name])
+
+class _BrokenStream:
+    """Download stream that drops the connection after its first chunk"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    async def chunks(self):
+        async for chunk in self.stream.chunks():
+            yield chunk
+            raise ConnectionError("connection reset")
+
+def test_failed_download_leaves_no_partial_file(store_options, tmp_path):
+    upload_blobs(RAW_CONTAINER, BLOBS, **store_options)
+    names = list(BLOBS)[:2]
+    paths = {name: str(tmp_path / name.rsplit('/', 1)[-1]) for name in names}
+    with open(paths[names[0]], 'wb') as f:
+        f.write(b'previous download')
+
+    async def run(broken):
+        async with AsyncBlobStore(**store_options) as store:
+            if broken:
+                container = store.container(RAW_CONTAINER)
+                download_blob = container.download_blob
+
+                async def broken_download(name, **kwargs):
+                    return _BrokenStream(await download_blob(name, **kwargs))
+                container.download_blob = broken_download
+            return await store.download_many_to_files(RAW_CONTAINER, paths)
+
+    sizes, failed = asyncio.run(run(broken=True))
+    assert sizes == {} and sorted(failed) == sorted(names)
+    # The earlier file is untouched, nothing half-written is left next to it
+    assert sorted(p.name for p in tmp_path.iterdir()) == [names[0].rsplit('/', 1)[-1]]
+    with open(paths[names[0]], 'rb') as f:
+        assert f.read() == b'previous download'
+
+    sizes, failed = asyncio.run(run(broken=False))
+    assert failed == {} and sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        name.rsplit('/', 1)[-1] for name in names)
+    for name, path in paths.items():
+        with open(path, 'rb') as f:
+            assert f.read() == BLOBS[name]
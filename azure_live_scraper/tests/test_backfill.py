@@ -0,0 +1,111 @@
+from datetime import datetime
+
+import pytest
+
+import backfill
+from backfill import Checkpoint, plan_dataset, run_dataset, select_files
+from ieso_scraper import transfer_engine
+from ieso_scraper.azure_utils import build_blob_path
+from ieso_scraper.blob_clients import RAW_CONTAINER, get_container_client
+
+HOURLY = {'granularity': 'hourly', 'selection': 'latest_per_day'}
+ANNUAL = {'granularity': 'annual', 'selection': 'latest_per_year'}
+
+def ieso_file(name):
+    return {'name': name, 'url': f"http://ieso.invalid/{name}", 'size': '1K'}
+
+def names(files):
+    return [f['name'] for f in files]
+
+LISTING = [ieso_file(name) for name in (
+    'PUB_RealtimeEnergyLMP_2025010124.csv',
+    'PUB_RealtimeEnergyLMP_2025010223.csv',
+    'PUB_RealtimeEnergyLMP_2025010223_v2.csv',
+    'PUB_RealtimeEnergyLMP_2025010224.csv',
+    'PUB_RealtimeEnergyLMP_2025010301_v1.csv',
+    'PUB_RealtimeEnergyLMP_2025010301.csv',
+    'PUB_RealtimeEnergyLMP_2025010401.csv',
+    'PUB_RealtimeEnergyLMP.csv',
+)]
+
+def test_select_last_file_of_each_day():
+    selected = select_files(LISTING, HOURLY, datetime(2025, 1, 2), datetime(2025, 1, 3))
+    assert names(selected) == ['PUB_RealtimeEnergyLMP_2025010224.csv', 'PUB_RealtimeEnergyLMP_2025010301_v1.csv']
+
+def test_select_latest_version_of_every_hour():
+    selected = select_files(LISTING, {**HOURLY, 'selection': 'all_hours'}, datetime(2025, 1, 1), datetime(2025, 1, 3))
+    assert names(selected) == [
+        'PUB_RealtimeEnergyLMP_2025010124.csv',
+        'PUB_RealtimeEnergyLMP_2025010223_v2.csv',
+        'PUB_RealtimeEnergyLMP_2025010224.csv',
+        'PUB_RealtimeEnergyLMP_2025010301_v1.csv',
+    ]
+
+def test_select_latest_version_of_each_year():
+    listing = [ieso_file(name) for name in (
+        'PUB_GenOutputbyFuelHourly_2023.xml',
+        'PUB_GenOutputbyFuelHourly_2024_v3.xml',
+        'PUB_GenOutputbyFuelHourly_2024_v12.xml',
+        'PUB_GenOutputbyFuelHourly_2024.xml',
+        'PUB_GenOutputbyFuelHourly_2025_v1.xml',
+    )]
+    selected = select_files(listing, ANNUAL, datetime(2024, 6, 1), datetime(2025, 1, 31))
+    assert names(selected) == ['PUB_GenOutputbyFuelHourly_2024_v12.xml', 'PUB_GenOutputbyFuelHourly_2025_v1.xml']
+
+def test_interrupted_run_resumes_from_the_checkpoint(blob_storage, local_state, tmp_path, monkeypatch):
+    listing = [ieso_file(f"PUB_RealtimeEnergyLMP_202501{day:02d}24.csv") for day in range(1, 7)]
+    monkeypatch.setattr(backfill, 'scrape_ieso_directory', lambda url, pattern: listing)
+    downloads = []
+
+    def interrupted_download(url):
+        downloads.append(url.rsplit('/', 1)[-1])
+        if url.endswith('2025010224.csv'):
+            raise ValueError("connection reset")
+        if url.endswith('2025010424.csv'):
+            raise KeyboardInterrupt
+        yield b'delivery,hour\n'
+
+    monkeypatch.setattr(transfer_engine, 'iter_download', interrupted_download)
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.jsonl'))
+    start, end = datetime(2025, 1, 1), datetime(2025, 1, 6)
+
+    plan = plan_dataset('EnergyLMP', start, end, set())
+    assert plan['selected'] == 6 and plan['done'] == 0
+    with pytest.raises(KeyboardInterrupt):
+        run_dataset(plan, checkpoint, workers=1, max_retries=1)
+
+    # Completed files are checkpointed; the failed one and those never started are not
+    assert checkpoint.completed() == {'EnergyLMP': {'PUB_RealtimeEnergyLMP_2025010124.csv',
+                                                    'PUB_RealtimeEnergyLMP_2025010324.csv'}}
+    # A line cut short by the interruption is ignored
+    with open(checkpoint.path, 'a') as f:
+        f.write('{"dataset": "EnergyLMP", "name": "PUB_RealtimeEnergyLMP_20250105')
+    assert len(checkpoint.completed()['EnergyLMP']) == 2
+
+    # The rerun, as a new process
+    checkpoint = Checkpoint(checkpoint.path)
+    monkeypatch.setattr(transfer_engine, 'iter_download', lambda url: downloads.append(url.rsplit('/', 1)[-1])
+                        or iter([b'delivery,hour\n']))
+    downloads.clear()
+    plan = plan_dataset('EnergyLMP', start, end, checkpoint.completed()['EnergyLMP'])
+    assert plan['done'] == 2
+    report = run_dataset(plan, checkpoint, workers=1, max_retries=1)
+
+    assert report.success_count == 4 and report.failed == 0
+    # Checkpointed files are not fetched again; one the worker finished after the
+    # interrupt is not checkpointed, but found in storage
+    assert {names(listing)[i] for i in (1, 3, 5)} <= set(downloads) <= {names(listing)[i] for i in (1, 3, 4, 5)}
+    assert checkpoint.completed()['EnergyLMP'] == set(names(listing))
+    raw = get_container_client(RAW_CONTAINER)
+    assert all(raw.get_blob_client(build_blob_path('EnergyLMP', name)).exists() for name in names(listing))
+
+def test_restart_discards_the_checkpoint(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.jsonl'))
+    checkpoint.record('GenMix', {'name': 'PUB_GenOutputbyFuelHourly_2025.xml', 'status': 'uploaded',
+                                 'bytes': 10, 'error': None})
+    checkpoint.record('GenMix', {'name': 'PUB_GenOutputbyFuelHourly_2024.xml', 'status': 'failed',
+                                 'bytes': 0, 'error': 'timeout'})
+    assert checkpoint.completed() == {'GenMix': {'PUB_GenOutputbyFuelHourly_2025.xml'}}
+
+    checkpoint.reset()
+    assert checkpoint.completed() == {}
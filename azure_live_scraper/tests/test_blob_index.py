@@ -0,0 +1,47 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ieso_scraper import blob_index
+from ieso_scraper.blob_index import BlobIndex, build_blob_index, covering_prefixes
+
+PATHS = [f"EnergyLMP/year=2025/month=03/day={day:02d}/PUB_RealtimeEnergyLMP_202503{day:02d}01.csv"
+         for day in range(1, 4)]
+
+def test_covering_prefixes():
+    assert covering_prefixes(PATHS) == ['EnergyLMP/year=2025/month=03/day=0']
+    assert covering_prefixes(PATHS[:1] + ['GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.xml']) == [
+        'EnergyLMP/year=2025/month=03/day=01/', 'GenMix/year=2025/']
+
+def test_index_answers_from_one_listing(monkeypatch):
+    listed = []
+    monkeypatch.setattr(blob_index, 'iter_blob_names', lambda container, prefix: listed.append(prefix) or PATHS[:2])
+    monkeypatch.setattr(blob_index, 'check_blob_exists', lambda path, container: pytest.fail("checked " + path))
+
+    index = build_blob_index('raw-data', PATHS)
+    assert listed == ['EnergyLMP/year=2025/month=03/day=0'] and index.listing_calls == 1
+    assert [path in index for path in PATHS] == [True, True, False]
+    index.add(PATHS[2])
+    assert PATHS[2] in index and index.fallback_checks == 0
+
+@pytest.fixture
+def frequent_switches():
+    """Switch threads as often as possible, so unguarded read-modify-writes interleave"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def test_fallback_checks_counted_across_threads(monkeypatch, frequent_switches):
+    monkeypatch.setattr(blob_index, 'check_blob_exists', lambda path, container: False)
+    # Not loaded: every lookup falls back to a per-blob check
+    index = BlobIndex('raw-data', ['EnergyLMP/'])
+
+    def lookups(_):
+        for _ in range(2000):
+            index.exists(PATHS[0])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lookups, range(8)))
+    assert index.fallback_checks == 16000
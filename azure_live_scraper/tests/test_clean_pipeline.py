@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+
+from ieso_scraper import clean_pipeline
+from ieso_scraper.blob_clients import CLEANED_CONTAINER, RAW_CONTAINER, get_container_client
+from ieso_scraper.clean_pipeline import (
+    SOURCE_ETAG_KEY,
+    SOURCE_MODIFIED_KEY,
+    CLEANER_VERSION_KEY,
+    is_current,
+    iter_chunks,
+    lineage_metadata,
+    run_clean_pipeline
+)
+
+PREFIX = 'EnergyLMP/year=2025/'
+
+def clean_upper(blob_name, raw):
+    """Module-level, so the process pool can run it"""
+    if b'skip' in raw.read(4):
+        return None
+    raw.seek(0)
+    if blob_name.endswith('_bad.csv'):
+        raise ValueError("bad rows")
+    body = b''.join(chunk.upper() for chunk in iter_chunks(raw, size=64))
+    return {'.csv': body}, [f"cleaned {blob_name}"]
+
+def seed(names, body=b'delivery,hour\n1,2\n' * 100):
+    raw = get_container_client(RAW_CONTAINER)
+    for name in names:
+        raw.upload_blob(PREFIX + name, body, overwrite=True)
+
+def run(**options):
+    options.setdefault('parse_workers', 1)
+    return run_clean_pipeline(PREFIX, clean_upper, suffix='.csv', extensions=['.csv'], **options)
+
+def cleaned(name):
+    return get_container_client(CLEANED_CONTAINER).get_blob_client(PREFIX + name)
+
+SOURCE = lineage_metadata('"0x8DD1"', datetime(2025, 3, 1, 6, 0), '2')
+
+def test_lineage_matches_the_same_source_and_cleaner():
+    assert SOURCE == {SOURCE_ETAG_KEY: '0x8DD1', SOURCE_MODIFIED_KEY: '2025-03-01T06:00:00', CLEANER_VERSION_KEY: '2'}
+    assert is_current(dict(SOURCE), SOURCE)
+    # The ETag decides when both sides have one, whatever the recorded time
+    assert is_current({**SOURCE, SOURCE_MODIFIED_KEY: '2024-01-01T00:00:00'}, SOURCE)
+    # Blobs cleaned before ETags were recorded fall back to the last-modified time
+    assert is_current({**SOURCE, SOURCE_ETAG_KEY: ''}, SOURCE)
+
+def test_lineage_mismatch_means_stale():
+    assert not is_current(None, SOURCE)
+    assert not is_current({}, SOURCE)
+    assert not is_current({**SOURCE, SOURCE_ETAG_KEY: '0x8DD2'}, SOURCE)
+    assert not is_current({**SOURCE, CLEANER_VERSION_KEY: '1'}, SOURCE)
+    assert not is_current({**SOURCE, SOURCE_ETAG_KEY: '', SOURCE_MODIFIED_KEY: '2025-03-01T07:00:00'}, SOURCE)
+    # Without an ETag or a time on the source there is nothing to match
+    assert not is_current({CLEANER_VERSION_KEY: '2'}, lineage_metadata(None, None, '2'))
+
+@pytest.fixture
+def spool(tmp_path, monkeypatch):
+    monkeypatch.setattr(clean_pipeline, 'CLEAN_SPOOL_DIR', str(tmp_path))
+    return tmp_path
+
+def test_blobs_are_cleaned_from_spool_files(blob_storage, spool):
+    seed([f"a{i}.csv" for i in range(5)])
+    report = run()
+
+    assert report.processed == 5 and report.failed == 0
+    assert cleaned('a0.csv').download_blob().readall() == b'DELIVERY,HOUR\n1,2\n' * 100
+    raw_etag = get_container_client(RAW_CONTAINER).get_blob_client(PREFIX + 'a0.csv').get_blob_properties().etag
+    assert cleaned('a0.csv').get_blob_properties().metadata[SOURCE_ETAG_KEY] == raw_etag.strip('"')
+    # Spool files are removed as soon as each blob is parsed, and the spool directory at the end
+    assert list(spool.iterdir()) == []
+
+def test_only_changed_blobs_are_cleaned_again(blob_storage, spool):
+    seed(['a.csv', 'b.csv', 'c.csv'])
+    run()
+    assert run().unchanged == 3
+
+    seed(['b.csv'], body=b'changed\n')
+    report = run()
+    assert (report.processed, report.unchanged) == (1, 2)
+    assert cleaned('b.csv').download_blob().readall() == b'CHANGED\n'
+    assert run(incremental=False).processed == 3
+    # A new cleaner version re-cleans everything once
+    assert run(cleaner_version='2').processed == 3
+    assert run(cleaner_version='2').unchanged == 3
+
+def test_failed_and_skipped_blobs_do_not_stop_the_run(blob_storage, spool):
+    seed(['a.csv', 'b_bad.csv'])
+    seed(['c.csv'], body=b'skip this one')
+    report = run()
+
+    assert (report.processed, report.skipped) == (1, 1)
+    assert list(report.failures) == [PREFIX + 'b_bad.csv']
+    assert not cleaned('b_bad.csv').exists() and not cleaned('c.csv').exists()
+    assert list(spool.iterdir()) == []
+
+def test_process_pool(blob_storage, spool):
+    seed([f"a{i}.csv" for i in range(4)])
+    report = run(parse_workers=2)
+    assert report.processed == 4 and report.failed == 0
+    assert list(spool.iterdir()) == []
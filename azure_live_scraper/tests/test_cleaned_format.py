@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from ieso_scraper.cleaned_format import encode, output_extensions, preferred_files, read_cleaned
+
+GENMIX = pd.DataFrame({
+    'timestamp': pd.to_datetime(['2025-01-01 00:00', '2025-01-01 00:00', '2025-01-01 01:00']),
+    'fuel': ['NUCLEAR', 'GAS', 'NUCLEAR'],
+    'output': [9000.0, 1500.5, 9010.0],
+    'output_quality': [0, -1, 0],
+})
+
+def test_parquet_preferred_over_its_csv_export():
+    names = [
+        'GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.csv',
+        'GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.parquet',
+        'GenMix/year=2024/PUB_GenOutputbyFuelHourly_2024.csv',
+        'GenMix/year=2024/notes.txt',
+        'GenMix/year=2023/PUB_GenOutputbyFuelHourly_2023.parquet',
+    ]
+    expected = [
+        'GenMix/year=2023/PUB_GenOutputbyFuelHourly_2023.parquet',
+        # Not migrated yet: the CSV is the output
+        'GenMix/year=2024/PUB_GenOutputbyFuelHourly_2024.csv',
+        'GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.parquet',
+    ]
+    assert preferred_files(names) == expected
+    assert preferred_files(reversed(names)) == expected
+    assert preferred_files([]) == []
+
+def test_output_extensions():
+    assert output_extensions('parquet', csv_export=False) == ['.parquet']
+    assert output_extensions('parquet', csv_export=True) == ['.parquet', '.csv']
+    assert output_extensions('csv', csv_export=True) == ['.csv']
+    with pytest.raises(ValueError):
+        output_extensions('xlsx')
+
+def test_read_parquet_keeps_the_schema():
+    payloads = encode(GENMIX, 'GenMix', ['.parquet', '.csv'])
+    df = read_cleaned(payloads['.parquet'], 'PUB_GenOutputbyFuelHourly_2025.parquet')
+
+    assert list(df.columns) == list(GENMIX.columns)
+    assert df['fuel'].dtype == 'category' and df['output'].dtype == 'float32'
+    assert df['output_quality'].dtype == 'int8'
+    assert (df['timestamp'] == GENMIX['timestamp']).all()
+    assert df['output'].tolist() == GENMIX['output'].tolist()
+
+def test_read_csv_fallback():
+    payloads = encode(GENMIX, 'GenMix', ['.parquet', '.csv'])
+    df = read_cleaned(payloads['.csv'], 'PUB_GenOutputbyFuelHourly_2025.csv')
+
+    # Same values, with the types CSV can carry
+    assert df['fuel'].tolist() == GENMIX['fuel'].tolist()
+    assert df['output'].tolist() == GENMIX['output'].tolist()
+    assert (pd.to_datetime(df['timestamp']) == GENMIX['timestamp']).all()
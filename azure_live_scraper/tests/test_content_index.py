@@ -0,0 +1,65 @@
+from ieso_scraper import transfer_engine
+from ieso_scraper.blob_index import BlobIndex
+from ieso_scraper.blob_clients import RAW_CONTAINER, get_container_client
+from ieso_scraper.content_index import ContentIndex, load_content_index
+
+def ieso_file(name):
+    return {'name': name, 'url': f"http://ieso.invalid/{name}"}
+
+def serve(monkeypatch, body):
+    monkeypatch.setattr(transfer_engine, 'iter_download', lambda url: iter([body]))
+
+def test_duplicate_found_only_for_recorded_content():
+    index = ContentIndex('EnergyLMP')
+    assert index.find_duplicate('abc', 'a.csv', only_if_changed=True) is None
+
+    index.record('abc', 'a.csv')
+    assert index.find_duplicate('abc', 'a.csv', only_if_changed=True) is None
+    assert index.find_duplicate('abc', 'b.csv', only_if_changed=False) is None
+    assert index.find_duplicate('abc', 'b.csv', only_if_changed=True) == 'a.csv'
+    assert index.is_duplicate('b.csv')
+
+def test_republished_copy_is_not_committed(blob_storage, local_state, monkeypatch):
+    serve(monkeypatch, b'delivery hour 1')
+    blob_index = BlobIndex(RAW_CONTAINER, [])
+    index = ContentIndex('EnergyLMP')
+
+    first = transfer_engine.transfer_file(ieso_file('PUB_RealtimeEnergyLMP_2025010101.csv'), 'EnergyLMP',
+                                          RAW_CONTAINER, blob_index, content_index=index, only_if_changed=True)
+    copy = transfer_engine.transfer_file(ieso_file('PUB_RealtimeEnergyLMP_2025010101_v1.csv'), 'EnergyLMP',
+                                         RAW_CONTAINER, blob_index, content_index=index, only_if_changed=True)
+    index.save()
+
+    assert first['status'] == 'uploaded'
+    assert copy['status'] == 'unchanged' and copy['duplicate_of'] == first['blob_path']
+    names = [blob.name for blob in get_container_client(RAW_CONTAINER).list_blobs()]
+    assert names == [first['blob_path']]
+    stored = load_content_index('EnergyLMP')
+    assert list(stored.hashes.values()) == [first['blob_path']]
+    assert stored.duplicates == {copy['blob_path']: first['blob_path']}
+
+def test_failed_commit_is_not_indexed(blob_storage, local_state, monkeypatch):
+    serve(monkeypatch, b'delivery hour 1')
+
+    def failing_upload(chunks, blob_path, container, before_commit=None):
+        for _ in chunks:
+            pass
+        before_commit()
+        raise ConnectionError("commit_block_list failed")
+
+    upload = transfer_engine.upload_stream_to_blob
+    monkeypatch.setattr(transfer_engine, 'upload_stream_to_blob', failing_upload)
+    blob_index = BlobIndex(RAW_CONTAINER, [])
+    index = ContentIndex('EnergyLMP')
+    failed = transfer_engine.transfer_file(ieso_file('PUB_RealtimeEnergyLMP_2025010101.csv'), 'EnergyLMP',
+                                           RAW_CONTAINER, blob_index, max_retries=1, content_index=index,
+                                           only_if_changed=True)
+    index.save()
+    assert failed['status'] == 'failed'
+    assert load_content_index('EnergyLMP').hashes == {}
+
+    # The same content published under another name must still be stored
+    monkeypatch.setattr(transfer_engine, 'upload_stream_to_blob', upload)
+    retry = transfer_engine.transfer_file(ieso_file('PUB_RealtimeEnergyLMP_2025010101_v1.csv'), 'EnergyLMP',
+                                          RAW_CONTAINER, blob_index, content_index=index, only_if_changed=True)
+    assert retry['status'] == 'uploaded'
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+
+from mock_ieso import ANNUAL_BODIES, Catalog, MockIESOServer, REPORTS
+from ieso_scraper import delta_ingest
+from ieso_scraper.blob_clients import RAW_CONTAINER, get_container_client
+from ieso_scraper.delta_ingest import FORMATS, ingest_file_delta, partition_blob_path
+from ieso_scraper.state_store import get_delta_cursor, set_delta_cursor
+
+@pytest.fixture
+def ieso(blob_storage, local_state, monkeypatch):
+    # Small chunks, so days and the resume anchor straddle chunk boundaries
+    monkeypatch.setattr(delta_ingest, 'DOWNLOAD_CHUNK_SIZE', 97)
+    server = MockIESOServer(Catalog(datetime(2025, 3, 7), days=7)).start()
+    yield server
+    server.stop()
+
+DAYS = [datetime(2025, 3, day) for day in range(1, 8)]
+
+def annual_file(server, dataset, ext):
+    name = f"PUB_{REPORTS[dataset]}_2025.{ext}"
+    return {'name': name, 'url': f"{server.base_url}{REPORTS[dataset]}/{name}"}
+
+def expected_partitions(server, dataset, file):
+    """Partitions cut from the whole annual file at once"""
+    data = server.catalog.body(REPORTS[dataset], file['name'])
+    ext = file['name'].rsplit('.', 1)[-1]
+    split_days, header_re, build_partition = FORMATS[ext]
+    header = header_re.search(data).group(0)
+    return {partition_blob_path(dataset, file['name'], day): build_partition(header, data[start:end])
+            for day, start, end in split_days(data)}
+
+def stored(blob_path):
+    return get_container_client(RAW_CONTAINER).download_blob(blob_path).readall()
+
+def publish(server, monkeypatch, dataset, days):
+    """Serve the annual file with its first days only; later versions just append rows"""
+    data = ANNUAL_BODIES[dataset](2025, DAYS)
+    if days < len(DAYS):
+        if dataset == 'GenMix':
+            data = data[:data.index(f"<DailyData><Day>{DAYS[days]:%Y-%m-%d}".encode())] + b'</DocBody></Document>\n'
+        else:
+            data = data[:data.index(f"\r\n{DAYS[days]:%Y-%m-%d},".encode()) + 2]
+    monkeypatch.setattr(server.catalog, 'body', lambda report, name: data)
+    return data
+
+@pytest.mark.parametrize('dataset, ext', [('Demand', 'csv'), ('GenMix', 'xml')])
+def test_tail_fetch_matches_splitting_the_whole_file(ieso, monkeypatch, dataset, ext):
+    file = annual_file(ieso, dataset, ext)
+    publish(ieso, monkeypatch, dataset, 5)
+    first = ingest_file_delta(file, dataset, RAW_CONTAINER)
+    expected = expected_partitions(ieso, dataset, file)
+    assert first['partial'] is False and first['days'] == 5
+    assert {path: stored(path) for path in expected} == expected
+
+    data = publish(ieso, monkeypatch, dataset, 7)
+    second = ingest_file_delta(file, dataset, RAW_CONTAINER)
+    expected = expected_partitions(ieso, dataset, file)
+    # The last stored day is rewritten along with the two new ones
+    assert second['partial'] is True and second['days'] == 3
+    assert second['bytes'] < len(data) / 2
+    assert {path: stored(path) for path in expected} == expected
+    assert get_delta_cursor(dataset, 2025)['last_day'] == '2025-03-07'
+
+def test_ignored_range_uses_the_first_response(ieso, monkeypatch):
+    file = annual_file(ieso, 'Demand', 'csv')
+    publish(ieso, monkeypatch, 'Demand', 5)
+    ingest_file_delta(file, 'Demand', RAW_CONTAINER)
+    publish(ieso, monkeypatch, 'Demand', 7)
+
+    def without_range(url, headers=None, **kwargs):
+        headers = {k: v for k, v in (headers or {}).items() if k != 'Range'}
+        return http_get(url, headers=headers, **kwargs)
+
+    http_get = delta_ingest.http_get
+    monkeypatch.setattr(delta_ingest, 'http_get', without_range)
+    requests_before = ieso.stats['files']
+    result = ingest_file_delta(file, 'Demand', RAW_CONTAINER)
+
+    assert ieso.stats['files'] == requests_before + 1
+    assert result['partial'] is False and result['days'] == 3
+    expected = expected_partitions(ieso, 'Demand', file)
+    assert {path: stored(path) for path in expected} == expected
+
+def test_moved_anchor_falls_back_to_a_full_fetch(ieso, monkeypatch):
+    file = annual_file(ieso, 'Demand', 'csv')
+    publish(ieso, monkeypatch, 'Demand', 5)
+    ingest_file_delta(file, 'Demand', RAW_CONTAINER)
+    cursor = get_delta_cursor('Demand', 2025)
+    set_delta_cursor('Demand', 2025, {**cursor, 'anchor': 'x' * len(cursor['anchor'])})
+
+    data = publish(ieso, monkeypatch, 'Demand', 6)
+    result = ingest_file_delta(file, 'Demand', RAW_CONTAINER)
+    assert result['partial'] is False and result['days'] == 2
+    cursor = get_delta_cursor('Demand', 2025)
+    assert cursor['last_day'] == '2025-03-06'
+    assert data[:cursor['offset']].endswith(cursor['anchor'].encode('latin-1'))
+
+def test_keep_full_also_stores_the_version(ieso, monkeypatch):
+    file = annual_file(ieso, 'GenMix', 'xml')
+    data = publish(ieso, monkeypatch, 'GenMix', 7)
+    result = ingest_file_delta(file, 'GenMix', RAW_CONTAINER, keep_full=True)
+    assert result['days'] == 7
+    assert stored(f"GenMix/year=2025/{file['name']}") == data
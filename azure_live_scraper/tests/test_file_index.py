@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from ieso_scraper.file_index import FileIndex
+
+def ieso_file(name):
+    return {'name': name, 'url': f"http://ieso.invalid/{name}"}
+
+def index_of(*names):
+    return FileIndex([ieso_file(name) for name in names], 'EnergyLMP')
+
+def names(entries):
+    return [e.name for e in entries]
+
+HOURLY = index_of(
+    'PUB_RealtimeEnergyLMP_2025010224.csv',
+    'PUB_RealtimeEnergyLMP_2025010301.csv',
+    'PUB_RealtimeEnergyLMP_2025010101.csv',
+    'PUB_RealtimeEnergyLMP_2025010101_v2.csv',
+    'PUB_RealtimeEnergyLMP_2025010101_v1.csv',
+    'PUB_RealtimeEnergyLMP_2025010224_v1.csv',
+    'PUB_RealtimeEnergyLMP.csv',
+)
+
+def test_entries_sorted_and_unparsed_kept():
+    assert names(HOURLY) == [
+        'PUB_RealtimeEnergyLMP_2025010101.csv',
+        'PUB_RealtimeEnergyLMP_2025010101_v1.csv',
+        'PUB_RealtimeEnergyLMP_2025010101_v2.csv',
+        'PUB_RealtimeEnergyLMP_2025010224.csv',
+        'PUB_RealtimeEnergyLMP_2025010224_v1.csv',
+        'PUB_RealtimeEnergyLMP_2025010301.csv',
+    ]
+    assert HOURLY.unparsed == [ieso_file('PUB_RealtimeEnergyLMP.csv')]
+
+def test_between_is_inclusive_by_date():
+    assert names(HOURLY.between(datetime(2025, 1, 2), datetime(2025, 1, 2))) == [
+        'PUB_RealtimeEnergyLMP_2025010224.csv', 'PUB_RealtimeEnergyLMP_2025010224_v1.csv']
+    assert len(HOURLY.between(datetime(2025, 1, 1), datetime(2025, 1, 3))) == 6
+    assert HOURLY.between(datetime(2025, 1, 4), datetime(2025, 1, 9)) == []
+    # The end defaults to now
+    assert names(HOURLY.between(datetime(2025, 1, 3))) == ['PUB_RealtimeEnergyLMP_2025010301.csv']
+
+def test_after_hour_crosses_days():
+    assert names(HOURLY.after_hour('2025010224')) == ['PUB_RealtimeEnergyLMP_2025010301.csv']
+    assert names(HOURLY.after_hour('2025010123')) == [
+        'PUB_RealtimeEnergyLMP_2025010224.csv',
+        'PUB_RealtimeEnergyLMP_2025010224_v1.csv',
+        'PUB_RealtimeEnergyLMP_2025010301.csv',
+    ]
+    assert HOURLY.after_hour('2025010301') == []
+
+def test_after_hour_skips_annual_entries():
+    # Annual entries have hour=None and sort into slot 0 of January 1
+    index = index_of('PUB_GenOutputbyFuelHourly_2025.xml', 'PUB_GenOutputbyFuelHourly_2025_v3.xml',
+                     'PUB_RealtimeEnergyLMP_2025010101.csv', 'PUB_RealtimeEnergyLMP_2024123124.csv')
+    assert [e.hour for e in index] == [24, None, None, 1]
+    assert names(index.after_hour('2024123124')) == ['PUB_RealtimeEnergyLMP_2025010101.csv']
+    assert names(index.after_hour('2024123123')) == ['PUB_RealtimeEnergyLMP_2024123124.csv',
+                                                     'PUB_RealtimeEnergyLMP_2025010101.csv']
+    assert index.hour_keys() == ['2024123124', '2025010101']
+
+def test_latest_versions_per_report():
+    assert names(HOURLY.latest_versions()) == [
+        'PUB_RealtimeEnergyLMP_2025010101_v2.csv',
+        'PUB_RealtimeEnergyLMP_2025010224_v1.csv',
+        'PUB_RealtimeEnergyLMP_2025010301.csv',
+    ]
+    # Only among the given entries
+    assert names(HOURLY.latest_versions(HOURLY.entries[:2] + HOURLY.entries[3:4])) == [
+        'PUB_RealtimeEnergyLMP_2025010101_v1.csv', 'PUB_RealtimeEnergyLMP_2025010224.csv']
+
+def test_subset_keeps_order_and_unparsed():
+    subset = HOURLY.subset(['PUB_RealtimeEnergyLMP_2025010301.csv', 'PUB_RealtimeEnergyLMP.csv',
+                            'PUB_RealtimeEnergyLMP_2025010101.csv', 'not_listed_2025010101.csv'])
+    assert subset.dataset == 'EnergyLMP'
+    assert names(subset) == ['PUB_RealtimeEnergyLMP_2025010101.csv', 'PUB_RealtimeEnergyLMP_2025010301.csv']
+    assert subset.unparsed == [ieso_file('PUB_RealtimeEnergyLMP.csv')]
+    # The subset answers range queries over its own entries
+    assert names(subset.after_hour('2025010101')) == ['PUB_RealtimeEnergyLMP_2025010301.csv']
+    assert subset.on(datetime(2025, 1, 2)) == []
+    assert len(HOURLY) == 6
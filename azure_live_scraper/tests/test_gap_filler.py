@@ -0,0 +1,124 @@
+from datetime import datetime
+
+from ieso_scraper import gap_filler
+from ieso_scraper.file_index import FileIndex
+from ieso_scraper.scraper_utils import (
+    HOUR_GAP_GRACE_HOURS, last_settled_date, last_settled_hour, next_hour_key
+)
+from ieso_scraper.state_store import (
+    advance_watermark_date, advance_watermark_hour, get_watermark_date, get_watermark_hour
+)
+
+def hourly_name(hour_key):
+    return f"PUB_RealtimeEnergyLMP_{hour_key}.csv"
+
+def listing(hour_keys):
+    return FileIndex([{'name': hourly_name(h), 'url': f"http://ieso.invalid/{hourly_name(h)}"} for h in hour_keys],
+                     'EnergyLMP')
+
+def hour_keys(first, count):
+    keys = [first]
+    while len(keys) < count:
+        keys.append(next_hour_key(keys[-1]))
+    return keys
+
+def test_next_hour_key_rolls_over_days():
+    assert next_hour_key('2025010105') == '2025010106'
+    assert next_hour_key('2025010124') == '2025010201'
+    assert next_hour_key('2025123124') == '2026010101'
+
+def test_watermark_stops_before_unpublished_hour():
+    entries = listing(['2025010106', '2025010107', '2025010109']).entries
+    assert last_settled_hour('2025010105', entries, []) == '2025010107'
+
+def test_watermark_stops_before_failed_hour():
+    entries = listing(['2025010106', '2025010107', '2025010108']).entries
+    assert last_settled_hour('2025010105', entries, [hourly_name('2025010107')]) == '2025010106'
+    assert last_settled_hour('2025010105', entries, [hourly_name('2025010106')]) is None
+
+def test_watermark_steps_over_hour_missing_past_grace():
+    keys = hour_keys('2025010106', HOUR_GAP_GRACE_HOURS + 3)
+    missing = keys.pop(1)
+    entries = listing(keys).entries
+    assert last_settled_hour('2025010105', entries, []) == keys[-1]
+    assert last_settled_hour('2025010105', entries[:-2], []) == keys[0]
+    assert missing not in {e.hour_key for e in entries}
+
+class FakeReport:
+    def __init__(self, files):
+        self.files = files
+        self.failed_names = []
+        self.success_count = len(files)
+
+    def print_summary(self):
+        pass
+
+    def to_dict(self):
+        return {'total': len(self.files)}
+
+def test_late_hour_is_fetched_on_a_later_run(local_state, monkeypatch):
+    published = ['2025010106', '2025010107', '2025010109']
+    seen, transferred = set(), []
+
+    def new_entries(url, pattern):
+        return [e.as_file() for e in listing(published).entries if e.name not in seen]
+
+    def transfer(files, dataset, container, **options):
+        transferred.extend(f['name'] for f in files)
+        return FakeReport(files)
+
+    monkeypatch.setattr(gap_filler, 'index_ieso_directory', lambda url, pattern, dataset: listing(published))
+    monkeypatch.setattr(gap_filler, 'get_new_entries', new_entries)
+    monkeypatch.setattr(gap_filler, 'mark_entries_seen', lambda url, names: seen.update(names))
+    monkeypatch.setattr(gap_filler, 'record_poll', lambda dataset, entries: None)
+    monkeypatch.setattr(gap_filler, 'transfer_files', transfer)
+    advance_watermark_hour('EnergyLMP', '2025010105')
+
+    gap_filler.fill_hourly_gap('EnergyLMP')
+    assert get_watermark_hour('EnergyLMP') == '2025010107'
+
+    # Hour 08 is published after hour 09
+    published.insert(2, '2025010108')
+    gap_filler.fill_hourly_gap('EnergyLMP')
+    assert get_watermark_hour('EnergyLMP') == '2025010109'
+    assert transferred == [hourly_name(h) for h in ('2025010106', '2025010107', '2025010109', '2025010108')]
+
+def test_partial_day_is_not_settled():
+    day = datetime(2025, 1, 2)
+    entries = listing(hour_keys('2025010101', 24) + hour_keys('2025010201', 6))
+    assert last_settled_date([datetime(2025, 1, 1), day], entries, []) == datetime(2025, 1, 1)
+    # Past the grace window a missing hour 24 no longer holds the date back
+    late = listing(hour_keys('2025010201', 23) + hour_keys('2025010301', HOUR_GAP_GRACE_HOURS))
+    assert last_settled_date([day], late, []) == day
+
+def test_partial_day_is_completed_by_a_later_run(local_state, monkeypatch):
+    days = [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+    published = hour_keys('2025010101', 24) + hour_keys('2025010201', 6)
+    seen, transferred = set(), []
+
+    def new_entries(url, pattern):
+        return [e.as_file() for e in listing(published).entries if e.name not in seen]
+
+    def transfer(files, dataset, container, **options):
+        transferred.extend(f['name'] for f in files)
+        return FakeReport(files)
+
+    monkeypatch.setattr(gap_filler, 'get_missing_dates',
+                        lambda dataset: [d for d in days if d > get_watermark_date(dataset)])
+    monkeypatch.setattr(gap_filler, 'index_ieso_directory', lambda url, pattern, dataset: listing(published))
+    monkeypatch.setattr(gap_filler, 'get_new_entries', new_entries)
+    monkeypatch.setattr(gap_filler, 'mark_entries_seen', lambda url, names: seen.update(names))
+    monkeypatch.setattr(gap_filler, 'record_poll', lambda dataset, entries: None)
+    monkeypatch.setattr(gap_filler, 'transfer_files', transfer)
+    advance_watermark_date('EnergyLMP', datetime(2024, 12, 31))
+
+    # An early-morning run sees hours 01-06 of the second day only
+    gap_filler.fill_daily_gap('EnergyLMP')
+    assert get_watermark_date('EnergyLMP') == days[0]
+    assert get_watermark_hour('EnergyLMP') == '2025010206'
+
+    published += hour_keys('2025010207', 18)
+    gap_filler.fill_daily_gap('EnergyLMP')
+    assert get_watermark_date('EnergyLMP') == days[1]
+    assert get_watermark_hour('EnergyLMP') == '2025010224'
+    assert transferred == [hourly_name(h) for h in published]
@@ -0,0 +1,97 @@
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import genmix_clean_push
+from genmix_clean_push import STATE_KEY, cleaned_blob_stem, process_genmix_xml
+from ieso_scraper.blob_clients import CLEANED_CONTAINER, RAW_CONTAINER, get_container_client
+from ieso_scraper.cleaned_format import read_cleaned
+from ieso_scraper.state_store import load_state
+from mock_ieso import genmix_xml
+
+DAYS = [datetime(2025, 1, 1) + timedelta(days=i) for i in range(7)]
+ANNUAL = 'GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.xml'
+OUTPUT = cleaned_blob_stem(2025) + '.parquet'
+
+def edit_day(data, index):
+    """The report with the first Output of one day raised by 1"""
+    parts = data.split(b'<DailyData>')
+    parts[index + 1] = re.sub(rb'<Output>(\d+)</Output>', lambda m: b'<Output>%d</Output>' % (int(m.group(1)) + 1),
+                              parts[index + 1], count=1)
+    return b'<DailyData>'.join(parts)
+
+def upload(name, data):
+    get_container_client(RAW_CONTAINER).upload_blob(name=name, data=data, overwrite=True)
+
+def clean(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['genmix_clean_push.py'])
+    genmix_clean_push.main()
+    return read_cleaned(get_container_client(CLEANED_CONTAINER).download_blob(OUTPUT).readall(), OUTPUT)
+
+@pytest.fixture
+def cleaner(blob_storage, local_state, monkeypatch):
+    monkeypatch.setattr(genmix_clean_push, 'CLEAN_INCREMENTAL', True)
+    monkeypatch.setattr(genmix_clean_push, 'output_extensions', lambda: ['.parquet'])
+
+def test_spans_hash_each_day():
+    data = genmix_xml(2025, DAYS)
+    df, spans = process_genmix_xml(data)
+    assert list(spans) == [f"{day:%Y-%m-%d}" for day in DAYS]
+    for day, (_, start, end) in spans.items():
+        assert (df['timestamp'][start:end].dt.strftime('%Y-%m-%d') == day).all()
+    assert sum(end - start for _, start, end in spans.values()) == len(df)
+
+    # Chunking does not change the hashes; editing one day changes only its hash
+    assert process_genmix_xml(data[i:i + 1000] for i in range(0, len(data), 1000))[1] == spans
+    _, edited = process_genmix_xml(edit_day(data, 2))
+    assert [day for day in spans if edited[day][0] != spans[day][0]] == ['2025-01-03']
+    assert all(edited[day][1:] == spans[day][1:] for day in spans)
+
+def test_only_the_changed_day_is_recleaned(cleaner, monkeypatch, capsys):
+    data = genmix_xml(2025, DAYS)
+    upload(ANNUAL, data)
+    before = clean(monkeypatch)
+    state = load_state(STATE_KEY)['2025']
+    assert state['cleaner_version'] == genmix_clean_push.CLEANER_VERSION
+    assert state['days'] == {day: digest for day, (digest, _, _) in process_genmix_xml(data)[1].items()}
+
+    # A new version of the year file whose third day was revised; Last-Modified has 1 s resolution
+    time.sleep(1.1)
+    edited = edit_day(data, 2)
+    upload(ANNUAL.replace('.xml', '_v1.xml'), edited)
+    capsys.readouterr()
+    after = clean(monkeypatch)
+    assert '1 of 7 days re-cleaned (2025-01-03 to 2025-01-03)' in capsys.readouterr().out
+
+    new_state = load_state(STATE_KEY)['2025']
+    assert [day for day in state['days'] if new_state['days'][day] != state['days'][day]] == ['2025-01-03']
+    assert new_state['source_last_modified'] > state['source_last_modified']
+
+    changed = after['timestamp'].dt.strftime('%Y-%m-%d') == '2025-01-03'
+    assert after[~changed].equals(before[~changed])
+    difference = after['output'] - before['output']
+    assert difference[changed].sum() == 1 and (difference[changed] != 0).sum() == 1
+
+def test_daily_partition_adds_its_day(cleaner, monkeypatch, capsys):
+    upload(ANNUAL, genmix_xml(2025, DAYS))
+    before = clean(monkeypatch)
+    output_etag = get_container_client(CLEANED_CONTAINER).get_blob_client(OUTPUT).get_blob_properties().etag
+
+    # Nothing changed: the output is left alone
+    capsys.readouterr()
+    clean(monkeypatch)
+    assert 'no raw file changed since last cleaned' in capsys.readouterr().out
+    assert get_container_client(CLEANED_CONTAINER).get_blob_client(OUTPUT).get_blob_properties().etag == output_etag
+
+    # Delta ingest appends the next day as its own partition
+    time.sleep(1.1)
+    upload('GenMix/year=2025/month=01/day=08/PUB_GenOutputbyFuelHourly_20250108.xml',
+           genmix_xml(2025, [datetime(2025, 1, 8)]))
+    after = clean(monkeypatch)
+    assert '1 of 1 days re-cleaned (2025-01-08 to 2025-01-08)' in capsys.readouterr().out
+    assert after[:len(before)].equals(before)
+    assert set(after['timestamp'][len(before):].dt.strftime('%Y-%m-%d')) == {'2025-01-08'}
+    assert len(load_state(STATE_KEY)['2025']['days']) == 8
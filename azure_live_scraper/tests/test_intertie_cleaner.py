@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from bench_intertie_cleaner import legacy_process
+from intertielmp_push_clean import process_intertie_xml
+from mock_ieso import intertie_lmp_xml
+
+def document(hour, body, day='2025-03-01'):
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="http://www.ieso.ca/schema"><DocBody>'
+            f'<DeliveryDate>{day}</DeliveryDate><DeliveryHour>{hour}</DeliveryHour>'
+            f'<IntertieLMPrices>{body}</IntertieLMPrices></DocBody></Document>\n').encode()
+
+def intervals(count, lmp=1.0):
+    return ''.join(f"<IntervalLMP><Interval>{i % 12 + 1}</Interval><LMP>{lmp + i:.2f}</LMP>"
+                   f"<Flag>{'DSO-RD' if i % 7 == 0 else ''}</Flag></IntervalLMP>" for i in range(count))
+
+def intertie(name=None, lmp=1.0):
+    name_xml = f"<IntertiePLName>{name}</IntertiePLName>" if name else ''
+    return f"<IntertieLMPrice>{name_xml}<Components><Component>{intervals(60, lmp)}</Component></Components></IntertieLMPrice>"
+
+def legacy(data):
+    """The ElementTree parse, with timestamps in the cleaner's unit (newer pandas infers us)"""
+    df = legacy_process(data)
+    return df.assign(timestamp=df['timestamp'].astype('datetime64[ns]'))
+
+def streamed(data, chunk=997):
+    """Fed in chunks, as the blob download does"""
+    return process_intertie_xml(data[i:i + chunk] for i in range(0, len(data), chunk))
+
+@pytest.mark.parametrize('hour', [4, 13, 23])
+def test_matches_element_tree_parse(hour):
+    data = intertie_lmp_xml(datetime(2025, 3, 1), hour)
+    pd.testing.assert_frame_equal(streamed(data), legacy(data))
+
+def test_name_outside_intertie_is_ignored():
+    data = document(12, '<IntertiePLName>NY.STRAY_NYST:LMP</IntertiePLName>'
+                        + intertie()  # no name of its own: skipped
+                        + f"<Stray>{intervals(12, 500.0)}</Stray>"
+                        + intertie('PQ.BEAUHARNOIS_PQBE:LMP', lmp=100.0)
+                        + '<IntertiePLName>MI.LATE_MILA:LMP</IntertiePLName>')
+    df = streamed(data)
+    pd.testing.assert_frame_equal(df, legacy(data))
+    assert set(df['intertie_name']) == {'PQ.BEAUHARNOIS_PQBE:LMP'}
+    assert len(df) == 60 and df['lmp_value'].between(100, 160).all()
+
+def test_hour_24_rolls_over_to_the_next_day():
+    data = document(24, intertie('PQ.BEAUHARNOIS_PQBE:LMP') + intertie('NY.NIAGARA_NYNI:LMP'))
+    with pytest.raises(ValueError):
+        legacy(data)
+
+    df = streamed(data)
+    by_set = df.groupby('interval_set')['timestamp']
+    assert by_set.min()[0] == pd.Timestamp('2025-03-01 20:00')
+    assert by_set.min()[4] == pd.Timestamp('2025-03-02 00:00')
+    assert by_set.max()[4] == pd.Timestamp('2025-03-02 00:55')
+    # Hour 23's last set ends where hour 24's begins
+    previous = streamed(document(23, intertie('PQ.BEAUHARNOIS_PQBE:LMP')))
+    assert previous['timestamp'].max() == pd.Timestamp('2025-03-01 23:55')
+    assert list(df['intertie_name'][:2]) == ['NY.NIAGARA_NYNI:LMP', 'PQ.BEAUHARNOIS_PQBE:LMP']
+
+def test_early_hours_roll_back_to_the_previous_day():
+    data = document(1, intertie('PQ.BEAUHARNOIS_PQBE:LMP'))
+    with pytest.raises(ValueError):
+        legacy(data)
+
+    by_set = streamed(data).groupby('interval_set')['timestamp']
+    assert by_set.min()[0] == pd.Timestamp('2025-02-28 21:00')
+    assert by_set.min()[3] == pd.Timestamp('2025-03-01 00:00')
+    assert by_set.max()[4] == pd.Timestamp('2025-03-01 01:55')
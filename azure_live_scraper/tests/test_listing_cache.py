@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytest
+
+from mock_ieso import Catalog, MockIESOServer, REPORTS
+from ieso_scraper import listing_cache
+from ieso_scraper.listing_cache import (
+    conditional_headers,
+    get_cached_listing,
+    get_new_entries,
+    mark_entries_seen,
+    store_listing
+)
+from ieso_scraper.scraper_utils import fetch_directory_listing
+
+URL = 'http://ieso.invalid/public/RealtimeEnergyLMP/'
+
+def entry(name):
+    return {'name': name, 'url': URL + name, 'size': '1K', 'modified': '2025-03-01 01:10'}
+
+ENTRIES = [entry('PUB_RealtimeEnergyLMP_2025030101.csv'), entry('PUB_RealtimeEnergyLMP_2025030102.csv'),
+           entry('PUB_RealtimeEnergyLMP.csv')]
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / 'listing_cache.json'
+    monkeypatch.setattr(listing_cache, 'CACHE_PATH', str(path))
+    return path
+
+def names(entries):
+    return [e['name'] for e in entries]
+
+def test_conditional_headers_need_a_cached_listing():
+    assert conditional_headers(URL) == {}
+
+    store_listing(URL, [], etag='"empty"', last_modified='Sat, 01 Mar 2025 06:00:00 GMT')
+    assert conditional_headers(URL) == {}
+
+    store_listing(URL, ENTRIES, etag='"abc"', last_modified='Sat, 01 Mar 2025 06:00:00 GMT')
+    assert conditional_headers(URL) == {'If-None-Match': '"abc"',
+                                        'If-Modified-Since': 'Sat, 01 Mar 2025 06:00:00 GMT'}
+    store_listing(URL, ENTRIES, etag='"abc"')
+    assert conditional_headers(URL) == {'If-None-Match': '"abc"'}
+
+def test_new_entries_exclude_seen_ones():
+    assert get_new_entries(URL) == []
+    store_listing(URL, ENTRIES)
+    assert get_new_entries(URL) == ENTRIES
+    assert names(get_new_entries(URL, r'_\d{10}\.csv$')) == names(ENTRIES[:2])
+
+    mark_entries_seen(URL, ['PUB_RealtimeEnergyLMP_2025030101.csv'])
+    assert names(get_new_entries(URL, r'_\d{10}\.csv$')) == ['PUB_RealtimeEnergyLMP_2025030102.csv']
+
+    # A refreshed listing keeps what was seen
+    store_listing(URL, ENTRIES + [entry('PUB_RealtimeEnergyLMP_2025030103.csv')], etag='"def"')
+    assert names(get_new_entries(URL, r'_\d{10}\.csv$')) == ['PUB_RealtimeEnergyLMP_2025030102.csv',
+                                                             'PUB_RealtimeEnergyLMP_2025030103.csv']
+
+def test_seen_names_stay_bounded_by_the_listing():
+    store_listing(URL, ENTRIES)
+    mark_entries_seen(URL, names(ENTRIES) + ['PUB_RealtimeEnergyLMP_2025022824.csv'])
+    assert get_cached_listing(URL)['seen'] == sorted(names(ENTRIES))
+
+    # Entries that drop off the listing are forgotten
+    store_listing(URL, ENTRIES[1:])
+    mark_entries_seen(URL, ['PUB_RealtimeEnergyLMP_2025030102.csv'])
+    assert get_cached_listing(URL)['seen'] == sorted(names(ENTRIES[1:]))
+
+    # An empty listing keeps nothing, however many runs mark names
+    store_listing(URL, [])
+    for hour in range(1, 25):
+        mark_entries_seen(URL, [f"PUB_RealtimeEnergyLMP_20250301{hour:02d}.csv"])
+    assert get_cached_listing(URL)['seen'] == []
+
+def test_marking_an_unlisted_url_stores_nothing(cache_path):
+    mark_entries_seen(URL, names(ENTRIES))
+    assert get_cached_listing(URL) is None
+    assert not cache_path.exists()
+
+def test_unchanged_listing_is_reused_on_304():
+    server = MockIESOServer(Catalog(datetime(2025, 3, 1), days=1, locations=5)).start()
+    try:
+        url = f"{server.base_url}{REPORTS['EnergyLMP']}/"
+        first = fetch_directory_listing(url)
+        assert server.stats['listings'] == 1
+        fetched_at = get_cached_listing(url)['fetched_at']
+        mark_entries_seen(url, names(first[:10]))
+
+        # Revalidated with the cached ETag: no page body, the cached entries and seen set are kept
+        assert fetch_directory_listing(url) == first
+        assert server.stats['listings'] == 1 and server.stats['not_modified'] == 1
+        assert get_cached_listing(url)['fetched_at'] == fetched_at
+        assert get_new_entries(url) == first[10:]
+
+        # Without the cache the page is fetched in full
+        assert fetch_directory_listing(url, use_cache=False) == first
+        assert server.stats['listings'] == 2 and server.stats['not_modified'] == 1
+    finally:
+        server.stop()
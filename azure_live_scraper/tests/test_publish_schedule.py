@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from ieso_scraper import publish_schedule
+from ieso_scraper.file_index import FileIndex
+from ieso_scraper.publish_schedule import expected_lag, is_due, next_poll_time, record_poll
+
+def listing(*published):
+    """EnergyLMP entries from (YYYYMMDDHH, 'YYYY-MM-DD HH:MM' last modified) pairs"""
+    return list(FileIndex([{'name': f"PUB_RealtimeEnergyLMP_{hour_key}.csv",
+                            'url': f"http://ieso.invalid/PUB_RealtimeEnergyLMP_{hour_key}.csv",
+                            'modified': modified} for hour_key, modified in published], 'EnergyLMP'))
+
+def at(text):
+    return datetime.strptime(text, '%Y-%m-%d %H:%M')
+
+HOURS_8_TO_10 = listing(('2025010108', '2025-01-01 08:20'),
+                        ('2025010109', '2025-01-01 09:10'),
+                        ('2025010110', '2025-01-01 10:15'))
+
+def test_first_publications_teach_the_lag(local_state):
+    schedule = record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 10:30'))
+    assert schedule['lags'] == [1200, 600, 900]
+    assert schedule['last_period_end'] == '2025-01-01 10:00:00'
+    # p80 of three lags is the largest: hour ending 11 is due at 11:00 + 20m, polled a margin later
+    assert expected_lag(schedule).total_seconds() == 1200
+    assert next_poll_time('EnergyLMP') == datetime(2025, 1, 1, 11, 21)
+    assert not is_due('EnergyLMP', now=at('2025-01-01 11:20'))
+    assert is_due('EnergyLMP', now=at('2025-01-01 11:21'))
+
+def test_nothing_learned_polls_every_run(local_state):
+    schedule = record_poll('EnergyLMP', [], now=at('2025-01-01 10:30'))
+    assert schedule['next_poll'] is None and schedule['empty_polls'] == 1
+    assert is_due('EnergyLMP', now=at('2025-01-01 10:31'))
+
+def test_early_poll_keeps_the_schedule(local_state):
+    record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 10:30'))
+    schedule = record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 11:00'))
+    assert schedule['misses'] == 0 and schedule['empty_polls'] == 1 and schedule['polls'] == 2
+    assert schedule['lags'] == [1200, 600, 900]
+    assert next_poll_time('EnergyLMP') == datetime(2025, 1, 1, 11, 21)
+
+def test_late_publication_backs_off_then_resets(local_state):
+    record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 10:30'))
+
+    # Every poll past the expected time that finds nothing doubles the wait
+    now, waits = at('2025-01-01 11:25'), []
+    for _ in range(3):
+        schedule = record_poll('EnergyLMP', HOURS_8_TO_10, now=now)
+        next_poll = next_poll_time('EnergyLMP')
+        waits.append((next_poll - now).total_seconds())
+        now = next_poll
+    assert waits == [120, 240, 480]
+    assert schedule['misses'] == 3
+
+    # Hour 11 shows up 35 minutes late: the lag is learned and the backoff reset
+    late = HOURS_8_TO_10 + listing(('2025010111', '2025-01-01 11:35'))
+    schedule = record_poll('EnergyLMP', late, now=now)
+    assert schedule['misses'] == 0
+    assert schedule['lags'] == [1200, 600, 900, 2100]
+    assert schedule['last_period_end'] == '2025-01-01 11:00:00'
+    assert next_poll_time('EnergyLMP') == datetime(2025, 1, 1, 12, 36)
+
+def test_backoff_is_capped(local_state):
+    record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 10:30'))
+    now, waits = at('2025-01-01 11:25'), []
+    for _ in range(8):
+        record_poll('EnergyLMP', HOURS_8_TO_10, now=now)
+        next_poll = next_poll_time('EnergyLMP')
+        waits.append((next_poll - now).total_seconds())
+        now = next_poll
+    assert waits == [120, 240, 480, 960, 1920, 3600, 3600, 3600]
+
+def test_lag_samples_are_bounded(local_state, monkeypatch):
+    monkeypatch.setattr(publish_schedule, 'MAX_SAMPLES', 2)
+    record_poll('EnergyLMP', HOURS_8_TO_10, now=at('2025-01-01 10:30'))
+    # Periods already seen are not learned again
+    schedule = record_poll('EnergyLMP', HOURS_8_TO_10 + listing(('2025010111', '2025-01-01 11:05')),
+                           now=at('2025-01-01 11:30'))
+    assert schedule['lags'] == [900, 300]
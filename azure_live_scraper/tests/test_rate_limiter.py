@@ -0,0 +1,46 @@
+import time
+
+from ieso_scraper.rate_limiter import AdaptiveRateLimiter, get_rate_limiter
+
+def run(limiter, status=200, latency=0.01, **ticket_fields):
+    ticket = limiter.acquire()
+    ticket.status, ticket.latency = status, latency
+    for name, value in ticket_fields.items():
+        setattr(ticket, name, value)
+    limiter.release(ticket)
+
+def test_throttling_halves_concurrency_and_rate():
+    limiter = AdaptiveRateLimiter('ieso', rate=100, burst=100, max_concurrency=8)
+    run(limiter, status=503, throttled=1)
+    assert limiter.limit == 4 and limiter.rate == 50
+    # A burst of errors inside the cooldown only backs off once
+    run(limiter, status=503, throttled=1)
+    assert limiter.limit == 4
+    assert limiter.stats()['throttled'] == 2
+
+def test_slow_responses_give_up_one_slot():
+    limiter = AdaptiveRateLimiter('ieso', rate=100, burst=100, max_concurrency=8, target_latency=0.5)
+    run(limiter, latency=1.0)
+    assert limiter.limit == 7 and limiter.rate == 100
+
+def test_fast_successes_grow_back_to_the_ceiling():
+    limiter = AdaptiveRateLimiter('ieso', rate=100, burst=100, max_concurrency=4)
+    run(limiter, status=500)
+    assert limiter.limit == 2
+    for _ in range(20):
+        run(limiter)
+    assert limiter.limit == 4 and limiter.rate == 100
+
+def test_token_bucket_paces_requests():
+    limiter = AdaptiveRateLimiter('ieso', rate=20, burst=1, max_concurrency=4)
+    started = time.monotonic()
+    for _ in range(3):
+        run(limiter)
+    assert time.monotonic() - started >= 0.09
+    assert limiter.stats()['delayed'] == 2
+
+def test_one_limiter_per_host():
+    a = get_rate_limiter('https://reports-public.ieso.ca/public/Demand/')
+    b = get_rate_limiter('https://reports-public.ieso.ca/public/GenOutputbyFuelHourly/x.xml')
+    assert a is b
+    assert get_rate_limiter('http://127.0.0.1:8900/public/') is not a
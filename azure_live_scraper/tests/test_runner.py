@@ -0,0 +1,48 @@
+import threading
+import time
+from datetime import datetime
+
+from ieso_scraper import gap_filler, transfer_engine
+from ieso_scraper.blob_clients import RAW_CONTAINER, get_container_client
+from ieso_scraper.content_index import load_content_index
+from ieso_scraper.file_index import FileIndex
+from ieso_scraper.runner import run_all_gap_fillers
+from ieso_scraper.state_store import advance_watermark_date, get_watermark_date, load_state
+
+DAY = datetime(2025, 1, 1)
+FILES = [{'name': f"PUB_RealtimeEnergyLMP_20250101{hour:02d}.csv",
+          'url': f"http://ieso.invalid/PUB_RealtimeEnergyLMP_20250101{hour:02d}.csv"} for hour in range(1, 25)]
+
+def slow_download(url):
+    time.sleep(0.3)
+    yield b'delivery,hour\n'
+
+def test_slow_dataset_is_cancelled_at_the_deadline(blob_storage, local_state, monkeypatch):
+    seen = set()
+    monkeypatch.setattr(gap_filler, 'get_missing_dates', lambda dataset: [DAY])
+    monkeypatch.setattr(gap_filler, 'index_ieso_directory', lambda url, pattern, dataset: FileIndex(FILES, dataset))
+    monkeypatch.setattr(gap_filler, 'get_new_entries', lambda url, pattern: FILES)
+    monkeypatch.setattr(gap_filler, 'mark_entries_seen', lambda url, names: seen.update(names))
+    monkeypatch.setattr(gap_filler, 'record_poll', lambda dataset, entries: None)
+    monkeypatch.setattr(transfer_engine, 'iter_download', slow_download)
+    monkeypatch.setattr(transfer_engine, 'DEFAULT_MAX_WORKERS', 2)
+    advance_watermark_date('EnergyLMP', datetime(2024, 12, 31))
+    state_before = load_state('EnergyLMP')
+
+    results = run_all_gap_fillers(parallel=True, deadline_seconds=0.5, datasets=['EnergyLMP'])
+    assert results['EnergyLMP']['status'] == 'timeout'
+
+    # The abandoned worker finishes the files in flight, then stops
+    started = time.time()
+    for thread in threading.enumerate():
+        if thread.name == 'gapfill-EnergyLMP':
+            thread.join(5)
+    assert time.time() - started < 2
+
+    stored = list(get_container_client(RAW_CONTAINER).list_blobs(name_starts_with='EnergyLMP/'))
+    assert 0 < len(stored) < len(FILES)
+    # No watermark, listing or content-index state is written after the deadline
+    assert get_watermark_date('EnergyLMP') == datetime(2024, 12, 31)
+    assert load_state('EnergyLMP') == state_before
+    assert load_content_index('EnergyLMP').hashes == {}
+    assert seen == set()
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ieso_scraper import state_store
+from ieso_scraper.state_store import StateConflictError, load_state, update_state
+
+def increment(state):
+    state['count'] = state.get('count', 0) + 1
+
+@pytest.fixture(params=['local', 'blob'])
+def backend(request, monkeypatch, tmp_path):
+    """Each test runs against local files and against the blob stand-in"""
+    monkeypatch.setattr(state_store, 'STATE_BACKEND', request.param)
+    monkeypatch.setattr(state_store, 'STATE_DIR', str(tmp_path / 'state'))
+    if request.param == 'blob':
+        request.getfixturevalue('blob_storage')
+    return request.param
+
+def test_missing_state_is_empty(backend):
+    assert load_state('Demand') == {}
+
+def test_update_merges_and_stamps(backend):
+    update_state('Demand', {'latest_date': '2025-01-01'})
+    state = update_state('Demand', {'latest_versions': {'2025': 3}})
+    assert state['latest_date'] == '2025-01-01' and state['latest_versions'] == {'2025': 3}
+    assert load_state('Demand')['dataset'] == 'Demand'
+
+def test_concurrent_updates_are_not_lost(backend):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: update_state('Demand', increment), range(40)))
+    assert load_state('Demand')['count'] == 40
+
+def test_stale_write_conflicts(backend):
+    update_state('Demand', increment)
+    state, tag = state_store._read('Demand')
+    update_state('Demand', increment)
+    with pytest.raises(StateConflictError):
+        state_store._write('Demand', state, tag)
+
+def test_other_documents_are_not_blocked(backend):
+    finished = threading.Event()
+    # An update of one document in progress must not hold up another document
+    with state_store._state_lock('GenMix'):
+        worker = threading.Thread(target=lambda: (update_state('Demand', increment), finished.set()))
+        worker.start()
+        assert finished.wait(timeout=10)
+    worker.join()
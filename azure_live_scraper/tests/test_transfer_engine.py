@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from mock_ieso import Catalog, MockIESOServer, REPORTS
+from ieso_scraper import transfer_engine
+from ieso_scraper.azure_utils import build_blob_path
+from ieso_scraper.blob_clients import RAW_CONTAINER, get_container_client
+from ieso_scraper.transfer_engine import transfer_files
+
+@pytest.fixture
+def ieso(blob_storage, local_state, monkeypatch):
+    monkeypatch.setattr(transfer_engine, 'RETRY_BACKOFF_SECONDS', 0)
+    server = MockIESOServer(Catalog(datetime(2025, 3, 1), days=1, locations=5)).start()
+    yield server
+    server.stop()
+
+def hourly_files(server, dataset='EnergyLMP'):
+    report = REPORTS[dataset]
+    return [{'name': name, 'url': f"{server.base_url}{report}/{name}"}
+            for name in sorted(server.catalog.entries[report])]
+
+def test_files_are_copied_once(ieso):
+    files = hourly_files(ieso)
+    report = transfer_files(files, 'EnergyLMP', RAW_CONTAINER, max_workers=4)
+
+    assert (report.uploaded, report.failed, report.total) == (24, 0, 24)
+    raw = get_container_client(RAW_CONTAINER)
+    for file in files[:3]:
+        blob_path = build_blob_path('EnergyLMP', file['name'])
+        assert raw.download_blob(blob_path).readall() == ieso.catalog.body(REPORTS['EnergyLMP'], file['name'])
+
+    # Already stored files are found by one listing, not downloaded again
+    downloads = ieso.stats['files']
+    again = transfer_files(files, 'EnergyLMP', RAW_CONTAINER, max_workers=4)
+    assert (again.uploaded, again.skipped) == (0, 24)
+    assert ieso.stats['files'] == downloads
+
+def test_a_failing_file_is_retried_then_reported(ieso):
+    files = hourly_files(ieso)[:4]
+    missing = {'name': 'PUB_RealtimeEnergyLMP_2025030199.csv',
+               'url': f"{ieso.base_url}{REPORTS['EnergyLMP']}/PUB_RealtimeEnergyLMP_2025030199.csv"}
+    report = transfer_files(files + [missing], 'EnergyLMP', RAW_CONTAINER, max_retries=2)
+
+    assert (report.uploaded, report.failed) == (4, 1)
+    assert report.failed_names == [missing['name']]
+    failed = next(r for r in report.results if r['status'] == 'failed')
+    assert failed['attempts'] == 2
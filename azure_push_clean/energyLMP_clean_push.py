@@ -1,70 +1,63 @@
+import argparse
 import os
+import re
+import sys
 import pandas as pd
-from azure.storage.blob import BlobServiceClient
-from io import BytesIO
 
 # --- CONFIG ---
-ACCOUNT_NAME = "YOUR_AZURE_STORAGE_ACCOUNT"
-ACCOUNT_KEY = "YOUR_AZURE_STORAGE_KEY_HERE"
-RAW_CONTAINER = "raw-data"
-CLEANED_CONTAINER = "cleaned-data"
-PREFIX = "EnergyLMP/year=2025/"
-TEMP_DIR = "lmp_cleaned"
+# Shared blob client registry from the ieso_scraper package (importable without installing it);
+# credentials come from AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY or config.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.clean_pipeline import run_clean_pipeline, CLEAN_INCREMENTAL
+from ieso_scraper.cleaned_format import encode
 
-# --- SETUP ---
-os.makedirs(TEMP_DIR, exist_ok=True)
-service_client = BlobServiceClient(
-    f"https://{ACCOUNT_NAME}.blob.core.windows.net", credential=ACCOUNT_KEY
-)
-raw = service_client.get_container_client(RAW_CONTAINER)
-cleaned = service_client.get_container_client(CLEANED_CONTAINER)
+PREFIX = "EnergyLMP/year=2025/"
+# Recorded on every cleaned blob; bump it when the cleaning logic changes so the
+# incremental mode re-cleans everything once
+CLEANER_VERSION = "1"
+DATE_RE = re.compile(r'LMP_(\d{8})(\d{2})')
 
 def extract_date_from_blob(blob_name):
     # expect path like: EnergyLMP/year=2025/month=05/day=19/PUB_RealtimeEnergyLMP_2025051923_v12.csv
-    import re
-    match = re.search(r'LMP_(\d{8})(\d{2})', blob_name)
+    match = DATE_RE.search(blob_name)
     if match:
         date_str = match.group(1)  # 20250519
         return pd.to_datetime(date_str)
     return None
 
-# --- PROCESS ALL FILES ---
-for blob in raw.list_blobs(name_starts_with=PREFIX):
-    blob_name = blob.name
-    print(f"📥 {blob_name}")
-
-    # skip non-csv
-    if not blob_name.endswith(".csv"):
-        continue
-
-    # download + read with skiprows=1
-    data = raw.get_blob_client(blob_name).download_blob().readall()
-    try:
-        df = pd.read_csv(BytesIO(data), skiprows=1)
-    except Exception as e:
-        print(f"❌ Failed: {blob_name} — {e}")
-        continue
+def clean_blob(blob_name, raw):
+    """Clean one raw CSV blob (a binary file) into ({extension: cleaned bytes}, log lines); runs in a parse worker"""
+    # read with skiprows=1
+    df = pd.read_csv(raw, skiprows=1)
 
     # clean columns
     df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
 
     # create timestamp column
     file_date = extract_date_from_blob(blob_name)
-    if file_date is not None:
-        df['timestamp'] = file_date + pd.to_timedelta((df['interval'] - 1) * 5, unit='min')
-    else:
-        print(f"⚠️ Date missing in filename: {blob_name}")
-        continue
+    if file_date is None:
+        raise ValueError("Date missing in filename")
+    df['timestamp'] = file_date + pd.to_timedelta((df['interval'] - 1) * 5, unit='min')
 
     df.dropna(inplace=True)
 
-    # save locally
-    cleaned_path = os.path.join(TEMP_DIR, os.path.basename(blob_name))
-    df.to_csv(cleaned_path, index=False)
+    # Typed Parquet (plus the CSV export if enabled), see ieso_scraper.cleaned_format
+    return encode(df, 'EnergyLMP'), []
+
+# --- PROCESS ALL FILES ---
+def main():
+    """Clean the raw EnergyLMP CSVs under PREFIX into cleaned-data (only new or changed ones by default)"""
+    parser = argparse.ArgumentParser(description="Clean raw EnergyLMP CSVs into cleaned-data Parquet/CSV")
+    parser.add_argument('--full', action='store_true', help="Re-clean every file, not only new or changed ones")
+    args = parser.parse_args()
+
+    # Downloads, parsing and uploads overlap (see ieso_scraper.clean_pipeline for tuning)
+    # skip non-csv
+    report = run_clean_pipeline(PREFIX, clean_blob, name="EnergyLMP", suffix=".csv",
+                                cleaner_version=CLEANER_VERSION, incremental=CLEAN_INCREMENTAL and not args.full)
+    report.print_summary()
 
-    # upload to cleaned container
-    print(f"⏫ Uploading cleaned → {blob_name}")
-    with open(cleaned_path, "rb") as f:
-        cleaned.upload_blob(name=blob_name, data=f, overwrite=True)
+    print("\n✅ All LMP files cleaned and uploaded.")
 
-print("\n✅ All LMP files cleaned and uploaded.")
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,247 @@
-from azure.storage.blob import BlobClient
+import argparse
+import hashlib
 import os
+import re
+import sys
+import numpy as np
+import pandas as pd
+import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
-# === config ===
-conn_str = "DefaultEndpointsProtocol=https;AccountName=YOUR_AZURE_STORAGE_ACCOUNT;AccountKey=YOUR_AZURE_STORAGE_KEY_HERE;EndpointSuffix=core.windows.net"
-local_path = "/Users/yuganthareshsoni/project_tester_1/call_azure_cleanstep1/Azure_clean_notpushed/PUB_GenOutputbyFuelHourly_2025_v139_cleaned.csv"
-container_name = "cleaned-data"
-blob_path = "GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025_v139_cleaned.csv"
-
-# === upload ===
-def upload_to_azure(local_file, blob_path, container):
-    blob = BlobClient.from_connection_string(
-        conn_str, container_name=container, blob_name=blob_path
-    )
-    with open(local_file, "rb") as f:
-        blob.upload_blob(f, overwrite=True)
-    print(f"✅ Uploaded: {local_file} → {container}/{blob_path}")
-
-# === verify file exists locally ===
-if os.path.exists(local_path):
-    print(f"📁 Found local file: {local_path}")
-    file_size = os.path.getsize(local_path) / 1024  # KB
-    print(f"📊 File size: {file_size:.1f} KB")
-    
-    upload_to_azure(local_path, blob_path, container_name)
-else:
-    print(f"❌ File not found: {local_path}") 
\ No newline at end of file
+# --- CONFIG ---
+# Shared blob client registry from the ieso_scraper package (importable without installing it);
+# credentials come from AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY or config.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.blob_clients import get_container_client, RAW_CONTAINER, CLEANED_CONTAINER, BLOB_MAX_CONCURRENCY
+from ieso_scraper.clean_pipeline import CLEAN_INCREMENTAL, CLEAN_IO_WORKERS, lineage_metadata
+from ieso_scraper.cleaned_format import encode, output_extensions, read_cleaned
+from ieso_scraper.state_store import load_state, update_state
+
+DATASET = "GenMix"
+# Recorded with every cleaned year; bump it when the cleaning logic changes so the
+# incremental mode re-cleans everything once
+CLEANER_VERSION = "1"
+# Per-year lineage and per-day content hashes of the cleaned output
+STATE_KEY = f"{DATASET}.clean"
+
+# Raw layouts: full annual versions, and the daily partitions written by delta ingest
+ANNUAL_RE = re.compile(r'^GenMix/year=(\d{4})/PUB_GenOutputbyFuelHourly_\d{4}(?:_v(\d+))?\.xml$')
+PARTITION_RE = re.compile(r'^GenMix/year=(\d{4})/month=\d{2}/day=\d{2}/PUB_GenOutputbyFuelHourly_\d{8}\.xml$')
+
+# Tags of the IESO report schema
+NS = '{http://www.ieso.ca/schema}'
+DAILY_DATA = NS + 'DailyData'
+DAY = NS + 'Day'
+HOUR = NS + 'Hour'
+FUEL_TOTAL = NS + 'FuelTotal'
+FUEL = NS + 'Fuel'
+OUTPUT_QUALITY = NS + 'OutputQuality'
+OUTPUT = NS + 'Output'
+
+COLUMNS = ['timestamp', 'fuel', 'output', 'output_quality']
+# OutputQuality of a FuelTotal without one
+MISSING_QUALITY = -1
+
+class _Codes(dict):
+    """Small integer code per distinct string, so columns are stored as typed arrays"""
+
+    def code(self, value: str) -> int:
+        code = self.get(value)
+        if code is None:
+            code = self[value] = len(self)
+        return code
+
+    def values_array(self) -> np.ndarray:
+        return np.array(list(self), dtype=object)
+
+def cleaned_blob_stem(year):
+    """Cleaned output of one year, without the format extension"""
+    return f"{DATASET}/year={year}/PUB_GenOutputbyFuelHourly_{year}"
+
+def process_genmix_xml(xml_data):
+    """Process GenMix XML data (bytes or an iterable of byte chunks) into (DataFrame, {day: (sha256, start, end)})
+
+    The document is parsed incrementally: each FuelTotal is written straight into typed
+    column arrays and every finished DailyData element is cleared, so memory stays flat
+    however many days the annual report holds. Rows of each day are contiguous, at
+    [start:end) of the DataFrame; the hash covers the day's cleaned values.
+    """
+    chunks = [xml_data] if isinstance(xml_data, (bytes, bytearray)) else xml_data
+    parser = ET.XMLPullParser(events=('end',))
+
+    fuels = _Codes()
+    # Columns: hour (1-24), fuel code, output, output quality
+    hour_col, fuel_col, output_col, quality_col = array('b'), array('q'), array('d'), array('b')
+    # [day, first row] of each DailyData, in document order
+    day_starts = []
+    day = hour = fuel = quality = output = None
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            tag = elem.tag
+            if tag == FUEL:
+                fuel = elem.text
+            elif tag == OUTPUT_QUALITY:
+                quality = elem.text
+            elif tag == OUTPUT:
+                output = elem.text
+            elif tag == FUEL_TOTAL:
+                if day is not None and hour is not None and fuel:
+                    hour_col.append(hour)
+                    fuel_col.append(fuels.code(fuel))
+                    output_col.append(float(output) if output else np.nan)
+                    quality_col.append(int(quality) if quality else MISSING_QUALITY)
+                fuel = quality = output = None
+                elem.clear()
+            elif tag == HOUR:
+                hour = int(elem.text)
+            elif tag == DAY:
+                day = elem.text
+                day_starts.append((day, len(hour_col)))
+            elif tag == DAILY_DATA:
+                day = hour = None
+                elem.clear()
+    parser.close()
+
+    hours = np.frombuffer(hour_col, dtype=np.int8)
+    fuel_codes = np.frombuffer(fuel_col, dtype=np.int64)
+    outputs = np.frombuffer(output_col, dtype=np.float64)
+    qualities = np.frombuffer(quality_col, dtype=np.int8)
+    fuel_values = fuels.values_array()
+
+    # Hour ending 1-24: hour 1 starts at midnight of its day
+    ends = [start for _, start in day_starts[1:]] + [len(hours)]
+    days = np.repeat(np.array([d for d, _ in day_starts], dtype='datetime64[h]'),
+                     [end - start for (_, start), end in zip(day_starts, ends)])
+    timestamps = days + (hours.astype(np.int64) - 1).astype('timedelta64[h]')
+
+    spans = {}
+    for (day, start), end in zip(day_starts, ends):
+        digest = hashlib.sha256(day.encode())
+        for column in (hours, outputs, qualities):
+            digest.update(column[start:end].tobytes())
+        digest.update('\n'.join(fuel_values[fuel_codes[start:end]]).encode())
+        spans[day] = (digest.hexdigest(), start, end)
+
+    df = pd.DataFrame({
+        'timestamp': timestamps.astype('datetime64[ns]'),
+        'fuel': fuel_values[fuel_codes],
+        'output': outputs,
+        'output_quality': qualities
+    }, columns=COLUMNS)
+
+    return df, spans
+
+def list_sources(raw, years=None):
+    """{year: [raw blob]} to clean from: the latest annual version and every daily partition"""
+    annual, partitions = {}, {}
+    for blob in raw.list_blobs(name_starts_with=f"{DATASET}/year="):
+        match = ANNUAL_RE.match(blob.name)
+        if match:
+            year, version = match.group(1), int(match.group(2) or 0)
+            if year not in annual or version > annual[year][0]:
+                annual[year] = (version, blob)
+            continue
+        match = PARTITION_RE.match(blob.name)
+        if match:
+            partitions.setdefault(match.group(1), []).append(blob)
+
+    sources = {}
+    for year in sorted(set(annual) | set(partitions)):
+        if years and year not in years:
+            continue
+        blobs = ([annual[year][1]] if year in annual else []) + partitions.get(year, [])
+        # Oldest first, so a newer source's version of a day wins
+        sources[year] = sorted(blobs, key=lambda blob: blob.last_modified)
+    return sources
+
+def parse_source(raw, blob):
+    """Stream one raw blob through the parser; runs on an I/O thread"""
+    stream = raw.download_blob(blob.name, max_concurrency=BLOB_MAX_CONCURRENCY)
+    return process_genmix_xml(stream.chunks())
+
+def clean_year(raw, cleaned, year, blobs, year_state, incremental):
+    """Re-clean the days of one year that changed since the last run; returns the year's new state or None"""
+    extensions = output_extensions()
+    stem = cleaned_blob_stem(year)
+    outputs_present = all(cleaned.get_blob_client(stem + extension).exists() for extension in extensions)
+    current = incremental and outputs_present and year_state.get('cleaner_version') == CLEANER_VERSION
+    watermark = year_state.get('source_last_modified') if current else None
+    newest = max(blob.last_modified for blob in blobs)
+
+    changed = [blob for blob in blobs if watermark is None or blob.last_modified.isoformat() > watermark]
+    if not changed:
+        print(f"♻️  {year}: no raw file changed since last cleaned")
+        return None
+
+    # Latest version of every day found in the changed sources
+    fresh = {}
+    with ThreadPoolExecutor(max_workers=CLEAN_IO_WORKERS) as pool:
+        for blob, (df, spans) in zip(changed, pool.map(lambda blob: parse_source(raw, blob), changed)):
+            print(f"📥 {blob.name}: {len(spans)} days, {len(df)} records")
+            for day, (digest, start, end) in spans.items():
+                fresh[day] = (digest, df.iloc[start:end])
+
+    day_hashes = dict(year_state.get('days', {})) if current else {}
+    changed_days = sorted(day for day, (digest, _) in fresh.items() if day_hashes.get(day) != digest)
+    new_state = {'cleaner_version': CLEANER_VERSION, 'source_last_modified': newest.isoformat(),
+                 'days': {**day_hashes, **{day: digest for day, (digest, _) in fresh.items()}}}
+    if not changed_days:
+        print(f"♻️  {year}: {len(fresh)} days re-read, none changed")
+        return new_state
+
+    # Keep the unchanged days of the current output and replace the rest
+    frames = []
+    if current and day_hashes:
+        primary = stem + extensions[0]
+        existing = read_cleaned(cleaned.download_blob(primary, max_concurrency=BLOB_MAX_CONCURRENCY).readall(),
+                                primary)
+        existing['timestamp'] = pd.to_datetime(existing['timestamp'])
+        frames.append(existing[~existing['timestamp'].dt.strftime('%Y-%m-%d').isin(changed_days)])
+    frames += [fresh[day][1] for day in changed_days]
+    df = pd.concat(frames, ignore_index=True).sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+    metadata = lineage_metadata(changed[-1].etag, newest, CLEANER_VERSION)
+    for extension, payload in encode(df, DATASET, extensions).items():
+        print(f"⏫ Uploading cleaned → {stem + extension} ({len(payload) / 1024:.0f} KB)")
+        cleaned.upload_blob(name=stem + extension, data=payload, overwrite=True, metadata=metadata,
+                            max_concurrency=BLOB_MAX_CONCURRENCY)
+
+    print(f"✅ {year}: {len(changed_days)} of {len(fresh)} days re-cleaned "
+          f"({changed_days[0]} to {changed_days[-1]}), {len(df):,} records, "
+          f"{int((df['output_quality'] != 0).sum())} with output_quality != 0")
+    return new_state
+
+# --- PROCESS NEW DAYS OF EVERY YEAR ---
+def main():
+    """Clean the raw GenMix XML into one Parquet/CSV per year in cleaned-data (only changed days by default)"""
+    parser = argparse.ArgumentParser(description="Clean raw GenMix XML into cleaned-data Parquet/CSV")
+    parser.add_argument('years', nargs='*', help="Years to clean (default: every year in raw-data)")
+    parser.add_argument('--full', action='store_true', help="Re-clean every day, not only new or changed ones")
+    args = parser.parse_args()
+
+    raw = get_container_client(RAW_CONTAINER)
+    cleaned = get_container_client(CLEANED_CONTAINER)
+    incremental = CLEAN_INCREMENTAL and not args.full
+    state = load_state(STATE_KEY) if incremental else {}
+
+    failed = 0
+    for year, blobs in list_sources(raw, args.years).items():
+        try:
+            year_state = clean_year(raw, cleaned, year, blobs, state.get(year, {}), incremental)
+        except Exception as e:
+            print(f"❌ {year}: {e}")
+            failed += 1
+            continue
+        if year_state is not None:
+            update_state(STATE_KEY, {year: year_state})
+
+    if failed:
+        print(f"\n❌ GenMix cleaning failed for {failed} year(s)")
+        sys.exit(1)
+    print(f"\n✅ GenMix cleaned data ({', '.join(output_extensions())}) is up to date in '{CLEANED_CONTAINER}'")
+
+if __name__ == "__main__":
+    main()
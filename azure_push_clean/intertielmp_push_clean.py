@@ -1,27 +1,37 @@
+import argparse
 import os
+import sys
+import numpy as np
 import pandas as pd
 import xml.etree.ElementTree as ET
-from azure.storage.blob import BlobServiceClient
-from io import BytesIO
-from datetime import datetime, timedelta
-import re
+from array import array
 
 # --- CONFIG ---
-# Copy config_template.py to config.py and fill in your Azure credentials
-try:
-    from config import ACCOUNT_NAME, ACCOUNT_KEY, RAW_CONTAINER, CLEANED_CONTAINER
-except ImportError:
-    print("❌ config.py not found. Please copy config_template.py to config.py and fill in your Azure credentials.")
-    exit(1)
+# Shared blob client registry from the ieso_scraper package (importable without installing it);
+# credentials come from AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY or config.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.blob_clients import CLEANED_CONTAINER
+from ieso_scraper.clean_pipeline import run_clean_pipeline, iter_chunks, CLEAN_INCREMENTAL
+from ieso_scraper.cleaned_format import encode, output_extensions
 
 PREFIX = "IntertieLMP/year=2025/"
+# Recorded on every cleaned blob; bump it when the cleaning logic changes so the
+# incremental mode re-cleans everything once
+CLEANER_VERSION = "3"
 
-# --- SETUP ---
-service_client = BlobServiceClient(
-    f"https://{ACCOUNT_NAME}.blob.core.windows.net", credential=ACCOUNT_KEY
-)
-raw = service_client.get_container_client(RAW_CONTAINER)
-cleaned = service_client.get_container_client(CLEANED_CONTAINER)
+# Tags of the IESO report schema
+NS = '{http://www.ieso.ca/schema}'
+DELIVERY_DATE = NS + 'DeliveryDate'
+DELIVERY_HOUR = NS + 'DeliveryHour'
+INTERTIE = NS + 'IntertieLMPrice'
+INTERTIE_NAME = NS + 'IntertiePLName'
+INTERVAL_LMP = NS + 'IntervalLMP'
+INTERVAL = NS + 'Interval'
+LMP = NS + 'LMP'
+FLAG = NS + 'Flag'
+
+COLUMNS = ['timestamp', 'intertie_name', 'location', 'connection', 'code', 'interval_set', 'interval',
+           'lmp_value', 'flag']
 
 def parse_intertie_name(intertie_name):
     """Parse intertie name like 'PQ.BEAUHARNOIS_PQBE:LMP' into components"""
@@ -49,157 +59,158 @@ def parse_intertie_name(intertie_name):
         'code': code
     }
 
+class _Codes(dict):
+    """Small integer code per distinct string, so columns are stored as typed arrays"""
+
+    def code(self, value: str) -> int:
+        code = self.get(value)
+        if code is None:
+            code = self[value] = len(self)
+        return code
+
+    def values_array(self) -> np.ndarray:
+        return np.array(list(self), dtype=object)
+
 def process_intertie_xml(xml_data):
-    """Process IntertieLMP XML data and return cleaned DataFrame"""
-    
-    # Parse XML
+    """Process IntertieLMP XML data (bytes or an iterable of byte chunks) and return cleaned DataFrame
+
+    The document is parsed incrementally: each interval is written straight into typed
+    column arrays and every finished intertie element is cleared, so memory stays flat
+    however large the report is.
+    """
+    chunks = [xml_data] if isinstance(xml_data, (bytes, bytearray)) else xml_data
+    parser = ET.XMLPullParser(events=('start', 'end'))
+
+    base_date = base_hour = None
+    names, flags = _Codes(), _Codes()
+    # Columns: intertie name code, interval set, interval, LMP, flag code
+    name_col, set_col, interval_col, lmp_col, flag_col = array('q'), array('q'), array('q'), array('d'), array('q')
+    # Intervals of the intertie being read; kept only if it turns out to have a name.
+    # Names and intervals outside an IntertieLMPrice element belong to no intertie
+    pending, intertie_name, in_intertie = [], None, 0
+
     try:
-        root = ET.fromstring(xml_data)
-        namespace = {'ns': 'http://www.ieso.ca/schema'}
-    except Exception as e:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                tag = elem.tag
+                if event == 'start':
+                    if tag == INTERTIE:
+                        in_intertie += 1
+                elif tag == INTERVAL_LMP:
+                    interval, lmp = elem.find(INTERVAL), elem.find(LMP)
+                    if in_intertie and interval is not None and lmp is not None:
+                        flag = elem.find(FLAG)
+                        pending.append((int(interval.text), float(lmp.text), flag.text if flag is not None else ""))
+                    elem.clear()
+                elif tag == INTERTIE_NAME:
+                    if in_intertie and intertie_name is None:
+                        intertie_name = elem.text
+                elif tag == INTERTIE:
+                    in_intertie -= 1
+                    if intertie_name is not None:
+                        name_code = names.code(intertie_name)
+                        # Sets of 12 intervals in document order (5 sets expected)
+                        for counter, (interval, lmp, flag) in enumerate(pending):
+                            name_col.append(name_code)
+                            set_col.append(counter // 12)
+                            interval_col.append(interval)
+                            lmp_col.append(lmp)
+                            flag_col.append(flags.code(flag))
+                    pending, intertie_name = [], None
+                    elem.clear()
+                elif tag == DELIVERY_DATE and base_date is None:
+                    base_date = elem.text
+                elif tag == DELIVERY_HOUR and base_hour is None:
+                    base_hour = int(elem.text)
+        parser.close()
+    except ET.ParseError as e:
         print(f"❌ XML parsing error: {e}")
         return None
-    
-    # Extract metadata
-    delivery_date = root.find('.//ns:DeliveryDate', namespace)
-    delivery_hour = root.find('.//ns:DeliveryHour', namespace)
-    
-    if delivery_date is None or delivery_hour is None:
+
+    if base_date is None or base_hour is None:
         print("❌ Missing delivery date or hour in XML")
         return None
-    
-    base_date = delivery_date.text
-    base_hour = int(delivery_hour.text)
-    
-    # Find all intertie prices
-    intertie_prices = root.findall('.//ns:IntertieLMPrice', namespace)
-    
-    # Process all interties and intervals
-    records = []
-    
-    for intertie in intertie_prices:
-        intertie_name_elem = intertie.find('.//ns:IntertiePLName', namespace)
-        intervals = intertie.findall('.//ns:IntervalLMP', namespace)
-        
-        if intertie_name_elem is None:
-            continue
-            
-        intertie_name = intertie_name_elem.text
-        name_parts = parse_intertie_name(intertie_name)
-        
-        # Process intervals (expecting 60 intervals = 5 sets of 12)
-        interval_counter = 0
-        
-        for interval in intervals:
-            interval_num = interval.find('ns:Interval', namespace)
-            lmp = interval.find('ns:LMP', namespace)
-            flag = interval.find('ns:Flag', namespace)
-            
-            if interval_num is not None and lmp is not None:
-                interval_val = int(interval_num.text)
-                lmp_val = float(lmp.text)
-                flag_val = flag.text if flag is not None else ""
-                
-                # Calculate which set this interval belongs to (0-based)
-                interval_set = interval_counter // 12
-                
-                # Calculate timestamp
-                # Assume sets go backwards from delivery hour: hours 19,20,21,22,23 for sets 0,1,2,3,4
-                hour_offset = -(4 - interval_set)  # -4,-3,-2,-1,0 hours before delivery hour
-                target_hour = base_hour + hour_offset
-                
-                # Create base datetime for this hour
-                base_datetime = datetime.strptime(f"{base_date} {target_hour:02d}:00:00", "%Y-%m-%d %H:%M:%S")
-                timestamp = base_datetime + timedelta(minutes=(interval_val - 1) * 5)
-                
-                records.append({
-                    'timestamp': timestamp,
-                    'intertie_name': intertie_name,
-                    'location': name_parts['location'],
-                    'connection': name_parts['connection'], 
-                    'code': name_parts['code'],
-                    'interval_set': interval_set,
-                    'interval': interval_val,
-                    'lmp_value': lmp_val,
-                    'flag': flag_val
-                })
-                
-                interval_counter += 1
-    
-    if not records:
+
+    if not name_col:
         print("❌ No valid records found in XML")
         return None
-        
-    # Create DataFrame
-    df = pd.DataFrame(records)
-    
-    # Sort by timestamp and intertie_name for consistency
-    df = df.sort_values(['timestamp', 'intertie_name']).reset_index(drop=True)
-    
+
+    name_codes = np.frombuffer(name_col, dtype=np.int64)
+    interval_sets = np.frombuffer(set_col, dtype=np.int64)
+    intervals = np.frombuffer(interval_col, dtype=np.int64)
+    lmp_values = np.frombuffer(lmp_col, dtype=np.float64)
+    flag_codes = np.frombuffer(flag_col, dtype=np.int64)
+
+    # Sets are assumed to go backwards from the delivery hour: set 0 is 4 hours before it,
+    # set 4 the delivery hour itself; each interval is 5 minutes into its hour. Hours before 0
+    # (delivery hours 1-3) and hour 24 roll over into the previous and next day
+    minutes = (base_hour - (4 - interval_sets)) * 60 + (intervals - 1) * 5
+    timestamps = np.datetime64(base_date, 'm') + minutes.astype('timedelta64[m]')
+
+    # Sort by timestamp and intertie_name for consistency (names ranked alphabetically)
+    name_values = names.values_array()
+    name_rank = np.argsort(np.argsort(name_values))
+    order = np.lexsort((name_rank[name_codes], timestamps))
+    name_codes = name_codes[order]
+
+    parts = [parse_intertie_name(name) for name in name_values]
+    df = pd.DataFrame({
+        'timestamp': timestamps[order].astype('datetime64[ns]'),
+        'intertie_name': name_values[name_codes],
+        'location': np.array([p['location'] for p in parts], dtype=object)[name_codes],
+        'connection': np.array([p['connection'] for p in parts], dtype=object)[name_codes],
+        'code': np.array([p['code'] for p in parts], dtype=object)[name_codes],
+        'interval_set': interval_sets[order],
+        'interval': intervals[order],
+        'lmp_value': lmp_values[order],
+        'flag': flags.values_array()[flag_codes[order]]
+    }, columns=COLUMNS)
+
     return df
 
+def clean_blob(blob_name, raw):
+    """Clean one raw XML blob (a binary file) into ({extension: cleaned bytes}, log lines); runs in a parse worker"""
+    df = process_intertie_xml(iter_chunks(raw))
+
+    if df is None or df.empty:
+        raise ValueError("No data extracted")
+
+    non_zero = (df['lmp_value'] != 0).sum()
+    log_lines = [
+        f"✅ {os.path.basename(blob_name)}: extracted {len(df)} records from {df['intertie_name'].nunique()} interties",
+        f"   Time range: {df['timestamp'].min()} to {df['timestamp'].max()}",
+        f"   Non-zero LMPs: {non_zero}/{len(df)} ({non_zero / len(df) * 100:.1f}%)"
+    ]
+
+    # Typed Parquet (plus the CSV export if enabled), see ieso_scraper.cleaned_format
+    return encode(df, 'IntertieLMP'), log_lines
+
 # --- PROCESS ALL XML FILES ---
-processed_count = 0
-error_count = 0
+def main():
+    """Clean the raw IntertieLMP XML files under PREFIX into cleaned-data (only new or changed ones by default)"""
+    parser = argparse.ArgumentParser(description="Clean raw IntertieLMP XML into cleaned-data Parquet/CSV")
+    parser.add_argument('--full', action='store_true', help="Re-clean every file, not only new or changed ones")
+    args = parser.parse_args()
 
-for blob in raw.list_blobs(name_starts_with=PREFIX):
-    blob_name = blob.name
-    print(f"📥 Processing: {blob_name}")
+    # Downloads, parsing and uploads overlap (see ieso_scraper.clean_pipeline for tuning)
+    report = run_clean_pipeline(PREFIX, clean_blob, name="IntertieLMP", suffix=".xml",
+                                cleaner_version=CLEANER_VERSION, incremental=CLEAN_INCREMENTAL and not args.full)
+    report.print_summary()
+    print(f"📊 Cleaned IntertieLMP data ({', '.join(output_extensions())}) uploaded to '{CLEANED_CONTAINER}' container")
 
-    # Skip non-XML files
-    if not blob_name.endswith(".xml"):
-        print(f"⏭️  Skipping non-XML file: {blob_name}")
-        continue
+    if report.processed > 0:
+        print(f"\n📋 CLEANED DATA STRUCTURE:")
+        print("   Columns: timestamp, intertie_name, location, connection, code, interval_set, interval, lmp_value, flag")
+        print("   • timestamp: Calculated from delivery date/hour + interval set + interval")
+        print("   • intertie_name: Original full name (e.g., 'PQ.BEAUHARNOIS_PQBE:LMP')")
+        print("   • location: Jurisdiction code (e.g., 'PQ', 'MB', 'NY')")
+        print("   • connection: Connection point name (e.g., 'BEAUHARNOIS')")
+        print("   • code: Connection code (e.g., 'PQBE')")
+        print("   • interval_set: Hour grouping (0-4 for 5 hours)")
+        print("   • interval: 5-minute interval within hour (1-12)")
+        print("   • lmp_value: Locational Marginal Price (keeps zeros)")
+        print("   • flag: Data quality flag (preserved, mostly 'DSO-RD')")
 
-    try:
-        # Download XML data directly into memory
-        xml_data = raw.get_blob_client(blob_name).download_blob().readall()
-        
-        # Process XML and get cleaned DataFrame
-        df = process_intertie_xml(xml_data)
-        
-        if df is None or df.empty:
-            print(f"❌ No data extracted from: {blob_name}")
-            error_count += 1
-            continue
-        
-        print(f"✅ Extracted {len(df)} records from {df['intertie_name'].nunique()} interties")
-        print(f"   Time range: {df['timestamp'].min()} to {df['timestamp'].max()}")
-        print(f"   Non-zero LMPs: {(df['lmp_value'] != 0).sum()}/{len(df)} ({(df['lmp_value'] != 0).sum()/len(df)*100:.1f}%)")
-        
-        # Convert DataFrame to CSV in memory
-        csv_buffer = BytesIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
-        
-        # Create cleaned blob name (replace .xml with .csv)
-        cleaned_blob_name = blob_name.replace('.xml', '.csv')
-        
-        # Upload directly to cleaned container
-        print(f"⏫ Uploading cleaned data to: {cleaned_blob_name}")
-        cleaned.upload_blob(name=cleaned_blob_name, data=csv_data, overwrite=True)
-        
-        processed_count += 1
-        
-    except Exception as e:
-        print(f"❌ Error processing {blob_name}: {e}")
-        error_count += 1
-        continue
-
-print(f"\n🎉 PROCESSING COMPLETE!")
-print(f"✅ Successfully processed: {processed_count} files")
-print(f"❌ Errors: {error_count} files")
-print(f"📊 Cleaned IntertieLMP data uploaded to '{CLEANED_CONTAINER}' container")
-
-if processed_count > 0:
-    print(f"\n📋 CLEANED DATA STRUCTURE:")
-    print("   Columns: timestamp, intertie_name, location, connection, code, interval_set, interval, lmp_value, flag")
-    print("   • timestamp: Calculated from delivery date/hour + interval set + interval")
-    print("   • intertie_name: Original full name (e.g., 'PQ.BEAUHARNOIS_PQBE:LMP')")
-    print("   • location: Jurisdiction code (e.g., 'PQ', 'MB', 'NY')")
-    print("   • connection: Connection point name (e.g., 'BEAUHARNOIS')")
-    print("   • code: Connection code (e.g., 'PQBE')")
-    print("   • interval_set: Hour grouping (0-4 for 5 hours)")
-    print("   • interval: 5-minute interval within hour (1-12)")
-    print("   • lmp_value: Locational Marginal Price (keeps zeros)")
-    print("   • flag: Data quality flag (preserved, mostly 'DSO-RD')") 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
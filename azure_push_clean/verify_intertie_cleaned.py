@@ -1,24 +1,24 @@
-import pandas as pd
-from azure.storage.blob import BlobServiceClient
-from io import BytesIO
+import os
+import sys
 
 # Config
-ACCOUNT_NAME = "YOUR_AZURE_STORAGE_ACCOUNT"
-ACCOUNT_KEY = "YOUR_AZURE_STORAGE_KEY_HERE"
-CLEANED_CONTAINER = "cleaned-data"
+# Shared blob client registry from the ieso_scraper package (importable without installing it);
+# credentials come from AZURE_STORAGE_ACCOUNT/AZURE_STORAGE_KEY or config.py
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.blob_clients import get_container_client, CLEANED_CONTAINER
+from ieso_scraper.cleaned_format import preferred_files, read_cleaned
 
 # Setup
-service_client = BlobServiceClient(
-    f"https://{ACCOUNT_NAME}.blob.core.windows.net", credential=ACCOUNT_KEY
-)
-cleaned = service_client.get_container_client(CLEANED_CONTAINER)
+cleaned = get_container_client(CLEANED_CONTAINER)
 
-# Download one cleaned file to verify structure
-blob_name = "IntertieLMP/year=2025/month=05/day=01/PUB_RealTimeIntertieLMP_2025050123_v12.csv"
+# Download one cleaned file to verify structure (the Parquet output, else its CSV export)
+blob_stem = "IntertieLMP/year=2025/month=05/day=01/PUB_RealTimeIntertieLMP_2025050123_v12"
+blob_name = preferred_files(blob.name for blob in cleaned.list_blobs(name_starts_with=blob_stem))[0]
 
 print(f"📥 Downloading: {blob_name}")
-csv_data = cleaned.get_blob_client(blob_name).download_blob().readall()
-df = pd.read_csv(BytesIO(csv_data))
+data = cleaned.get_blob_client(blob_name).download_blob().readall()
+df = read_cleaned(data, blob_name)
+print(f"Column types: {df.dtypes.astype(str).to_dict()}")
 
 print(f"\n📊 CLEANED DATA VERIFICATION:")
 print(f"Shape: {df.shape}")
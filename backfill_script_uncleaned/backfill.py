@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+IESO Backfill Engine
+Resumable, parallel backfill of raw IESO reports into blob storage for a date range.
+Completed files are recorded in a checkpoint file so an interrupted run picks up where it stopped.
+
+Examples:
+    python backfill.py --dry-run --start 2024-01-01 --end 2025-05-19 --bandwidth-mbps 50
+    python backfill.py EnergyLMP IntertieLMP --start 2024-01-01 --workers 16
+    python backfill.py GenMix --start 2023-01-01 --restart
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Set
+
+# Shared helpers from the ieso_scraper package: listing cache, blob index and transfer engine
+# (importable without installing the package)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.scraper_utils import scrape_ieso_directory, extract_hour_key, extract_year_version, parse_size
+from ieso_scraper.azure_utils import build_blob_path, RAW_CONTAINER
+from ieso_scraper.blob_index import build_blob_index
+from ieso_scraper.content_index import load_content_index
+from ieso_scraper.rate_limiter import format_rate_limiter_stats
+from ieso_scraper.transfer_engine import transfer_file, TransferReport, DEFAULT_MAX_WORKERS, DEFAULT_MAX_RETRIES
+
+from datasets import DATASETS
+
+DEFAULT_CHECKPOINT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backfill_checkpoint.jsonl')
+COMPLETED_STATUSES = ('uploaded', 'skipped', 'unchanged')
+
+# --- PLANNING ---
+
+def _version(name: str) -> int:
+    match = re.search(r'_v(\d+)\.\w+$', name)
+    return int(match.group(1)) if match else 0
+
+def select_files(files: List[Dict], spec: Dict, start: datetime, end: datetime) -> List[Dict]:
+    """Pick the files of one dataset that cover [start, end] according to its selection rule"""
+    chosen = {}
+
+    for file in files:
+        if spec['granularity'] == 'hourly':
+            hour_key = extract_hour_key(file['name'])
+            if hour_key is None:
+                continue
+            day = datetime.strptime(hour_key[:8], '%Y%m%d')
+            if not start <= day <= end:
+                continue
+            if spec['selection'] == 'latest_per_day':
+                group, rank = hour_key[:8], (hour_key, _version(file['name']))
+            else:
+                group, rank = hour_key, (hour_key, _version(file['name']))
+        else:
+            year, version = extract_year_version(file['name'])
+            if year is None or not start.year <= year <= end.year:
+                continue
+            group, rank = year, (str(year), version)
+
+        if group not in chosen or rank > chosen[group][0]:
+            chosen[group] = (rank, file)
+
+    return [chosen[group][1] for group in sorted(chosen)]
+
+def plan_dataset(dataset: str, start: datetime, end: datetime, completed: Set[str]) -> Dict:
+    """List a dataset's directory and work out what still has to be transferred"""
+    spec = DATASETS[dataset]
+    files = scrape_ieso_directory(spec['url'], spec['pattern'])
+    selected = select_files(files, spec, start, end)
+    pending = [f for f in selected if f['name'] not in completed]
+
+    return {
+        'dataset': dataset,
+        'listed': len(files),
+        'selected': len(selected),
+        'done': len(selected) - len(pending),
+        'pending': pending,
+        'pending_bytes': sum(parse_size(f.get('size', '')) for f in pending)
+    }
+
+def print_plan(plans: List[Dict], workers: int, bandwidth_mbps: float = None):
+    """Dry-run summary: files and bytes left per dataset and the expected duration"""
+    print("\n📋 BACKFILL PLAN")
+    print("=" * 72)
+    print(f"{'Dataset':12} | {'Listed':>7} | {'In range':>8} | {'Done':>6} | {'Pending':>7} | {'Size':>9}")
+    print("-" * 72)
+    for plan in plans:
+        print(f"{plan['dataset']:12} | {plan['listed']:7} | {plan['selected']:8} | {plan['done']:6} | "
+              f"{len(plan['pending']):7} | {plan['pending_bytes'] / 1024 / 1024:7.1f} MB")
+    print("-" * 72)
+
+    total_files = sum(len(p['pending']) for p in plans)
+    total_bytes = sum(p['pending_bytes'] for p in plans)
+    print(f"📦 {total_files} files, ~{total_bytes / 1024 / 1024:.1f} MB to transfer with {workers} workers")
+
+    if bandwidth_mbps:
+        seconds = total_bytes * 8 / (bandwidth_mbps * 1_000_000)
+        print(f"⏱️  ~{timedelta(seconds=int(seconds))} at {bandwidth_mbps:g} Mbit/s")
+
+# --- CHECKPOINT ---
+
+class Checkpoint:
+    """Append-only JSON-lines record of completed files, safe to share between workers"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Whether the file ends in a newline; checked before the first record of this run
+        self._clean_tail = None
+
+    def completed(self) -> Dict[str, Set[str]]:
+        """Names already completed, per dataset (a truncated last line is ignored)"""
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('status') in COMPLETED_STATUSES:
+                    done.setdefault(record['dataset'], set()).add(record['name'])
+        return done
+
+    def record(self, dataset: str, result: Dict):
+        entry = {
+            'dataset': dataset,
+            'name': result['name'],
+            'status': result['status'],
+            'bytes': result['bytes'],
+            'error': result['error'],
+            'at': datetime.now().isoformat(timespec='seconds')
+        }
+        with self._lock:
+            if self._clean_tail is None:
+                self._clean_tail = self._ends_with_newline()
+            with open(self.path, 'a') as f:
+                # A line cut short by an interrupted run must not swallow this record
+                f.write(('' if self._clean_tail else '\n') + json.dumps(entry) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._clean_tail = True
+
+    def _ends_with_newline(self) -> bool:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return True
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def reset(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._clean_tail = True
+
+# --- EXECUTION ---
+
+def run_dataset(plan: Dict, checkpoint: Checkpoint, workers: int, max_retries: int,
+                container: str = RAW_CONTAINER) -> TransferReport:
+    """Transfer a dataset's pending files in parallel, checkpointing each completion"""
+    dataset, files = plan['dataset'], plan['pending']
+    report = TransferReport(dataset, len(files))
+    if not files:
+        report.finish()
+        return report
+
+    blob_index = build_blob_index(container, (build_blob_path(dataset, f['name']) for f in files))
+    content_index = load_content_index(dataset)
+    print(f"🚚 Backfilling {len(files)} {dataset} files with {workers} workers")
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{dataset}-backfill")
+    try:
+        futures = [
+            executor.submit(transfer_file, file, dataset, container, blob_index, max_retries, content_index)
+            for file in files
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            report.add(result)
+            checkpoint.record(dataset, result)
+            if done % 25 == 0 or done == len(files):
+                print(f"📈 {dataset}: {done}/{len(files)} "
+                      f"({report.bytes_transferred / 1024 / 1024:.1f} MB, {report.elapsed:.0f}s)")
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted - completed {dataset} files are checkpointed, rerun to resume")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        content_index.save()
+
+    report.listing_calls = blob_index.listing_calls
+    report.fallback_checks = blob_index.fallback_checks
+    report.finish()
+    return report
+
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value, '%Y-%m-%d')
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Resumable parallel backfill of raw IESO reports")
+    parser.add_argument('datasets', nargs='*', help=f"Datasets to backfill (default: all of {', '.join(DATASETS)})")
+    parser.add_argument('--start', type=parse_date, help="First date (YYYY-MM-DD, default: per-dataset window)")
+    parser.add_argument('--end', type=parse_date, help="Last date (YYYY-MM-DD, default: yesterday)")
+    parser.add_argument('--all-hours', action='store_true',
+                        help="Hourly datasets: take every hour instead of the last file of each day")
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS, help="Parallel transfers")
+    parser.add_argument('--retries', type=int, default=DEFAULT_MAX_RETRIES, help="Attempts per file")
+    parser.add_argument('--limit', type=int, default=None, help="Transfer at most N files per dataset this run")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help="Checkpoint file (JSON lines)")
+    parser.add_argument('--restart', action='store_true', help="Discard the checkpoint and start over")
+    parser.add_argument('--dry-run', action='store_true', help="Only print the plan")
+    parser.add_argument('--bandwidth-mbps', type=float, default=None,
+                        help="Available bandwidth, used to estimate the duration")
+    args = parser.parse_args()
+
+    datasets = args.datasets or list(DATASETS)
+    unknown = [name for name in datasets if name not in DATASETS]
+    if unknown:
+        parser.error(f"unknown dataset(s): {', '.join(unknown)}")
+    end = args.end or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+    if args.all_hours:
+        for name in datasets:
+            if DATASETS[name]['granularity'] == 'hourly':
+                DATASETS[name]['selection'] = 'all_hours'
+
+    checkpoint = Checkpoint(args.checkpoint)
+    if args.restart and not args.dry_run:
+        checkpoint.reset()
+    completed = checkpoint.completed()
+
+    plans = []
+    for name in datasets:
+        start = args.start or end - timedelta(days=DATASETS[name]['default_days'])
+        print(f"🌐 Planning {name}: {start.strftime('%Y-%m-%d')} → {end.strftime('%Y-%m-%d')}")
+        plan = plan_dataset(name, start, end, completed.get(name, set()))
+        if args.limit is not None:
+            plan['pending'] = plan['pending'][:args.limit]
+            plan['pending_bytes'] = sum(parse_size(f.get('size', '')) for f in plan['pending'])
+        plans.append(plan)
+
+    print_plan(plans, args.workers, args.bandwidth_mbps)
+    if args.dry_run:
+        return
+
+    started = time.time()
+    reports = []
+    try:
+        for plan in plans:
+            report = run_dataset(plan, checkpoint, args.workers, args.retries)
+            report.print_summary()
+            reports.append(report)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    failed = sum(r.failed for r in reports)
+    print(f"\n🎉 Backfill finished in {time.time() - started:.0f}s: "
+          f"{sum(r.success_count for r in reports)} files done, {failed} failed")
+    print(format_rate_limiter_stats())
+    if failed:
+        print(f"🔁 Rerun the same command to retry failed files (checkpoint: {args.checkpoint})")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
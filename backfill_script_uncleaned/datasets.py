@@ -0,0 +1,21 @@
+"""
+Backfill dataset registry
+Where each IESO report is published comes from the scraper's dataset specs
+(ieso_scraper.datasets); this adds how the backfill picks files inside a date range
+"""
+
+from ieso_scraper.datasets import DATASETS as SCRAPER_DATASETS
+
+# selection:
+#   'latest_per_day'  - hourly reports, highest hour/version of each day (original backfill behaviour)
+#   'all_hours'       - hourly reports, latest version of every hour (what the live gap fillers ingest)
+#   'latest_per_year' - annual reports, highest version of each year
+BACKFILL_OPTIONS = {
+    'EnergyLMP': {'selection': 'latest_per_day', 'default_days': 140},
+    'IntertieLMP': {'selection': 'latest_per_day', 'default_days': 90},
+    'GenMix': {'selection': 'latest_per_year', 'default_days': 366},
+    'Demand': {'selection': 'latest_per_year', 'default_days': 92},
+    'DemandZonal': {'selection': 'latest_per_year', 'default_days': 92}
+}
+
+DATASETS = {name: {**SCRAPER_DATASETS[name], **options} for name, options in BACKFILL_OPTIONS.items()}
@@ -40,7 +40,7 @@ for daily_data in root.findall(".//{http://www.ieso.ca/schema}DailyData"):
                     'output_quality': output_quality,
                     'output': output
                 }
-    rows.append(row)
+                rows.append(row)
 
 print(f"✅ Total records found: {len(rows)}")
 
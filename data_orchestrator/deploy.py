@@ -9,6 +9,7 @@ import sys
 import subprocess
 import json
 import logging
+import shutil
 from pathlib import Path
 
 # Set up logging
@@ -129,6 +130,13 @@ def deploy_function():
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
+    # Ship the shared blob client registry (ieso_scraper package) next to function_app.py
+    package_src = script_dir.parent / "azure_live_scraper" / "ieso_scraper"
+    package_dst = script_dir / "ieso_scraper"
+    shutil.rmtree(package_dst, ignore_errors=True)
+    shutil.copytree(package_src, package_dst, ignore=shutil.ignore_patterns("__pycache__"))
+    logging.info(f"📦 Bundled {package_src} for deployment")
+    
     # Deploy using Azure Functions Core Tools
     deploy_cmd = f"func azure functionapp publish {FUNCTION_APP_NAME} --python"
     
@@ -1,4 +1,5 @@
 import azure.functions as func
+import importlib.util
 import logging
 import os
 import sys
@@ -6,10 +7,14 @@ import json
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from io import StringIO
 
-# Azure SDK imports
-from azure.storage.blob import BlobServiceClient
+# Blob clients come from the ieso_scraper package's shared registry (one pooled client per
+# process); it is installed into .python_packages on deploy, a checkout uses the source tree
+if importlib.util.find_spec('ieso_scraper') is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'azure_live_scraper'))
+from ieso_scraper.blob_clients import get_blob_service_client as get_shared_blob_service_client
+from ieso_scraper.blob_clients import get_container_client, BLOB_MAX_CONCURRENCY
+from ieso_scraper.cleaned_format import read_cleaned
 
 # ML imports  
 import joblib
@@ -21,30 +26,32 @@ import xgboost as xgb
 # Initialize Function App
 app = func.FunctionApp()
 
+STORAGE_ACCOUNT_NAME = os.environ.get('AZURE_STORAGE_ACCOUNT_NAME', 'datastoreyugant')
+
 def get_blob_service_client():
-    """Get authenticated blob service client using environment variables"""
-    account_name = os.environ.get('AZURE_STORAGE_ACCOUNT_NAME', 'datastoreyugant')
+    """Get the shared, authenticated blob service client using environment variables"""
     account_key = os.environ.get('AZURE_STORAGE_ACCOUNT_KEY')
     
     if not account_key:
         raise ValueError("AZURE_STORAGE_ACCOUNT_KEY environment variable not set")
     
-    return BlobServiceClient(
-        account_url=f"https://{account_name}.blob.core.windows.net", 
-        credential=account_key
-    )
+    return get_shared_blob_service_client(STORAGE_ACCOUNT_NAME, account_key)
+
+def get_orchestrator_container(container_name):
+    """Get the shared client of one container (created once per worker)"""
+    get_blob_service_client()  # validates the key and registers the account's client
+    return get_container_client(container_name, STORAGE_ACCOUNT_NAME)
 
 def read_blob_to_dataframe(container_name, blob_path):
-    """Read CSV blob directly to pandas DataFrame"""
+    """Read a cleaned Parquet or CSV blob directly to pandas DataFrame"""
     try:
-        blob_client = get_blob_service_client()
-        container_client = blob_client.get_container_client(container_name)
+        container_client = get_orchestrator_container(container_name)
         
         logging.info(f"Reading blob: {container_name}/{blob_path}")
-        blob_data = container_client.download_blob(blob_path)
-        csv_content = blob_data.readall().decode('utf-8')
+        blob_data = container_client.download_blob(blob_path, max_concurrency=BLOB_MAX_CONCURRENCY)
         
-        df = pd.read_csv(StringIO(csv_content))
+        # Parquet keeps the cleaned column types; CSV is parsed and re-inferred
+        df = read_cleaned(blob_data.readall(), blob_path)
         logging.info(f"Successfully loaded {len(df)} rows from {blob_path}")
         return df
         
@@ -55,11 +62,10 @@ def read_blob_to_dataframe(container_name, blob_path):
 def save_blob_from_string(container_name, blob_path, content):
     """Save string content to blob storage"""
     try:
-        blob_client = get_blob_service_client()
-        container_client = blob_client.get_container_client(container_name)
+        container_client = get_orchestrator_container(container_name)
         
         logging.info(f"Saving blob: {container_name}/{blob_path}")
-        container_client.upload_blob(blob_path, content, overwrite=True)
+        container_client.upload_blob(blob_path, content, overwrite=True, max_concurrency=BLOB_MAX_CONCURRENCY)
         logging.info(f"Successfully saved {blob_path}")
         
     except Exception as e:
@@ -306,6 +312,7 @@ def ml_orchestrator_timer(mytimer: func.TimerRequest) -> None:
         
         logging.info("Loading generation mix data...")
         genmix_files = [
+            "year=2025/PUB_GenOutputbyFuelHourly_2025.parquet",  # azure_push_clean/genmix_clean_push.py
             "PUB_GenOutputbyFuelHourly_2025_v144_cleaned.csv",
             "PUB_GenOutputbyFuelHourly_2025_v148_cleaned.csv"
         ]
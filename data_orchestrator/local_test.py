@@ -73,6 +73,7 @@ def test_data_loading():
         
         # Try to load genmix data
         genmix_files = [
+            "GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.parquet",
             "GenMix/PUB_GenOutputbyFuelHourly_2025_v144_cleaned.csv",
             "GenMix/PUB_GenOutputbyFuelHourly_2025_v148_cleaned.csv"
         ]
@@ -126,6 +127,7 @@ def test_model_training():
                 continue
         
         genmix_files = [
+            "GenMix/year=2025/PUB_GenOutputbyFuelHourly_2025.parquet",
             "GenMix/PUB_GenOutputbyFuelHourly_2025_v148_cleaned.csv",
             "GenMix/PUB_GenOutputbyFuelHourly_2025_v144_cleaned.csv"
         ]
@@ -1,5 +1,11 @@
-from azure.storage.blob import BlobServiceClient
+import asyncio
 import os
+import sys
+
+# Async blob layer from the ieso_scraper package (importable without installing it)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+from ieso_scraper.async_blob import AsyncBlobStore
+from ieso_scraper.cleaned_format import preferred_files
 
 # Import credentials from config file (create config.py with your Azure credentials)
 try:
@@ -14,10 +20,7 @@ except ImportError:
 
 CONTAINER_NAME = "cleaned-data"
 
-def download_all_cleaned_data():
-    service_client = BlobServiceClient(f"https://{ACCOUNT_NAME}.blob.core.windows.net", credential=ACCOUNT_KEY)
-    container = service_client.get_container_client("cleaned-data")
-
+async def download_all_cleaned_data():
     datasets = {
         'Demand' : 'data/demand/',
         'DemandZonal' : 'data/demandzonal/',
@@ -27,19 +30,33 @@ def download_all_cleaned_data():
         'pub_demand' : 'data/pub_demand/',
     }
 
-    for dataset, local_dir in datasets.items():
-        os.makedirs(local_dir, exist_ok=True)
-        blobs = container.list_blobs(name_starts_with=f"{dataset}/year=2025/")
-        for blob in blobs: 
-            if blob.name.endswith('.csv'):
-                filename = os.path.basename(blob.name)
-                local_path = os.path.join(local_dir,filename)
+    async with AsyncBlobStore(account_name=ACCOUNT_NAME, account_key=ACCOUNT_KEY) as store:
+        # List every dataset at once, then download all files concurrently
+        prefixes = [f"{dataset}/year=2025/" for dataset in datasets]
+        listings = await asyncio.gather(*(store.list_names(CONTAINER_NAME, prefix) for prefix in prefixes),
+                                        return_exceptions=True)
+
+        # A prefix that cannot be listed is reported; the other datasets still download
+        paths, failed = {}, {}
+        for (dataset, local_dir), prefix, blob_names in zip(datasets.items(), prefixes, listings):
+            if isinstance(blob_names, Exception):
+                failed[prefix] = blob_names
+                continue
+            os.makedirs(local_dir, exist_ok=True)
+            # Parquet where it exists, else the CSV
+            for blob_name in preferred_files(blob_names):
+                paths[blob_name] = os.path.join(local_dir, os.path.basename(blob_name))
+
+        print(f"📥 Downloading {len(paths)} files...")
+        # Each file is written to a temp file and moved into place once complete
+        written, failed_downloads = await store.download_many_to_files(CONTAINER_NAME, paths)
+        failed.update(failed_downloads)
 
-                print(f"📥 Downloading: {blob.name}")
-                with open(local_path, "wb") as f:
-                    f.write(container.get_blob_client(blob.name).download_blob().readall())
-                    
-    print("✅ All data downloaded!")
+    for name, error in failed.items():
+        print(f"❌ Failed: {name} — {error}")
+    print(f"📦 {len(written)} files, {sum(written.values()) / 1024 / 1024:.1f} MB")
+    if not failed:
+        print("✅ All data downloaded!")
 
 if __name__ == "__main__":
-    download_all_cleaned_data()
\ No newline at end of file
+    asyncio.run(download_all_cleaned_data())
\ No newline at end of file
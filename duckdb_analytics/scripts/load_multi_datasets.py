@@ -1,10 +1,17 @@
 import duckdb 
 import glob 
+import os
+import sys
+
+# Cleaned-file helpers from the ieso_scraper package (importable without installing it)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+from ieso_scraper.cleaned_format import preferred_files, duckdb_scan
 
 conn = duckdb.connect('duckdb_analytics.db')
 
 def load_energy_lmp_files():
-    energy_files = glob.glob('data/energy_lmp/*.csv')
+    # Parquet where downloaded, else the CSV
+    energy_files = preferred_files(glob.glob('data/energy_lmp/*'))
     print(f"📥 Loading {len(energy_files)} Energy LMP files")
 
     for file in energy_files:
@@ -14,14 +21,14 @@ def load_energy_lmp_files():
             INSERT INTO energy_lmp
             SELECT timestamp::TIMESTAMP, delivery_hour, interval, pricing_location, 
                    lmp, energy_loss_price, energy_congestion_price
-            FROM read_csv_auto('{file}')
+            FROM {duckdb_scan(file)}
         """)
     
         count = conn.execute('SELECT COUNT(*) FROM energy_lmp').fetchone()[0]
     print(f"✅ EnergyLMP loaded: {count:,} records")
 
 def load_intertie_lmp_files():
-    intertie_files = glob.glob('data/intertie_lmp/*.csv')
+    intertie_files = preferred_files(glob.glob('data/intertie_lmp/*'))
     print(f"📥 Loading {len(intertie_files)} Intertie LMP files")
 
     for file in intertie_files:
@@ -31,7 +38,7 @@ def load_intertie_lmp_files():
             INSERT INTO intertie_lmp
             SELECT timestamp::TIMESTAMP, intertie_name, location, connection, 
                    code, interval_set, interval, lmp_value, flag
-            FROM read_csv_auto('{file}')
+            FROM {duckdb_scan(file)}
             """)
     
     count = conn.execute("SELECT COUNT(*) FROM intertie_lmp").fetchone()[0]
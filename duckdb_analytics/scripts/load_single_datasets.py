@@ -2,55 +2,61 @@
 import duckdb
 import glob
 import os
+import sys
+
+# Cleaned-file helpers from the ieso_scraper package (importable without installing it)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+from ieso_scraper.cleaned_format import preferred_files, duckdb_scan
 
 conn = duckdb.connect('duckdb_analytics.db')
 
 def load_single_csv_datasets():
     # Load demand (single file) - it's in pub_demand directory
     # Columns: Date,Hour,Market Demand,Ontario Demand,timestamp
-    demand_file = glob.glob('data/pub_demand/*.csv')[0]
+    demand_file = preferred_files(glob.glob('data/pub_demand/*'))[0]
     print(f"📥 Loading demand from: {demand_file}")
     conn.execute(f"""
         INSERT INTO demand 
         SELECT timestamp::TIMESTAMP, "Ontario Demand" as ontario_demand_mw
-        FROM read_csv_auto('{demand_file}')
+        FROM {duckdb_scan(demand_file)}
     """)
     
     # Load zonal demand (single file) - it's in demandzonal directory  
     # This has multiple zone columns, we need to unpivot it
-    zonal_file = glob.glob('data/demandzonal/*.csv')[0]
+    zonal_file = preferred_files(glob.glob('data/demandzonal/*'))[0]
+    zonal = duckdb_scan(zonal_file)
     print(f"📥 Loading zonal demand from: {zonal_file}")
     conn.execute(f"""
         INSERT INTO zonal_demand
-        SELECT timestamp::TIMESTAMP, 'Northwest' as zone_name, Northwest as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Northwest IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Northwest' as zone_name, Northwest as demand_mw FROM {zonal} WHERE Northwest IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Northeast' as zone_name, Northeast as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Northeast IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Northeast' as zone_name, Northeast as demand_mw FROM {zonal} WHERE Northeast IS NOT NULL
         UNION ALL  
-        SELECT timestamp::TIMESTAMP, 'Ottawa' as zone_name, Ottawa as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Ottawa IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Ottawa' as zone_name, Ottawa as demand_mw FROM {zonal} WHERE Ottawa IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'East' as zone_name, East as demand_mw FROM read_csv_auto('{zonal_file}') WHERE East IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'East' as zone_name, East as demand_mw FROM {zonal} WHERE East IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Toronto' as zone_name, Toronto as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Toronto IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Toronto' as zone_name, Toronto as demand_mw FROM {zonal} WHERE Toronto IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Essa' as zone_name, Essa as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Essa IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Essa' as zone_name, Essa as demand_mw FROM {zonal} WHERE Essa IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Bruce' as zone_name, Bruce as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Bruce IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Bruce' as zone_name, Bruce as demand_mw FROM {zonal} WHERE Bruce IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Southwest' as zone_name, Southwest as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Southwest IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Southwest' as zone_name, Southwest as demand_mw FROM {zonal} WHERE Southwest IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'Niagara' as zone_name, Niagara as demand_mw FROM read_csv_auto('{zonal_file}') WHERE Niagara IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'Niagara' as zone_name, Niagara as demand_mw FROM {zonal} WHERE Niagara IS NOT NULL
         UNION ALL
-        SELECT timestamp::TIMESTAMP, 'West' as zone_name, West as demand_mw FROM read_csv_auto('{zonal_file}') WHERE West IS NOT NULL
+        SELECT timestamp::TIMESTAMP, 'West' as zone_name, West as demand_mw FROM {zonal} WHERE West IS NOT NULL
     """)
     
     # Load genmix (single file)
     # Columns: timestamp,fuel,output
-    genmix_file = glob.glob('data/genmix/*.csv')[0]
+    genmix_file = preferred_files(glob.glob('data/genmix/*'))[0]
     print(f"📥 Loading genmix from: {genmix_file}")
     conn.execute(f"""
         INSERT INTO genmix
         SELECT timestamp::TIMESTAMP, fuel as fuel_type, output as gen_mw
-        FROM read_csv_auto('{genmix_file}')
+        FROM {duckdb_scan(genmix_file)}
     """)
     
     print("✅ Single datasets loaded!")
@@ -1,14 +1,18 @@
 import streamlit as st
-import pandas as pd
 import json
-import io
+import os
+import sys
 from azure.storage.blob import BlobServiceClient
 from .azure_config import get_azure_config, get_containers
-from datetime import datetime, timedelta
+
+# Async blob layer from the ieso_scraper package in the repository
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'azure_live_scraper'))
+from ieso_scraper.async_blob import list_containers
+from ieso_scraper.cleaned_format import preferred_files, read_cleaned
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
-def load_data_from_azure(container_name, blob_name, file_type='csv'):
-    """Load data from Azure Blob Storage with caching"""
+def load_data_from_azure(container_name, blob_name, file_type=None):
+    """Load data from Azure Blob Storage with caching (file_type defaults to the blob's extension)"""
     
     try:
         config = get_azure_config()
@@ -23,8 +27,10 @@ def load_data_from_azure(container_name, blob_name, file_type='csv'):
         # Download blob content
         blob_data = blob_client.download_blob().readall()
         
-        if file_type == 'csv':
-            return pd.read_csv(io.BytesIO(blob_data))
+        file_type = file_type or os.path.splitext(blob_name)[1].lstrip('.')
+        if file_type in ('csv', 'parquet'):
+            # Cleaned Parquet files carry their column types; CSVs are re-inferred
+            return read_cleaned(blob_data, blob_name)
         elif file_type == 'json':
             return json.loads(blob_data.decode('utf-8'))
         else:
@@ -50,23 +56,12 @@ def get_available_data_files():
     
     try:
         config = get_azure_config()
-        blob_service_client = BlobServiceClient(
-            account_url=f"https://{config['account_name']}.blob.core.windows.net",
-            credential=config['account_key']
-        )
-        
         containers = get_containers()
-        available_files = {}
-        
-        for container_type, container_name in containers.items():
-            try:
-                container_client = blob_service_client.get_container_client(container_name)
-                blobs = list(container_client.list_blobs())
-                available_files[container_type] = [blob.name for blob in blobs]
-            except:
-                available_files[container_type] = []
         
-        return available_files
+        # List all containers concurrently (a container that fails to list comes back empty)
+        listed = list_containers(containers.values(), account_name=config['account_name'],
+                                 account_key=config['account_key'])
+        return {container_type: listed[container_name] for container_type, container_name in containers.items()}
         
     except Exception as e:
         st.error(f"Error getting file list: {str(e)}")
@@ -76,65 +71,66 @@ def get_available_data_files():
 def load_demand_data():
     """Load all available demand data"""
     files = get_available_data_files()
-    demand_files = [f for f in files.get('cleaned_data', []) if 'Demand' in f and f.endswith('.csv')]
+    # One file per output (Parquet over its CSV export), sorted
+    demand_files = preferred_files(f for f in files.get('cleaned_data', []) if 'Demand' in f)
     
     if not demand_files:
         return None
     
     # Load the most recent demand file
-    latest_file = sorted(demand_files)[-1]
+    latest_file = demand_files[-1]
     return load_data_from_azure("cleaned-data", latest_file)
 
 @st.cache_data(ttl=3600)
 def load_genmix_data():
     """Load all available generation mix data"""
     files = get_available_data_files()
-    genmix_files = [f for f in files.get('cleaned_data', []) if 'GenOutput' in f and f.endswith('.csv')]
+    genmix_files = preferred_files(f for f in files.get('cleaned_data', []) if 'GenOutput' in f)
     
     if not genmix_files:
         return None
     
     # Load the most recent genmix file
-    latest_file = sorted(genmix_files)[-1]
+    latest_file = genmix_files[-1]
     return load_data_from_azure("cleaned-data", latest_file)
 
 @st.cache_data(ttl=3600)
 def load_zonal_data():
     """Load zonal demand data if available"""
     files = get_available_data_files()
-    zonal_files = [f for f in files.get('cleaned_data', []) if 'Zonal' in f and f.endswith('.csv')]
+    zonal_files = preferred_files(f for f in files.get('cleaned_data', []) if 'Zonal' in f)
     
     if not zonal_files:
         return None
     
     # Load the most recent zonal file
-    latest_file = sorted(zonal_files)[-1]
+    latest_file = zonal_files[-1]
     return load_data_from_azure("cleaned-data", latest_file)
 
 @st.cache_data(ttl=3600)
 def load_intertie_lmp_data():
     """Load intertie LMP (Locational Marginal Pricing) data"""
     files = get_available_data_files()
-    intertie_files = [f for f in files.get('cleaned_data', []) if 'Intertie' in f and f.endswith('.csv')]
+    intertie_files = preferred_files(f for f in files.get('cleaned_data', []) if 'Intertie' in f)
     
     if not intertie_files:
         return None
     
     # Load the most recent intertie LMP file
-    latest_file = sorted(intertie_files)[-1]
+    latest_file = intertie_files[-1]
     return load_data_from_azure("cleaned-data", latest_file)
 
 @st.cache_data(ttl=3600)
 def load_energy_lmp_data():
     """Load energy LMP (Locational Marginal Pricing) data"""
     files = get_available_data_files()
-    energy_lmp_files = [f for f in files.get('cleaned_data', []) if 'EnergyLMP' in f and f.endswith('.csv')]
+    energy_lmp_files = preferred_files(f for f in files.get('cleaned_data', []) if 'EnergyLMP' in f)
     
     if not energy_lmp_files:
         return None
     
     # Load the most recent energy LMP file
-    latest_file = sorted(energy_lmp_files)[-1]
+    latest_file = energy_lmp_files[-1]
     return load_data_from_azure("cleaned-data", latest_file)
 
 def refresh_cache():
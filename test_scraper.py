@@ -2,110 +2,65 @@
 """
 Standalone test script for IESO data scrapers
 """
+import importlib
 import sys
 import os
+import re
 from datetime import datetime, timedelta
 
-# Add the scraper_modules directory to the path
-sys.path.append('scraper_modules')
+# The scraper is the ieso_scraper package in azure_live_scraper/
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'azure_live_scraper'))
 
 # Import the scraper modules
 try:
-    from energylmp_gap_filler import EnergyLMPGapFiller
-    from intertielmp_gap_filler import IntertieLMPGapFiller
-    from genmix_gap_filler import GenMixGapFiller
-    from demand_gap_filler import DemandGapFiller
-    from demandzone_gap_filler import DemandZoneGapFiller
+    from ieso_scraper.datasets import DATASETS
+    importlib.import_module("ieso_scraper.gap_filler")
     print("✅ All scraper modules imported successfully!")
 except ImportError as e:
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
+def example_filename(dataset: str, when: datetime) -> str:
+    """Filename the dataset's pattern expects for a delivery hour or year"""
+    spec = DATASETS[dataset]
+    stamp = when.strftime('%Y%m%d%H') if spec['granularity'] == 'hourly' else when.strftime('%Y')
+    report, extension = re.match(r'^\^(PUB_[A-Za-z]+_)\\d\{\d+\}.*\\\.(\w+)\$$', spec['pattern']).groups()
+    return f"{report}{stamp}.{extension}"
+
 def test_scrapers():
     """Test each scraper with recent dates"""
     print("\n🧪 Testing IESO Data Scrapers")
     print("=" * 50)
-    
+
     # Test dates - try last few days
-    test_dates = []
-    for i in range(1, 4):  # Test last 3 days
-        test_date = datetime.now() - timedelta(days=i)
-        test_dates.append(test_date.strftime('%Y%m%d'))
-    
-    print(f"Testing with dates: {test_dates}")
-    
-    # Test EnergyLMP (hourly data)
-    print("\n📊 Testing EnergyLMP Scraper...")
-    try:
-        energy_scraper = EnergyLMPGapFiller()
-        for date in test_dates:
-            print(f"  Checking EnergyLMP for {date}...")
-            # Check if data exists for this date
-            url = f"http://reports.ieso.ca/public/PUB_PricesPubLMP_{date}.xml"
-            print(f"    URL: {url}")
-            # Note: We're not actually downloading in test mode
-        print("  ✅ EnergyLMP scraper initialized successfully")
-    except Exception as e:
-        print(f"  ❌ EnergyLMP error: {e}")
-    
-    # Test IntertieLMP (hourly data)
-    print("\n🔗 Testing IntertieLMP Scraper...")
-    try:
-        intertie_scraper = IntertieLMPGapFiller()
-        for date in test_dates:
-            print(f"  Checking IntertieLMP for {date}...")
-            url = f"http://reports.ieso.ca/public/PUB_PricesIntertieLMP_{date}.xml"
-            print(f"    URL: {url}")
-        print("  ✅ IntertieLMP scraper initialized successfully")
-    except Exception as e:
-        print(f"  ❌ IntertieLMP error: {e}")
-    
-    # Test GenMix (annual data)
-    print("\n⚡ Testing GenMix Scraper...")
-    try:
-        genmix_scraper = GenMixGapFiller()
-        current_year = datetime.now().year
-        print(f"  Checking GenMix for year {current_year}...")
-        url = f"http://reports.ieso.ca/public/GenOutputCapability/PUB_GenOutputCapability_{current_year}.xml"
-        print(f"    URL: {url}")
-        print("  ✅ GenMix scraper initialized successfully")
-    except Exception as e:
-        print(f"  ❌ GenMix error: {e}")
-    
-    # Test Demand (annual data)
-    print("\n📈 Testing Demand Scraper...")
-    try:
-        demand_scraper = DemandGapFiller()
-        current_year = datetime.now().year
-        print(f"  Checking Demand for year {current_year}...")
-        url = f"http://reports.ieso.ca/public/Demand/PUB_Demand_{current_year}.csv"
-        print(f"    URL: {url}")
-        print("  ✅ Demand scraper initialized successfully")
-    except Exception as e:
-        print(f"  ❌ Demand error: {e}")
-    
-    # Test DemandZone (annual data)
-    print("\n🗺️ Testing DemandZone Scraper...")
-    try:
-        demandzone_scraper = DemandZoneGapFiller()
-        current_year = datetime.now().year
-        print(f"  Checking DemandZone for year {current_year}...")
-        url = f"http://reports.ieso.ca/public/DemandZonal/PUB_DemandZonal_{current_year}.csv"
-        print(f"    URL: {url}")
-        print("  ✅ DemandZone scraper initialized successfully")
-    except Exception as e:
-        print(f"  ❌ DemandZone error: {e}")
-    
+    test_dates = [datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(days=i)
+                  for i in range(1, 4)]
+    print(f"Testing with dates: {[d.strftime('%Y%m%d') for d in test_dates]}")
+
+    for dataset, spec in sorted(DATASETS.items(), key=lambda item: item[1]['priority']):
+        print(f"\n📊 Testing {dataset} Scraper ({spec['description']})...")
+        try:
+            when = test_dates if spec['granularity'] == 'hourly' else [datetime.now()]
+            for date in when:
+                filename = example_filename(dataset, date)
+                assert re.match(spec['pattern'], filename), filename
+                # Note: We're not actually downloading in test mode
+                print(f"    URL: {spec['url']}{filename}")
+            print(f"  ✅ {dataset} scraper configured successfully")
+        except Exception as e:
+            print(f"  ❌ {dataset} error: {e}")
+            raise
+
     print("\n" + "=" * 50)
     print("🎯 Test Summary:")
     print("- All scraper modules can be imported")
-    print("- Scrapers can be initialized")
+    print("- Every dataset spec matches its own filenames")
     print("- URLs are properly formatted")
     print("- Ready for actual data collection!")
-    
+
     print("\n💡 Note: This is a dry run test.")
     print("   Actual data collection requires Azure storage credentials.")
     print("   The Azure Function will handle real data collection automatically.")
 
 if __name__ == "__main__":
-    test_scrapers() 
\ No newline at end of file
+    test_scrapers()